@@ -38,13 +38,14 @@ from enum import auto
 from types import SimpleNamespace
 from typing import Any, Callable, Dict, List, Union, cast
 
+import cocotb._hierarchy_cache
 import cocotb._profiling
 import cocotb.handle
 import cocotb.task
 import cocotb.triggers
 from cocotb._scheduler import Scheduler
 from cocotb._utils import DocEnum
-from cocotb.logging import default_config
+from cocotb.logging import _clear_sim_time_cache, default_config
 from cocotb.regression import RegressionManager, RegressionMode
 from cocotb.result import TestSuccess
 
@@ -126,13 +127,19 @@ sim_phase: SimPhase = SimPhase.NORMAL
 
 
 def _setup_logging() -> None:
+    from cocotb.logging import (
+        _filter_from_c,
+        _flush_log,
+        _log_from_c,
+    )
+
     default_config()
     global log
     log = py_logging.getLogger(__name__)
     import cocotb.simulator
-    from cocotb.logging import _filter_from_c, _log_from_c
 
     cocotb.simulator.initialize_logger(_log_from_c, _filter_from_c)
+    _register_shutdown_callback(_flush_log)
 
 
 def _task_done_callback(task: "cocotb.task.Task[Any]") -> None:
@@ -293,6 +300,7 @@ def _initialise_testbench(argv_: List[str]) -> None:
     _process_plusargs()
     _process_packages()
     _setup_random_seed()
+    _setup_hierarchy_cache()
     _setup_root_handle()
     _start_user_coverage()
     _setup_regression_manager()
@@ -307,6 +315,7 @@ def _initialise_testbench(argv_: List[str]) -> None:
 
 def _sim_event(msg: str) -> None:
     """Function that can be called externally to signal an event."""
+    _clear_sim_time_cache()
     # We simply return here as the simulator will exit
     # so no cleanup is needed
     if regression_manager is not None:
@@ -444,6 +453,23 @@ def _setup_random_seed() -> None:
     random.seed(_random_seed)
 
 
+def _setup_hierarchy_cache() -> None:
+    cache_file = os.getenv("COCOTB_HIERARCHY_CACHE", "").strip()
+    if not cache_file:
+        return
+
+    # the index is only valid for the same design built the same way
+    key = {
+        "simulator": SIM_NAME,
+        "simulator_version": SIM_VERSION,
+        "toplevel": os.getenv("COCOTB_TOPLEVEL", "").strip(),
+        "build": os.getenv("COCOTB_HIERARCHY_CACHE_KEY", ""),
+    }
+    cache = cocotb._hierarchy_cache._HierarchyCache(cache_file, key)
+    cocotb.handle._hierarchy_cache = cache
+    _register_shutdown_callback(cache.save)
+
+
 def _setup_root_handle() -> None:
     root_name = os.getenv("COCOTB_TOPLEVEL")
     if root_name is not None:
@@ -494,3 +520,19 @@ def _setup_regression_manager() -> None:
     elif test_filter_str:
         regression_manager.add_filters(test_filter_str)
         regression_manager.set_mode(RegressionMode.TESTCASE)
+
+    # split tests between simulator processes
+    shard_str = os.getenv("COCOTB_TEST_SHARD", "").strip()
+    if shard_str:
+        try:
+            index_str, count_str = shard_str.split("/")
+            regression_manager.set_shard(int(index_str), int(count_str))
+        except ValueError:
+            raise RuntimeError(
+                f"COCOTB_TEST_SHARD must be of the form <index>/<count>, got {shard_str!r}"
+            ) from None
+
+    # schedule tests based on their durations in previous runs
+    durations_file = os.getenv("COCOTB_TEST_DURATIONS", "").strip()
+    if durations_file:
+        regression_manager.set_test_durations(durations_file)
@@ -0,0 +1,75 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""On-disk index of the simulation object hierarchy, shared between runs."""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from cocotb import _json_file
+
+_Key = Union[str, int]
+
+_VERSION = 2
+
+
+class _HierarchyCache:
+    """Index of the children of hierarchical simulation objects, saved to *filename*.
+
+    For each hierarchical object, by path, the index holds the keys of the children found by iterating it,
+    and the keys which were looked up and not found.
+    The child objects themselves still have to be got from the simulator.
+    The index is only loaded from *filename* if it was saved with the same *key*,
+    which must change whenever the design is rebuilt.
+    """
+
+    def __init__(self, filename: str, key: Dict[str, str]) -> None:
+        self.filename = filename
+        self.key = key
+        self._children: Dict[str, List[_Key]] = {}
+        self._missing: Dict[str, Set[_Key]] = {}
+        self._modified = False
+
+        self._merge(_json_file.load(self.filename, _VERSION, self.key))
+
+    def _merge(self, data: Optional[Dict[str, Any]]) -> None:
+        if data is None:
+            return
+        for path, entry in data["scopes"].items():
+            if "children" in entry and path not in self._children:
+                self._children[path] = entry["children"]
+            if "missing" in entry:
+                self._missing.setdefault(path, set()).update(entry["missing"])
+
+    def children(self, path: str) -> Optional[List[_Key]]:
+        """Return the keys of the children of the object at *path*, if known."""
+        return self._children.get(path)
+
+    def set_children(self, path: str, children: Iterable[_Key]) -> None:
+        self._children[path] = list(children)
+        self._modified = True
+
+    def is_missing(self, path: str, key: _Key) -> bool:
+        """Return ``True`` if *key* is known not to be a child of the object at *path*."""
+        missing = self._missing.get(path)
+        return missing is not None and key in missing
+
+    def add_missing(self, path: str, key: _Key) -> None:
+        self._missing.setdefault(path, set()).add(key)
+        self._modified = True
+
+    def save(self) -> None:
+        """Save the index, merged with the one saved in the meantime by other runs."""
+        if not self._modified:
+            return
+
+        def merge(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            self._merge(data)
+            scopes: Dict[str, Dict[str, List[_Key]]] = {}
+            for path, children in self._children.items():
+                scopes[path] = {"children": children}
+            for path, missing in self._missing.items():
+                scopes.setdefault(path, {})["missing"] = sorted(missing, key=str)
+            return {"scopes": scopes}
+
+        _json_file.update(self.filename, _VERSION, merge, self.key)
+        self._modified = False
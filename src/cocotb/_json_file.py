@@ -0,0 +1,46 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Versioned JSON files shared between concurrent runs."""
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+
+def load(filename: str, version: int, key: Any = None) -> Optional[Dict[str, Any]]:
+    """Return the contents of *filename*.
+
+    Returns ``None`` if the file doesn't exist or can't be parsed,
+    or if it wasn't saved with the same *version* and *key*.
+    """
+    try:
+        with open(filename, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != version or data.get("key") != key:
+        return None
+    return data
+
+
+def update(
+    filename: str,
+    version: int,
+    merge: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]],
+    key: Any = None,
+) -> None:
+    """Save the contents returned by *merge* to *filename*.
+
+    *merge* is called with the contents saved in the meantime by other runs, as returned by :func:`load`.
+    The file is replaced in one step, so other runs never read a partially written file.
+    """
+    data = merge(load(filename, version, key))
+    data["version"] = version
+    if key is not None:
+        data["key"] = key
+
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_filename, filename)
@@ -5,14 +5,84 @@
 
 # Debug mode controlled by environment variables
 import cProfile
+import json
 import os
 import pstats
+from collections import Counter
 from contextlib import AbstractContextManager
+from typing import Any, Dict, Optional
 
 from cocotb._py_compat import nullcontext
 
 profiling_context: AbstractContextManager
 
+
+class SchedulerStats:
+    """Counters collected by the scheduler when :envvar:`COCOTB_SCHEDULER_STATS` is set.
+
+    Only cheap counting and timing is done while the simulation runs,
+    the report is assembled in :meth:`to_dict`.
+    """
+
+    def __init__(self) -> None:
+        #: Number of times a trigger fired, by trigger type
+        self.trigger_fires: Counter[str] = Counter()
+        #: Number of times a task was resumed, by task kind and coroutine
+        self.task_resumes: Counter[str] = Counter()
+        #: Time spent resuming tasks in nanoseconds, by task kind and coroutine
+        self.task_time_ns: Counter[str] = Counter()
+        #: Number of GPI callbacks primed, by trigger type
+        self.gpi_primed: Counter[str] = Counter()
+        #: Number of GPI callbacks unprimed before firing, by trigger type
+        self.gpi_unprimed: Counter[str] = Counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        tasks = {
+            key: {
+                "resumes": self.task_resumes[key],
+                "time_ns": self.task_time_ns[key],
+            }
+            for key, _ in self.task_time_ns.most_common()
+        }
+        return {
+            "trigger_fires": dict(self.trigger_fires.most_common()),
+            "tasks": tasks,
+            "gpi_callbacks": {
+                "primed": dict(self.gpi_primed.most_common()),
+                "unprimed": dict(self.gpi_unprimed.most_common()),
+                "total_primed": sum(self.gpi_primed.values()),
+                "total_unprimed": sum(self.gpi_unprimed.values()),
+            },
+        }
+
+    def folded_stacks(self) -> str:
+        """Task times in the folded stack format read by flamegraph tools.
+
+        Times are reported in microseconds.
+        """
+        return "".join(
+            f"cocotb;{key} {time_ns // 1000}\n"
+            for key, time_ns in self.task_time_ns.most_common()
+        )
+
+
+_scheduler_stats_file = os.environ.get("COCOTB_SCHEDULER_STATS")
+
+#: The statistics collected by the scheduler, or ``None`` if disabled
+scheduler_stats: Optional[SchedulerStats] = (
+    SchedulerStats() if _scheduler_stats_file else None
+)
+
+
+def _write_scheduler_stats() -> None:
+    if scheduler_stats is None or _scheduler_stats_file is None:
+        return
+    with open(_scheduler_stats_file, "w") as f:
+        json.dump(scheduler_stats.to_dict(), f, indent=2)
+    with open(_scheduler_stats_file + ".folded", "w") as f:
+        f.write(scheduler_stats.folded_stacks())
+
+
 if "COCOTB_ENABLE_PROFILING" in os.environ:
     _profile: cProfile.Profile
 
@@ -23,6 +93,7 @@ if "COCOTB_ENABLE_PROFILING" in os.environ:
     def finalize() -> None:
         ps = pstats.Stats(_profile).sort_stats("cumulative")
         ps.dump_stats("cocotb.pstat")
+        _write_scheduler_stats()
 
     class _profiling_context:
         """Context manager that profiles its contents"""
@@ -41,6 +112,6 @@ else:
         pass
 
     def finalize() -> None:
-        pass
+        _write_scheduler_stats()
 
     profiling_context = nullcontext()
@@ -65,6 +65,16 @@ else:
     insertion_ordered_dict = collections.OrderedDict
 
 
+# backport of Python 3.7's time.perf_counter_ns, with float precision
+if sys.version_info >= (3, 7):  # noqa: UP036 | bug in ruff
+    from time import perf_counter_ns
+else:
+    from time import perf_counter
+
+    def perf_counter_ns() -> int:
+        return int(perf_counter() * 1e9)
+
+
 # simple, but less than optimal backport of Python 3.8's cached_property
 if sys.version_info >= (3, 8):
     from functools import cached_property
@@ -37,14 +37,15 @@ the ReadOnly (and this is invalid, at least in Modelsim).
 import logging
 import os
 import threading
-from collections import OrderedDict
-from typing import Any, Callable, Dict
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
 
 import cocotb
 import cocotb._write_scheduler
 from cocotb import _outcomes, _py_compat
 from cocotb._exceptions import InternalError
-from cocotb._profiling import profiling_context
+from cocotb._profiling import profiling_context, scheduler_stats
+from cocotb.logging import _clear_sim_time_cache, _flush_log
 from cocotb.task import Task
 from cocotb.triggers import (
     Event,
@@ -53,12 +54,22 @@ from cocotb.triggers import (
     ReadOnly,
     ReadWrite,
     Trigger,
+    _TriggerGroup,
 )
 
 # Sadly the Python standard logging module is very slow so it's better not to
 # make any calls by testing a boolean flag first
 _debug = "COCOTB_SCHEDULER_DEBUG" in os.environ
 
+# Same for the statistics, which are only collected if COCOTB_SCHEDULER_STATS is set
+_stats = scheduler_stats
+
+
+def _task_stats_key(task: Task[Any]) -> str:
+    coro = task._coro
+    coro_name = getattr(coro, "__qualname__", type(coro).__qualname__)
+    return f"{type(task)._name};{coro_name}"
+
 
 class external_state:
     INIT = 0
@@ -157,6 +168,8 @@ class Scheduler:
         so as to wake up Tasks waiting for that Trigger to `fire` (when the event encoded by the Trigger occurs).
         This is accomplished by :meth:`_resume_task_upon`.
         :meth:`_resume_task_upon` also associates the Trigger with the Task waiting on it to fire by adding them to the :attr:`_trigger2tasks` map.
+        The Tasks waiting on a Trigger are kept in an insertion-ordered dict used as an ordered set,
+        so adding and removing a waiter is O(1) no matter how many Tasks wait on the same Trigger.
         If, instead of reaching an ``await``, a Task finishes, :meth:`_schedule` will cause the :class:`~cocotb.triggers.Join` trigger to fire.
         Once a Trigger fires it calls the react function which queues all Tasks waiting for that Trigger to fire.
         Then the process repeats.
@@ -222,14 +235,21 @@ class Scheduler:
             self.log.setLevel(logging.DEBUG)
 
         # A dictionary of pending tasks for each trigger,
-        # indexed by trigger
-        self._trigger2tasks: Dict[Trigger, list[Task]] = (
+        # indexed by trigger. The values are dicts used as ordered sets.
+        self._trigger2tasks: Dict[Trigger, Dict[Task[Any], None]] = (
             _py_compat.insertion_ordered_dict()
         )
 
-        self._scheduled_tasks: OrderedDict[Task[Any], _outcomes.Outcome] = OrderedDict()
+        # Tasks ready to run, in the order they were scheduled. Unscheduled
+        # tasks are removed from _scheduled_tasks only, and their stale entries
+        # are skipped when they reach the front of the _ready_queue.
+        self._ready_queue: Deque[Tuple[Task[Any], _outcomes.Outcome[Any]]] = deque()
+        self._scheduled_tasks: Dict[
+            Task[Any], Tuple[Task[Any], _outcomes.Outcome[Any]]
+        ] = {}
         self._pending_threads = []
-        self._pending_events = []  # Events we need to call set on once we've unwound
+        # Events we need to call set on once we've unwound
+        self._pending_events: Deque[Event] = deque()
 
         self._terminate = False
         self._main_thread = threading.current_thread()
@@ -261,12 +281,17 @@ class Scheduler:
         and start the unstarted event loop.
         """
         with profiling_context:
+            # the simulator time may have changed since the last entry
+            _clear_sim_time_cache()
+
             # TODO: move state tracking to global variable
             # and handle this via some kind of trigger-specific Python callback
             if trigger is self._read_write:
                 cocotb.sim_phase = cocotb.SimPhase.READ_WRITE
             elif trigger is self._read_only:
                 cocotb.sim_phase = cocotb.SimPhase.READ_ONLY
+                # nothing more is logged in this time step by the simulator
+                _flush_log()
             else:
                 cocotb.sim_phase = cocotb.SimPhase.NORMAL
 
@@ -284,11 +309,17 @@ class Scheduler:
         """
         if _debug:
             self.log.debug(f"Trigger fired: {trigger}")
+        if _stats is not None:
+            _stats.trigger_fires[type(trigger).__qualname__] += 1
 
         # find all tasks waiting on trigger that fired
         try:
             scheduling = self._trigger2tasks.pop(trigger)
         except KeyError:
+            if trigger is self._read_write:
+                # primed only to apply the scheduled writes
+                trigger._cleanup()
+                return
             # GPI triggers should only be ever pending if there is an
             # associated task waiting on that trigger, otherwise it would
             # have been unprimed already
@@ -312,6 +343,10 @@ class Scheduler:
 
         # queue all tasks to wake up
         for task in scheduling:
+            waiting = task._trigger
+            if type(waiting) is _TriggerGroup:
+                self._react_group(task, waiting, trigger)
+                continue
             # unset trigger
             task._trigger = None
             self._schedule_task(task)
@@ -319,6 +354,21 @@ class Scheduler:
         # cleanup trigger
         trigger._cleanup()
 
+    def _react_group(
+        self, task: Task[Any], group: _TriggerGroup, trigger: Trigger
+    ) -> None:
+        """Called when *trigger* of the *group* *task* is waiting on fires."""
+        del group._remaining[trigger]
+        if group._wait_all:
+            if group._remaining:
+                return
+        else:
+            for other in group._remaining:
+                self._remove_waiter(task, other)
+            group._remaining.clear()
+        task._trigger = None
+        self._schedule_task(task, _outcomes.Value(trigger))
+
     def _event_loop(self) -> None:
         """Run the main event loop.
 
@@ -327,12 +377,26 @@ class Scheduler:
         * A GPI trigger
         """
 
-        while self._scheduled_tasks and not self._terminate:
-            task, outcome = self._scheduled_tasks.popitem(last=False)
+        ready_queue = self._ready_queue
+        scheduled_tasks = self._scheduled_tasks
+        while scheduled_tasks and not self._terminate:
+            entry = ready_queue.popleft()
+            task, outcome = entry
+            if scheduled_tasks.get(task) is not entry:
+                # stale entry of a task that was unscheduled or rescheduled
+                continue
+            del scheduled_tasks[task]
 
             if _debug:
                 self.log.debug(f"Scheduling task {task}")
-            self._resume_task(task, outcome)
+            if _stats is None:
+                self._resume_task(task, outcome)
+            else:
+                start = _py_compat.perf_counter_ns()
+                self._resume_task(task, outcome)
+                key = _task_stats_key(task)
+                _stats.task_time_ns[key] += _py_compat.perf_counter_ns() - start
+                _stats.task_resumes[key] += 1
             if _debug:
                 self.log.debug(f"Scheduled task {task}")
 
@@ -347,7 +411,7 @@ class Scheduler:
                     self.log.debug(
                         f"Scheduling pending event {self._pending_events[0]}"
                     )
-                self._pending_events.pop(0).set()
+                self._pending_events.popleft().set()
 
         # no more pending tasks
         if self._terminate:
@@ -364,19 +428,18 @@ class Scheduler:
           * forcefully ends the Test if a Task ends with an exception.
         """
 
-        # remove task from queue
-        if task in self._scheduled_tasks:
-            self._scheduled_tasks.pop(task)
+        # remove task from queue, the stale ready queue entry is skipped later
+        self._scheduled_tasks.pop(task, None)
 
-        # Unprime the trigger this task is waiting on
+        # Unprime the trigger(s) this task is waiting on
         trigger = task._trigger
         if trigger is not None:
             task._trigger = None
-            if task in self._trigger2tasks.setdefault(trigger, []):
-                self._trigger2tasks[trigger].remove(task)
-            if not self._trigger2tasks[trigger]:
-                trigger._unprime()
-                del self._trigger2tasks[trigger]
+            if type(trigger) is _TriggerGroup:
+                for other in trigger._remaining:
+                    self._remove_waiter(task, other)
+            else:
+                self._remove_waiter(task, trigger)
 
         if self._terminate:
             return
@@ -384,17 +447,36 @@ class Scheduler:
         elif task.complete in self._trigger2tasks:
             self._react(task.complete)
 
-    def _schedule_task_upon(self, task: Task[Any], trigger: Trigger) -> None:
-        """Schedule `task` to be resumed when `trigger` fires."""
-        # TODO Move this all into Task
-        task._trigger = trigger
-        task._state = Task._State.PENDING
+    def _remove_waiter(self, task: Task[Any], trigger: Trigger) -> None:
+        """Stop *task* waiting on *trigger*, unpriming *trigger* if no tasks are left waiting on it."""
+        trigger_tasks = self._trigger2tasks.get(trigger)
+        if trigger_tasks is None:
+            return
+        trigger_tasks.pop(task, None)
+        if not trigger_tasks:
+            del self._trigger2tasks[trigger]
+            if trigger is self._read_write and cocotb._write_scheduler._writes_pending:
+                # still needed to apply the scheduled writes
+                return
+            trigger._unprime()
+            if _stats is not None and isinstance(trigger, GPITrigger):
+                _stats.gpi_unprimed[type(trigger).__qualname__] += 1
 
-        trigger_tasks = self._trigger2tasks.setdefault(trigger, [])
-        trigger_tasks.append(task)
+    def _add_waiter(self, task: Task[Any], trigger: Trigger) -> Optional[Exception]:
+        """Make *task* wait on *trigger*, priming *trigger* if needed.
+
+        Returns:
+            The exception raised when priming *trigger*, if any.
+        """
+        trigger_tasks = self._trigger2tasks.get(trigger)
+        if trigger_tasks is None:
+            trigger_tasks = self._trigger2tasks[trigger] = (
+                _py_compat.insertion_ordered_dict()
+            )
+        trigger_tasks[task] = None
 
         if not trigger._primed:
-            if trigger_tasks != [task]:
+            if len(trigger_tasks) != 1:
                 # should never happen
                 raise InternalError("More than one task waiting on an unprimed trigger")
 
@@ -403,14 +485,51 @@ class Scheduler:
                 # we don't have to do a type check here.
                 if isinstance(trigger, GPITrigger):
                     trigger._prime(self._sim_react)
+                    if _stats is not None:
+                        _stats.gpi_primed[type(trigger).__qualname__] += 1
                 else:
                     trigger._prime(self._react)
             except Exception as e:
                 # discard the trigger we associated, it will never fire
                 self._trigger2tasks.pop(trigger)
+                return e
+        return None
+
+    def _prime_read_write(self) -> None:
+        """Prime the ReadWrite trigger, whether or not any tasks are waiting on it, to apply the scheduled writes."""
+        if not self._read_write._primed:
+            self._read_write._prime(self._sim_react)
+            if _stats is not None:
+                _stats.gpi_primed[type(self._read_write).__qualname__] += 1
+
+    def _schedule_task_upon(self, task: Task[Any], trigger: Trigger) -> None:
+        """Schedule `task` to be resumed when `trigger` fires."""
+        # TODO Move this all into Task
+        task._trigger = trigger
+        task._state = Task._State.PENDING
 
-                # replace it with a new trigger that throws back the exception
-                self._schedule_task(task, outcome=_outcomes.Error(e))
+        exc = self._add_waiter(task, trigger)
+        if exc is not None:
+            # replace it with a new trigger that throws back the exception
+            self._schedule_task(task, outcome=_outcomes.Error(exc))
+
+    def _schedule_task_upon_group(self, task: Task[Any], group: _TriggerGroup) -> None:
+        """Schedule `task` to be resumed when the first or all triggers of `group` fire."""
+        task._trigger = group
+        task._state = Task._State.PENDING
+
+        for trigger in list(group._remaining):
+            exc = self._add_waiter(task, trigger)
+            if exc is not None:
+                # stop waiting on the other triggers and throw back the exception
+                task._trigger = None
+                for other in group._remaining:
+                    self._remove_waiter(task, other)
+                self._schedule_task(task, outcome=_outcomes.Error(exc))
+                return
+            if task._trigger is not group:
+                # a trigger fired while being primed, and woke the task
+                return
 
     def _schedule_task(
         self, task: Task[Any], outcome: _outcomes.Outcome[Any] = _none_outcome
@@ -424,7 +543,9 @@ class Scheduler:
             raise InternalError("Task was queued more than once.")
         # TODO Move state tracking into Task
         task._state = Task._State.SCHEDULED
-        self._scheduled_tasks[task] = outcome
+        entry = (task, outcome)
+        self._scheduled_tasks[task] = entry
+        self._ready_queue.append(entry)
 
     def _queue_function(self, task):
         """Queue a task for execution and move the containing thread
@@ -577,6 +698,9 @@ class Scheduler:
             if not task.done():
                 if _debug:
                     self.log.debug(f"{task!r} yielded {result} ({cocotb.sim_phase})")
+                if type(result) is _TriggerGroup:
+                    self._schedule_task_upon_group(task, result)
+                    return
                 try:
                     result = self._trigger_from_any(result)
                 except TypeError as exc:
@@ -627,12 +751,17 @@ class Scheduler:
             # the trigger should cause it to be unprimed in _unschedule
         assert not self._trigger2tasks
 
+        # the ReadWrite trigger may still be primed to apply the scheduled writes
+        self._read_write._unprime()
+
         # Kill any queued coroutines.
-        # We use a while loop because task.kill() calls _unschedule(), which will remove the task from _pending_tasks.
-        # If that happens a for loop will stop early and then the assert will fail.
-        while self._scheduled_tasks:
-            task, _ = self._scheduled_tasks.popitem(last=False)
-            task.kill()
+        # We use a while loop because task.kill() can schedule more tasks waiting on the killed task.
+        while self._ready_queue:
+            entry = self._ready_queue.popleft()
+            task, _ = entry
+            if self._scheduled_tasks.get(task) is entry:
+                del self._scheduled_tasks[task]
+                task.kill()
 
         if self._main_thread is not threading.current_thread():
             raise Exception("Cleanup() called outside of the main thread")
@@ -0,0 +1,86 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""On-disk history of the durations of tests, shared between runs."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from cocotb import _json_file
+
+_VERSION = 1
+
+# (wall time in seconds, simulation time in ns) of one run of a test
+_Duration = Tuple[float, float]
+
+
+class _TestDurations:
+    """History of the durations of tests, saved to *filename*.
+
+    For each test, by its full name, the wall clock and simulation times of its last *history* runs are kept.
+    """
+
+    def __init__(self, filename: str, history: int = 5) -> None:
+        self.filename = filename
+        self.history = history
+        self._durations = self._parse(_json_file.load(self.filename, _VERSION))
+        self._added: Dict[str, List[_Duration]] = {}
+
+    @staticmethod
+    def _parse(data: Optional[Dict[str, Any]]) -> Dict[str, List[_Duration]]:
+        if data is None:
+            return {}
+        return {
+            name: [(wall, sim) for wall, sim in runs]
+            for name, runs in data["tests"].items()
+        }
+
+    def wall_time(self, name: str) -> Optional[float]:
+        """Return the average wall clock time in seconds of the test *name* over its recorded runs, if any."""
+        runs = self._durations.get(name)
+        if not runs:
+            return None
+        return sum(wall for wall, _ in runs) / len(runs)
+
+    def add(self, name: str, wall_time_s: float, sim_time_ns: float) -> None:
+        """Record a run of the test *name*."""
+        self._added.setdefault(name, []).append((wall_time_s, sim_time_ns))
+        runs = self._durations.setdefault(name, [])
+        runs.append((wall_time_s, sim_time_ns))
+        del runs[: -self.history]
+
+    def save(self) -> None:
+        """Save the history, merged with the one saved in the meantime by other runs."""
+        if not self._added:
+            return
+
+        def merge(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            durations = self._parse(data)
+            for name, runs in self._added.items():
+                merged = durations.setdefault(name, [])
+                merged.extend(runs)
+                del merged[: -self.history]
+            self._durations = durations
+            return {
+                "tests": {
+                    name: [list(run) for run in runs]
+                    for name, runs in durations.items()
+                }
+            }
+
+        _json_file.update(self.filename, _VERSION, merge)
+        self._added = {}
+
+
+def _balance(durations: Sequence[float], count: int) -> List[int]:
+    """Assign each of the items with *durations* to one of *count* shards, evening out the total duration of the shards.
+
+    Each item in turn goes to the shard with the least total duration so far,
+    which balances the shards best when the items are given longest first.
+    """
+    loads = [0.0] * count
+    shards: List[int] = []
+    for duration in durations:
+        shard = min(range(count), key=loads.__getitem__)
+        loads[shard] += duration
+        shards.append(shard)
+    return shards
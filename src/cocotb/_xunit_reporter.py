@@ -25,29 +25,108 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
+import os
 import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import Element, SubElement
+from xml.sax.saxutils import quoteattr
 
 
 class XUnitReporter:
-    def __init__(self, filename="results.xml"):
+    """Write xUnit XML test results incrementally.
+
+    Elements are written to *filename* as they are completed rather than all at once at the end.
+    After each :meth:`flush` the file is a complete XML document:
+    the closing tags are written after the last element and overwritten by the next one,
+    so the results of the tests that completed are kept if the simulator dies.
+
+    If *jsonl_filename* is given, each element is also written as a JSON object on its own line,
+    holding the attributes of the element under its tag name, e.g.
+    ``{"testcase": {"name": ...}, "failure": {...}}``.
+
+    If *fsync* is ``True``, :meth:`flush` also forces the files to disk.
+    """
+
+    def __init__(self, filename="results.xml", jsonl_filename=None, fsync=False):
         self.results = Element("testsuites", name="results")
         self.filename = filename
+        self.fsync = fsync
+        self.last_testsuite = None
+        self.last_testcase = None
+        self._pending_testcase = None
+
+        self._file = open(filename, "wb")
+        self._file.write(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+        self._file.write(self._start_tag(self.results).encode() + b"\n")
+        self._footer = [b"</testsuites>\n"]
+
+        self._jsonl_file = None
+        if jsonl_filename is not None:
+            self._jsonl_file = open(jsonl_filename, "w", encoding="UTF-8")
+
+        self._checkpoint()
+
+    @staticmethod
+    def _start_tag(elem):
+        attrs = "".join(f" {k}={quoteattr(v)}" for k, v in elem.attrib.items())
+        return f"<{elem.tag}{attrs}>"
+
+    def _write_element(self, elem, level):
+        self.indent(elem, level)
+        elem.tail = "\n"
+        self._file.write(
+            (level * "  " + ET.tostring(elem, encoding="unicode")).encode()
+        )
+        if self._jsonl_file is not None:
+            record = {elem.tag: dict(elem.attrib)}
+            for sub_elem in elem:
+                record[sub_elem.tag] = dict(sub_elem.attrib)
+            self._jsonl_file.write(json.dumps(record) + "\n")
+
+    def _write_pending(self):
+        if self._pending_testcase is not None:
+            self._write_element(self._pending_testcase, 2)
+            self._pending_testcase = None
+
+    def _checkpoint(self):
+        # write the closing tags, then go back to overwrite them with the next element
+        pos = self._file.tell()
+        self._file.writelines(self._footer)
+        self._file.truncate()
+        self._file.flush()
+        self._file.seek(pos)
+        if self._jsonl_file is not None:
+            self._jsonl_file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+            if self._jsonl_file is not None:
+                os.fsync(self._jsonl_file.fileno())
 
     def add_testsuite(self, **kwargs):
+        self._write_pending()
+        if self.last_testsuite is not None:
+            self._file.write(self._footer.pop(0))
         self.last_testsuite = SubElement(self.results, "testsuite", **kwargs)
+        self._file.write(b"  " + self._start_tag(self.last_testsuite).encode() + b"\n")
+        self._footer.insert(0, b"  </testsuite>\n")
+        if self._jsonl_file is not None:
+            self._jsonl_file.write(json.dumps({"testsuite": kwargs}) + "\n")
         return self.last_testsuite
 
     def add_testcase(self, testsuite=None, **kwargs):
-        if testsuite is None:
-            testsuite = self.last_testsuite
-        self.last_testcase = SubElement(testsuite, "testcase", **kwargs)
+        if testsuite is not None and testsuite is not self.last_testsuite:
+            raise ValueError("Test cases can only be added to the last testsuite")
+        self._write_pending()
+        self.last_testcase = Element("testcase", **kwargs)
+        self._pending_testcase = self.last_testcase
         return self.last_testcase
 
     def add_property(self, testsuite=None, **kwargs):
-        if testsuite is None:
-            testsuite = self.last_testsuite
-        self.last_property = SubElement(testsuite, "property", **kwargs)
+        if testsuite is not None and testsuite is not self.last_testsuite:
+            raise ValueError("Properties can only be added to the last testsuite")
+        self._write_pending()
+        self.last_property = Element("property", **kwargs)
+        self._write_element(self.last_property, 2)
         return self.last_property
 
     def add_failure(self, testcase=None, **kwargs):
@@ -74,6 +153,14 @@ class XUnitReporter:
         elif level and (not elem.tail or not elem.tail.strip()):
             elem.tail = i
 
+    def flush(self):
+        """Write out the results added so far."""
+        self._write_pending()
+        self._checkpoint()
+
     def write(self):
-        self.indent(self.results)
-        ET.ElementTree(self.results).write(self.filename, encoding="UTF-8")
+        """Write out all the results and close the files."""
+        self.flush()
+        self._file.close()
+        if self._jsonl_file is not None:
+            self._jsonl_file.close()
@@ -31,18 +31,36 @@ import logging
 from decimal import Decimal
 from fractions import Fraction
 from logging import Logger
-from typing import Union
+from typing import Iterator, Optional, Union
 
+import cocotb
 from cocotb._py_compat import cached_property
 from cocotb._write_scheduler import trust_inertial
 from cocotb.handle import LogicObject
-from cocotb.simulator import clock_create
+from cocotb.simulator import GpiClock, clock_create
 from cocotb.triggers import Event, Timer
 from cocotb.utils import get_sim_steps, get_time_from_sim_steps
 
+_MASK64 = (1 << 64) - 1
+
+
+def _jitter_offsets(seed: int, jitter: int) -> Iterator[int]:
+    """Generate edge offsets in ``[-jitter, jitter]``.
+
+    Uses splitmix64 so the sequence matches the one generated by :class:`~cocotb.simulator.GpiClock`.
+    """
+    state = seed & _MASK64
+    while True:
+        state = (state + 0x9E3779B97F4A7C15) & _MASK64
+        z = state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        z ^= z >> 31
+        yield z % (2 * jitter + 1) - jitter
+
 
 class Clock:
-    r"""Simple 50:50 duty cycle clock driver.
+    r"""Clock driver with configurable duty cycle, phase, and jitter.
 
     Instances of this class should call its :meth:`start` method
     and pass the coroutine object to one of the functions in :ref:`task-management`.
@@ -72,48 +90,46 @@ class Clock:
 
             .. versionadded:: 2.0
 
+        duty_cycle: The fraction of the period the clock is high.
+
+            .. versionadded:: 2.0
+
+        phase: The delay, in *units*, before the clock starts toggling.
+
+            .. versionadded:: 2.0
+
+        jitter: The maximum amount, in *units*, each edge is moved from its ideal time.
+            Offsets are drawn uniformly from ``[-jitter, jitter]`` for each edge,
+            so the jitter does not accumulate and the average period is unchanged.
+
+            .. versionadded:: 2.0
+
+        seed: The seed for the jitter.
+            Defaults to the test's random seed (see :envvar:`COCOTB_RANDOM_SEED`),
+            so the jitter is reproducible.
+            Both implementations produce the same edges for the same seed.
+
+            .. versionadded:: 2.0
+
+    Raises:
+        ValueError: If *duty_cycle* is not between 0 and 1,
+            the high or low time would be less than one time step,
+            or *jitter* would allow two edges to cross.
+
     When *impl* is ``'auto'``, if :envvar:`COCOTB_TRUST_INERTIAL_WRITES` is defined,
     the :class:`~cocotb.simulator.GpiClock` implementation will be used.
     Otherwise, the Python coroutine implementation will be used.
     See the environment variable documentation for more information on the consequences
     of using the simulator's inertial write mechanism.
 
-    If you need more features like a phase shift and an asymmetric duty cycle,
-    it is simple to create your own clock generator (that you then :func:`~cocotb.start`):
-
-    .. code-block:: python
-
-        async def custom_clock():
-            # pre-construct triggers for performance
-            high_time = Timer(high_delay, units="ns")
-            low_time = Timer(low_delay, units="ns")
-            await Timer(initial_delay, units="ns")
-            while True:
-                dut.clk.value = 1
-                await high_time
-                dut.clk.value = 0
-                await low_time
-
-    If you also want to change the timing during simulation,
-    use this slightly more inefficient example instead where
-    the :class:`Timer`\ s inside the while loop are created with
-    current delay values:
+    The timing of a running clock can be changed with :meth:`set_period`.
 
     .. code-block:: python
 
-        async def custom_clock():
-            while True:
-                dut.clk.value = 1
-                await Timer(high_delay, units="ns")
-                dut.clk.value = 0
-                await Timer(low_delay, units="ns")
-
-
-        high_delay = low_delay = 100
-        await cocotb.start(custom_clock())
-        await Timer(1000, units="ns")
-        high_delay = low_delay = 10  # change the clock speed
+        c = Clock(dut.clk, 10, "ns", duty_cycle=0.25, phase=2, jitter=1)
+        await cocotb.start(c.start())
         await Timer(1000, units="ns")
+        c.set_period(20, "ns")  # change the clock speed
 
     .. versionchanged:: 1.5
         Support ``'step'`` as the *units* argument to mean "simulator time step".
@@ -128,10 +144,13 @@ class Clock:
         period: Union[float, Fraction, Decimal],
         units: str = "step",
         impl: str = "auto",
+        *,
+        duty_cycle: Union[float, Fraction, Decimal] = 0.5,
+        phase: Union[float, Fraction, Decimal] = 0,
+        jitter: Union[float, Fraction, Decimal] = 0,
+        seed: Optional[int] = None,
     ):
         self.signal = signal
-        self.period = get_sim_steps(period, units)
-        self.frequency = 1 / get_time_from_sim_steps(self.period, units="us")
         valid_impls = ["auto", "gpi", "py"]
         if impl not in valid_impls:
             valid_impls_str = ", ".join([repr(i) for i in valid_impls])
@@ -141,6 +160,58 @@ class Clock:
         if impl == "auto":
             impl = "gpi" if trust_inertial else "py"
         self.impl = impl
+        self._phase = get_sim_steps(phase, units) if phase else 0
+        self._jitter = get_sim_steps(jitter, units) if jitter else 0
+        self._seed = seed
+        self._clkobj: Optional[GpiClock] = None
+        self._retime(get_sim_steps(period, units), duty_cycle)
+
+    def _retime(self, period: int, duty_cycle: Union[float, Fraction, Decimal]) -> None:
+        if not 0 < duty_cycle < 1:
+            raise ValueError(f"Duty cycle must be between 0 and 1, not {duty_cycle!r}")
+        t_high = int(period * Fraction(duty_cycle).limit_denominator())
+        if t_high < 1 or period - t_high < 1:
+            raise ValueError(
+                f"Clock period of {period} steps is too short for a duty cycle of {duty_cycle!r}"
+            )
+        # Edges must stay at least one step apart and in order.
+        if self._jitter and self._jitter > (min(t_high, period - t_high) - 1) // 2:
+            raise ValueError(
+                f"Jitter of {self._jitter} steps is too large for a high time of {t_high} steps "
+                f"and a low time of {period - t_high} steps"
+            )
+        self.period = period
+        self.frequency = 1 / get_time_from_sim_steps(self.period, units="us")
+        self._duty_cycle = duty_cycle
+        self._t_high = t_high
+        self._timer_high = Timer(t_high)
+        self._timer_low = Timer(period - t_high)
+
+    def set_period(
+        self,
+        period: Union[float, Fraction, Decimal],
+        units: str = "step",
+        duty_cycle: Optional[Union[float, Fraction, Decimal]] = None,
+    ) -> None:
+        """Change the period, and optionally the duty cycle, of the clock.
+
+        If the clock is running, the new timing takes effect from the next edge.
+
+        Args:
+            period: The new clock period.
+            units: The units of *period*, as for the constructor.
+            duty_cycle: The new duty cycle. Defaults to keeping the current duty cycle.
+
+        Raises:
+            ValueError: If the new timing is invalid.
+
+        .. versionadded:: 2.0
+        """
+        if duty_cycle is None:
+            duty_cycle = self._duty_cycle
+        self._retime(get_sim_steps(period, units), duty_cycle)
+        if self._clkobj is not None:
+            self._clkobj.set_period(self.period, self._t_high)
 
     async def start(self, start_high: bool = True) -> None:
         r"""Clocking coroutine.  Start driving your clock by :func:`cocotb.start`\ ing a
@@ -158,11 +229,19 @@ class Clock:
             Use ``kill()`` on the clock task instead, or implement manually.
         """
 
-        t_high = self.period // 2
+        seed = cocotb._random_seed if self._seed is None else self._seed
 
         if self.impl == "gpi":
             clkobj = clock_create(self.signal._handle)
-            clkobj.start(self.period, t_high, start_high)
+            clkobj.start(
+                self.period,
+                self._t_high,
+                start_high,
+                self._phase,
+                self._jitter,
+                seed & _MASK64,
+            )
+            self._clkobj = clkobj
 
             try:
                 # The clock is meant to toggle forever, so awaiting this should
@@ -171,18 +250,30 @@ class Clock:
                 e = Event()
                 await e.wait()
             finally:
+                self._clkobj = None
                 clkobj.stop()
         else:
-            timer_high = Timer(t_high)
-            timer_low = Timer(self.period - t_high)
-            if start_high:
-                self.signal.set(1)
-                await timer_high
+            if self._phase:
+                await Timer(self._phase)
+            high = start_high
+            if not self._jitter:
+                while True:
+                    if high:
+                        self.signal.set(1)
+                        await self._timer_high
+                    else:
+                        self.signal.set(0)
+                        await self._timer_low
+                    high = not high
+            offsets = _jitter_offsets(seed, self._jitter)
+            last_offset = 0
             while True:
-                self.signal.set(0)
-                await timer_low
-                self.signal.set(1)
-                await timer_high
+                self.signal.set(1 if high else 0)
+                offset = next(offsets)
+                t_ideal = self._t_high if high else self.period - self._t_high
+                await Timer(t_ideal + offset - last_offset)
+                last_offset = offset
+                high = not high
 
     def __str__(self) -> str:
         return type(self).__qualname__ + f"({self.frequency:3.1f} MHz)"
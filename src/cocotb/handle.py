@@ -27,6 +27,8 @@
 
 import enum
 import logging
+import mmap
+import os
 import re
 from abc import ABC, abstractmethod
 from functools import lru_cache
@@ -38,9 +40,11 @@ from typing import (
     Generic,
     Iterable,
     Iterator,
+    List,
     NoReturn,
     Optional,
     Sequence,
+    Sized,
     Tuple,
     Type,
     TypeVar,
@@ -50,10 +54,14 @@ from typing import (
 
 from cocotb import simulator
 from cocotb._deprecation import deprecated
+from cocotb._hierarchy_cache import _HierarchyCache
 from cocotb._py_compat import cached_property
 from cocotb._utils import cached_method
 from cocotb.types import Array, Logic, LogicArray, Range
 
+# Index of the hierarchy saved between runs, see COCOTB_HIERARCHY_CACHE
+_hierarchy_cache: Optional[_HierarchyCache] = None
+
 
 def _write_now(
     _: "ValueObjectBase[Any, Any]", f: Callable[..., None], args: Any
@@ -241,6 +249,10 @@ class HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
 
         :meta public:
         """
+        if not self._discovered and _hierarchy_cache is not None:
+            children = _hierarchy_cache.children(self._path)
+            if children is not None:
+                return cast(Iterable[KeyType], children)
         self._discover_all()
         return self._sub_handles.keys()
 
@@ -297,6 +309,11 @@ class HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
             # add to cache
             self._sub_handles[key] = hdl
 
+        if _hierarchy_cache is not None:
+            _hierarchy_cache.set_children(
+                self._path, cast(Iterable[Union[str, int]], self._sub_handles.keys())
+            )
+
         self._discovered = True
 
     def __getitem__(self, key: KeyType) -> SimHandleBase:
@@ -306,9 +323,17 @@ class HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
         except KeyError:
             pass
 
+        # skip the GPI if the object was not found in a previous run
+        if _hierarchy_cache is not None and _hierarchy_cache.is_missing(
+            self._path, cast(Union[str, int], key)
+        ):
+            raise KeyError(f"{self._path} contains no child object named {key}")
+
         # try to get value from GPI
         new_handle = self._get_handle_by_key(key)
         if not new_handle:
+            if _hierarchy_cache is not None:
+                _hierarchy_cache.add_missing(self._path, cast(Union[str, int], key))
             raise KeyError(f"{self._path} contains no child object named {key}")
 
         # if successful, construct and cache
@@ -357,12 +382,10 @@ class HierarchyObjectBase(SimHandleBase, Generic[KeyType]):
         return iter(self._values())
 
     def __len__(self) -> int:
-        self._discover_all()
-        return len(self._sub_handles)
+        return len(cast(Sized, self._keys()))
 
     def __dir__(self) -> Iterable[str]:
         """Permits IPython tab completion and debuggers to work."""
-        self._discover_all()
         return set(super().__dir__()) | {str(k) for k in self._keys()}
 
 
@@ -557,6 +580,8 @@ class HierarchyArrayObject(HierarchyObjectBase[int], RangeableObjectMixin):
     # ideally `__len__` could be implemented in terms of `range`, but `range` doesn't work universally.
 
     def __iter__(self) -> Iterator[SimHandleBase]:
+        # get all children in one pass rather than looking up the cached keys one by one
+        self._discover_all()
         # must use `sorted(self._keys())` instead of the range because `range` doesn't work universally.
         for i in sorted(self._keys()):
             yield self[i]
@@ -744,6 +769,11 @@ ElemValueT = TypeVar("ElemValueT")
 ChildObjectT = TypeVar("ChildObjectT", bound=ValueObjectBase[Any, Any])
 
 
+_LogicElements = Tuple[
+    Tuple[simulator.gpi_sim_hdl, ...], Tuple[int, ...], Tuple[bool, ...]
+]
+
+
 class ArrayObject(
     ValueObjectBase[Array[ElemValueT], Array[ElemValueT]],
     RangeableObjectMixin,
@@ -777,6 +807,8 @@ class ArrayObject(
     def __init__(self, handle: simulator.gpi_sim_hdl, path: Optional[str]) -> None:
         super().__init__(handle, path)
         self._sub_handles: Dict[int, ChildObjectT] = {}
+        self._logic_elements_checked = False
+        self._logic_elements_cache: Optional[_LogicElements] = None
 
     @property
     def value(self) -> Array[ElemValueT]:
@@ -815,7 +847,22 @@ class ArrayObject(
             ValueError:
                 If assigning a :class:`list` of different length than the simulation object.
         """
-        return Array((self[i].value for i in self.range), range=self.range)
+        bulk = self._logic_elements()
+        if bulk is None:
+            return Array((self[i].value for i in self.range), range=self.range)
+        gpi_handles, widths, scalars = bulk
+        # read all elements in a single call into the simulator
+        binstr = simulator.get_signal_vals_binstr(gpi_handles)
+        values: List[Any] = []
+        start = 0
+        for width, scalar in zip(widths, scalars):
+            value = binstr[start : start + width]
+            if scalar:
+                values.append(Logic(value))
+            else:
+                values.append(LogicArray._from_handle(value))
+            start += width
+        return Array(values, range=self.range)
 
     @value.setter
     def value(self, value: Array[ElemValueT]) -> None:
@@ -833,8 +880,41 @@ class ArrayObject(
             raise ValueError(
                 f"Assigning list of length {len(value)} to object {self._name} of length {len(self)}"
             )
-        for elem, self_idx in zip(value, self.range):
-            self[self_idx]._set_value(elem, action, schedule_write)
+        bulk = self._logic_elements()
+        if bulk is None:
+            for elem, self_idx in zip(value, self.range):
+                self[self_idx]._set_value(elem, action, schedule_write)
+            return
+        gpi_handles, widths, scalars = bulk
+        values = [
+            _to_logic_binstr(elem)
+            if scalar
+            else str(_to_logic_array(elem, width, self[self_idx]._name))
+            for elem, width, scalar, self_idx in zip(value, widths, scalars, self.range)
+        ]
+        # write all elements in a single call into the simulator
+        schedule_write(
+            self, simulator.set_signal_vals_binstr, (action, gpi_handles, values)
+        )
+
+    def _logic_elements(self) -> Optional[_LogicElements]:
+        """The GPI handles, widths, and scalar-ness of the elements, in left-to-right order.
+
+        Returns ``None`` if any element is not a :class:`LogicObject` or :class:`LogicArrayObject`,
+        in which case the elements must be accessed one at a time.
+        """
+        if not self._logic_elements_checked:
+            elements = [self[i] for i in self.range]
+            if all(isinstance(e, (LogicObject, LogicArrayObject)) for e in elements):
+                self._logic_elements_cache = (
+                    tuple(e._handle for e in elements),
+                    tuple(
+                        1 if isinstance(e, LogicObject) else len(e) for e in elements
+                    ),
+                    tuple(isinstance(e, LogicObject) for e in elements),
+                )
+            self._logic_elements_checked = True
+        return self._logic_elements_cache
 
     def __getitem__(self, index: int) -> ChildObjectT:
         if isinstance(index, slice):
@@ -877,26 +957,9 @@ class LogicObject(ValueObjectBase[Logic, Union[Logic, int, str]]):
             [ValueObjectBase[Any, Any], Callable[..., None], Sequence[Any]], None
         ],
     ) -> None:
-        value_: str
-        if isinstance(value, (int, str)):
-            value_ = str(Logic(value))
-
-        elif isinstance(value, LogicArray):
-            if len(value) != 1:
-                raise ValueError(
-                    f"cannot assign value of length {len(value)} to handle of length 1"
-                )
-            value_ = str(value)
-
-        elif isinstance(value, Logic):
-            value_ = str(value)
-
-        else:
-            raise TypeError(
-                f"Unsupported type for value assignment: {type(value)} ({value!r})"
-            )
-
-        schedule_write(self, self._handle.set_signal_val_binstr, (action, value_))
+        schedule_write(
+            self, self._handle.set_signal_val_binstr, (action, _to_logic_binstr(value))
+        )
 
     @property
     def value(self) -> Logic:
@@ -981,21 +1044,14 @@ class LogicArrayObject(
                     )
                     return
 
-                # LogicArray used for checking
                 if value < 0:
-                    value_ = str(
-                        LogicArray.from_signed(
-                            value,
-                            Range(len(self) - 1, "downto", 0),
-                        )
-                    )
-                else:
-                    value_ = str(
-                        LogicArray.from_unsigned(
-                            value,
-                            Range(len(self) - 1, "downto", 0),
-                        )
-                    )
+                    value += 1 << len(self)
+                schedule_write(
+                    self,
+                    self._handle.set_signal_val_vector,
+                    (action, value.to_bytes(self._vector_nbytes(), "little")),
+                )
+                return
             else:
                 raise OverflowError(
                     f"Int value ({value!r}) out of range for assignment of {len(self)!r}-bit signal ({self._name!r})"
@@ -1010,6 +1066,24 @@ class LogicArrayObject(
                 raise ValueError(
                     f"cannot assign value of length {len(value)} to handle of length {len(self)}"
                 )
+            if value._value_as_int is not None or value._value_as_planes is not None:
+                # Already packed, so avoid rendering a string.
+                # Both are only cached for values of 0, 1, X, and Z,
+                # others (e.g. L and H) are written as a binstr so the drive strength is kept.
+                planes = value._get_planes()
+                assert planes is not None
+                aval, bval = planes
+                nbytes = self._vector_nbytes()
+                schedule_write(
+                    self,
+                    self._handle.set_signal_val_vector,
+                    (
+                        action,
+                        aval.to_bytes(nbytes, "little"),
+                        bval.to_bytes(nbytes, "little") if bval else None,
+                    ),
+                )
+                return
             value_ = str(value)
 
         elif isinstance(value, Logic):
@@ -1055,8 +1129,16 @@ class LogicArrayObject(
             Convert the dictionary to an integer before assignment using
             ``sum(v << (d['bits'] * i) for i, v in enumerate(d['values']))`` instead.
         """
-        binstr = self._handle.get_signal_val_binstr()
-        return LogicArray._from_handle(binstr)
+        planes = self._handle.get_signal_val_vector()
+        if isinstance(planes, str):
+            # value contains states other than 0, 1, X, and Z
+            return LogicArray._from_handle(planes)
+        value, xz = planes
+        return LogicArray._from_planes(
+            int.from_bytes(value, "little"),
+            int.from_bytes(xz, "little"),
+            self._value_range(),
+        )
 
     @value.setter
     def value(self, value: LogicArray) -> None:
@@ -1080,6 +1162,504 @@ class LogicArrayObject(
         # and this object needs to support multi-dimensional packed arrays.
         return self._handle.get_num_elems()
 
+    @cached_method
+    def _value_range(self) -> Range:
+        # range of the values read with get_signal_val_vector, as LogicArray._from_handle would give
+        return Range(len(self) - 1, "downto", 0)
+
+    @cached_method
+    def _vector_nbytes(self) -> int:
+        # size of each plane passed to set_signal_val_vector: whole 32-bit words
+        return (len(self) + 31) // 32 * 4
+
+
+class SignalGroup:
+    r"""A group of logic simulation objects whose values are read and written together.
+
+    Reading or writing the value of a :class:`!SignalGroup` accesses all of the simulation objects
+    with a single call into the simulator, rather than one call per object.
+    This is useful in monitors and drivers which sample or drive many signals at once.
+
+    The value of the group is the concatenation of the values of its members,
+    with the first member as the left-most (most significant) part,
+    like the Verilog concatenation ``{a, b, c}``.
+
+    .. code-block:: python3
+
+        group = SignalGroup(dut.valid, dut.ready, dut.data)
+
+        # read all three signals in one call
+        valid, ready, data = group.values()
+
+        # or as a single concatenated LogicArray
+        sample = group.value
+
+        # write all three signals
+        group.set_values(1, 0, 0xDEADBEEF)
+
+        # or using a single concatenated value
+        group.value = 0
+
+    Args:
+        \*handles: The :class:`LogicObject`\ s and :class:`LogicArrayObject`\ s to group.
+
+    Raises:
+        TypeError: If any of *handles* is not a :class:`LogicObject` or :class:`LogicArrayObject`.
+        ValueError: If no handles are given.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(self, *handles: Union[LogicObject, LogicArrayObject]) -> None:
+        if not handles:
+            raise ValueError("SignalGroup requires at least one handle")
+        for handle in handles:
+            if not isinstance(handle, (LogicObject, LogicArrayObject)):
+                raise TypeError(
+                    f"SignalGroup members must be LogicObject or LogicArrayObject, not {type(handle).__qualname__}"
+                )
+        self._handles = handles
+        self._gpi_handles = tuple(handle._handle for handle in handles)
+        self._widths = tuple(
+            1 if isinstance(handle, LogicObject) else len(handle) for handle in handles
+        )
+        self._name = "{" + ", ".join(handle._path for handle in handles) + "}"
+        self._range = Range(sum(self._widths) - 1, "downto", 0)
+        self._ranges = tuple(Range(width - 1, "downto", 0) for width in self._widths)
+
+    @property
+    def handles(self) -> Tuple[Union[LogicObject, LogicArrayObject], ...]:
+        """The simulation objects in the group, in order."""
+        return self._handles
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({', '.join(repr(h) for h in self._handles)})"
+
+    @property
+    def value(self) -> LogicArray:
+        """The concatenated value of all the simulation objects in the group.
+
+        :getter:
+            Returns the current values of the simulation objects as a single :class:`~cocotb.types.LogicArray`.
+
+        :setter:
+            Assigns a value at the end of the current delta cycle.
+            Takes whatever values :meth:`set` takes.
+        """
+        planes = simulator.get_signal_vals_vector(self._gpi_handles)
+        if isinstance(planes, str):
+            # some value contains states other than 0, 1, X, and Z
+            return LogicArray._from_handle(planes)
+        value, xz = planes
+        return LogicArray._from_planes(
+            int.from_bytes(value, "little"), int.from_bytes(xz, "little"), self._range
+        )
+
+    @value.setter
+    def value(self, value: LogicArray) -> None:
+        self.set(value)
+
+    def values(self) -> Tuple[Union[Logic, LogicArray], ...]:
+        """Get the current value of each simulation object in the group.
+
+        Returns:
+            A :class:`tuple` of the values of each simulation object, in order, as if by calling ``handle.value`` on each.
+        """
+        planes = simulator.get_signal_vals_vector(self._gpi_handles)
+        result: List[Union[Logic, LogicArray]] = []
+        if isinstance(planes, str):
+            # some value contains states other than 0, 1, X, and Z
+            start = 0
+            for handle, width in zip(self._handles, self._widths):
+                binstr = planes[start : start + width]
+                if isinstance(handle, LogicObject):
+                    result.append(Logic(binstr))
+                else:
+                    result.append(LogicArray._from_handle(binstr))
+                start += width
+            return tuple(result)
+
+        value = int.from_bytes(planes[0], "little")
+        xz = int.from_bytes(planes[1], "little")
+        shift = len(self)
+        for handle, width, member_range in zip(
+            self._handles, self._widths, self._ranges
+        ):
+            shift -= width
+            mask = (1 << width) - 1
+            member_value = (value >> shift) & mask
+            member_xz = (xz >> shift) & mask
+            if isinstance(handle, LogicObject):
+                result.append(Logic("01ZX"[member_value | member_xz << 1]))
+            else:
+                result.append(
+                    LogicArray._from_planes(member_value, member_xz, member_range)
+                )
+        return tuple(result)
+
+    def set(
+        self,
+        value: Union[
+            LogicArray,
+            int,
+            str,
+            Deposit[Union[LogicArray, int, str]],
+            Force[Union[LogicArray, int, str]],
+            Freeze,
+            Release,
+        ],
+    ) -> None:
+        """Assign the concatenated value to the group at the end of the current delta cycle.
+
+        Accepts a :class:`~cocotb.types.LogicArray`, :class:`str`, or :class:`int` the width of the whole group,
+        as well as the :class:`Deposit`, :class:`Force`, :class:`Freeze`, and :class:`Release` actions.
+        See :meth:`ValueObjectBase.set`.
+        """
+        value_, action = self._map_action(value)
+
+        import cocotb._write_scheduler
+
+        self._set_value(value_, action, cocotb._write_scheduler.schedule_write)
+
+    def setimmediatevalue(
+        self,
+        value: Union[
+            LogicArray,
+            int,
+            str,
+            Deposit[Union[LogicArray, int, str]],
+            Force[Union[LogicArray, int, str]],
+            Freeze,
+            Release,
+        ],
+    ) -> None:
+        """Assign the concatenated value to the group immediately.
+
+        See :meth:`set` and :meth:`ValueObjectBase.setimmediatevalue`.
+        """
+        value_, action = self._map_action(value)
+        if action == _GPISetAction.DEPOSIT:
+            action = _GPISetAction.NO_DELAY
+
+        self._set_value(value_, action, _write_now)
+
+    def set_values(self, *values: Union[Logic, LogicArray, int, str]) -> None:
+        r"""Assign a value to each simulation object in the group at the end of the current delta cycle.
+
+        Each value is converted as if it was assigned to the corresponding simulation object,
+        but all objects are written in a single call into the simulator.
+
+        Args:
+            \*values: One value per simulation object, in order.
+
+        Raises:
+            ValueError: If the number of values doesn't match the number of simulation objects.
+        """
+        if len(values) != len(self._handles):
+            raise ValueError(f"Expected {len(self._handles)} values, got {len(values)}")
+        binstr = "".join(
+            str(_to_logic_array(value, width, handle._name))
+            for value, width, handle in zip(values, self._widths, self._handles)
+        )
+
+        import cocotb._write_scheduler
+
+        self._set_value(
+            binstr, _GPISetAction.DEPOSIT, cocotb._write_scheduler.schedule_write
+        )
+
+    def _map_action(
+        self,
+        value: Union[
+            LogicArray,
+            int,
+            str,
+            Deposit[Union[LogicArray, int, str]],
+            Force[Union[LogicArray, int, str]],
+            Freeze,
+            Release,
+        ],
+    ) -> Tuple[Union[LogicArray, int, str], _GPISetAction]:
+        for handle in self._handles:
+            if handle.is_const:
+                raise TypeError(f"{handle._path} is constant")
+        if isinstance(value, Deposit):
+            return value.value, _GPISetAction.DEPOSIT
+        elif isinstance(value, Force):
+            return value.value, _GPISetAction.FORCE
+        elif isinstance(value, Freeze):
+            return self.value, _GPISetAction.FORCE
+        elif isinstance(value, Release):
+            return self.value, _GPISetAction.RELEASE
+        else:
+            return value, _GPISetAction.DEPOSIT
+
+    def _set_value(
+        self,
+        value: Union[LogicArray, int, str],
+        action: _GPISetAction,
+        schedule_write: Callable[
+            [Any, Callable[..., None], Sequence[Any]],
+            None,
+        ],
+    ) -> None:
+        binstr = str(_to_logic_array(value, len(self), self._name))
+        values: List[str] = []
+        start = 0
+        for width in self._widths:
+            values.append(binstr[start : start + width])
+            start += width
+        schedule_write(
+            self,
+            simulator.set_signal_vals_binstr,
+            (action, self._gpi_handles, values),
+        )
+
+
+def _to_logic_binstr(value: Union[Logic, LogicArray, int, str]) -> str:
+    """Convert a value to the binstr of a single bit, as LogicObject does."""
+    if isinstance(value, (int, str)):
+        return str(Logic(value))
+    elif isinstance(value, LogicArray):
+        if len(value) != 1:
+            raise ValueError(
+                f"cannot assign value of length {len(value)} to handle of length 1"
+            )
+        return str(value)
+    elif isinstance(value, Logic):
+        return str(value)
+    else:
+        raise TypeError(
+            f"Unsupported type for value assignment: {type(value)} ({value!r})"
+        )
+
+
+def _to_logic_array(
+    value: Union[Logic, LogicArray, int, str], width: int, name: str
+) -> LogicArray:
+    """Convert a value to a LogicArray of the given width, as LogicArrayObject does."""
+    if isinstance(value, int):
+        min_val, max_val = _value_limits(width, _Limits.VECTOR_NBIT)
+        if not (min_val <= value <= max_val):
+            raise OverflowError(
+                f"Int value ({value!r}) out of range for assignment of {width!r}-bit signal ({name!r})"
+            )
+        if value < 0:
+            return LogicArray.from_signed(value, width)
+        return LogicArray.from_unsigned(value, width)
+    elif isinstance(value, str):
+        return LogicArray(value, width)
+    elif isinstance(value, LogicArray):
+        if len(value) != width:
+            raise ValueError(
+                f"cannot assign value of length {len(value)} to {name} of length {width}"
+            )
+        return value
+    elif isinstance(value, Logic):
+        if width != 1:
+            raise ValueError(
+                f"cannot assign value of length 1 to {name} of length {width}"
+            )
+        return LogicArray([value])
+    else:
+        raise TypeError(
+            f"Unsupported type for value assignment: {type(value)} ({value!r})"
+        )
+
+
+_Buffer = Union[bytes, bytearray, memoryview]
+
+
+def _memory_layout(
+    mem: ArrayObject[Any, Any],
+) -> Tuple[int, Tuple[simulator.gpi_sim_hdl, ...], int]:
+    """Return the lowest index, the GPI handles of the elements in index order, and the word size in bytes of *mem*."""
+    if not isinstance(mem, ArrayObject):
+        raise TypeError(f"Memory must be an ArrayObject, not {type(mem).__qualname__}")
+    # the element handles are looked up once and kept by the array object
+    bulk = mem._logic_elements()
+    if bulk is None:
+        elem = next(
+            e for e in mem if not isinstance(e, (LogicObject, LogicArrayObject))
+        )
+        raise TypeError(
+            f"Memory elements must be LogicObject or LogicArrayObject, not {type(elem).__qualname__}"
+        )
+    gpi_handles, widths, _ = bulk
+    if mem.range.left > mem.range.right:
+        gpi_handles = gpi_handles[::-1]
+    return min(mem.range.left, mem.range.right), gpi_handles, (widths[0] + 7) // 8
+
+
+def _check_memory_range(
+    mem: ArrayObject[Any, Any], low: int, length: int, start: int, count: int
+) -> None:
+    if start < low or start + count > low + length:
+        raise IndexError(
+            f"{count} words at index {start} do not fit in {mem._path} with indexes {low} to {low + length - 1}"
+        )
+
+
+def load_memory(
+    mem: ArrayObject[Any, Any], data: _Buffer, *, start: Optional[int] = None
+) -> None:
+    r"""Load an image into a memory immediately, bypassing the design.
+
+    The image is a sequence of little-endian words, one per element of *mem*,
+    each the width of the elements rounded up to whole bytes.
+    Word ``i`` of the image is written to the element at index ``start + i``.
+    All elements are written in a single call into the simulator,
+    so this is much faster than assigning the elements one at a time.
+
+    .. code-block:: python3
+
+        # 32-bit words
+        load_memory(dut.ram, struct.pack("<4I", 1, 2, 3, 4))
+        load_memory(dut.ram, numpy.arange(1024, dtype="<u4"), start=0x100)
+
+    Args:
+        mem: An :class:`ArrayObject` of :class:`LogicObject`\ s or :class:`LogicArrayObject`\ s.
+        data: The image.
+            Any object supporting the buffer protocol can be used, e.g. :class:`bytes`,
+            a :class:`mmap.mmap` of an image file, or a contiguous NumPy array.
+        start: Index of the element to write the first word to.
+            Defaults to the lowest index of *mem*.
+
+    Raises:
+        TypeError: If *mem* is not an array of logic objects.
+        ValueError: If the length of *data* is not a whole number of words.
+        IndexError: If the image does not fit in *mem*.
+
+    .. versionadded:: 2.0
+    """
+    low, gpi_handles, word_bytes = _memory_layout(mem)
+    if mem.is_const:
+        raise TypeError(f"{mem._path} is constant")
+    if start is None:
+        start = low
+    with memoryview(data) as view, view.cast("B") as image:
+        if len(image) % word_bytes != 0:
+            raise ValueError(
+                f"Image length {len(image)} is not a multiple of the word size {word_bytes} of {mem._path}"
+            )
+        count = len(image) // word_bytes
+        _check_memory_range(mem, low, len(gpi_handles), start, count)
+        simulator.set_signal_vals_bytes(
+            _GPISetAction.NO_DELAY,
+            gpi_handles[start - low : start - low + count],
+            word_bytes,
+            image,
+        )
+
+
+def load_memory_file(
+    mem: ArrayObject[Any, Any],
+    filename: Union[str, "os.PathLike[str]"],
+    *,
+    start: Optional[int] = None,
+) -> None:
+    r"""Load an image file into a memory immediately, bypassing the design.
+
+    Files with a ``.hex`` or ``.mem`` suffix are read as text in the format of the Verilog ``$readmemh`` system task:
+    hexadecimal words separated by whitespace, ``@`` followed by the hexadecimal index of the element to write the next word to,
+    and ``//`` and ``/* */`` comments.
+    Other files are read as binary images in the format described in :func:`load_memory`,
+    which are memory-mapped rather than read into memory.
+
+    Args:
+        mem: An :class:`ArrayObject` of :class:`LogicObject`\ s or :class:`LogicArrayObject`\ s.
+        filename: Path of the image file.
+        start: Index of the element to write the first word to, unless an ``@`` index is given.
+            Defaults to the lowest index of *mem*.
+
+    Raises:
+        TypeError: If *mem* is not an array of logic objects.
+        ValueError: If the file can't be parsed or the length of a binary image is not a whole number of words.
+        IndexError: If the image does not fit in *mem*.
+
+    .. versionadded:: 2.0
+    """
+    if os.fspath(filename).endswith((".hex", ".mem")):
+        _, _, word_bytes = _memory_layout(mem)
+        with open(filename, encoding="ascii") as f:
+            segments = _parse_memh(f.read(), word_bytes)
+        for segment_start, segment in segments:
+            load_memory(
+                mem,
+                segment,
+                start=start if segment_start is None else segment_start,
+            )
+        return
+
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            load_memory(mem, image, start=start)
+
+
+def _parse_memh(text: str, word_bytes: int) -> List[Tuple[Optional[int], bytearray]]:
+    """Parse ``$readmemh`` text into runs of consecutive little-endian words and the index of their first word."""
+    text = re.sub(r"//[^\n]*|/\*.*?\*/", " ", text, flags=re.DOTALL)
+    segments: List[Tuple[Optional[int], bytearray]] = []
+    segment_start: Optional[int] = None
+    segment = bytearray()
+    for token in text.split():
+        if token.startswith("@"):
+            if segment:
+                segments.append((segment_start, segment))
+            segment_start = int(token[1:], 16)
+            segment = bytearray()
+            continue
+        try:
+            segment += int(token.replace("_", ""), 16).to_bytes(word_bytes, "little")
+        except OverflowError:
+            raise ValueError(
+                f"Word {token} does not fit in {word_bytes} bytes"
+            ) from None
+    if segment:
+        segments.append((segment_start, segment))
+    return segments
+
+
+def dump_memory(
+    mem: ArrayObject[Any, Any],
+    *,
+    start: Optional[int] = None,
+    count: Optional[int] = None,
+) -> bytes:
+    r"""Read the contents of a memory, bypassing the design.
+
+    The contents are returned in the format described in :func:`load_memory`.
+    All elements are read in a single call into the simulator.
+    Bits which are not ``0`` or ``1``, such as ``X`` or ``Z``, are read as ``0``.
+
+    Args:
+        mem: An :class:`ArrayObject` of :class:`LogicObject`\ s or :class:`LogicArrayObject`\ s.
+        start: Index of the first element to read.
+            Defaults to the lowest index of *mem*.
+        count: Number of elements to read.
+            Defaults to the elements from *start* up to the highest index of *mem*.
+
+    Raises:
+        TypeError: If *mem* is not an array of logic objects.
+        IndexError: If the elements to read are not all in *mem*.
+
+    .. versionadded:: 2.0
+    """
+    low, gpi_handles, word_bytes = _memory_layout(mem)
+    if start is None:
+        start = low
+    if count is None:
+        count = low + len(gpi_handles) - start
+    _check_memory_range(mem, low, len(gpi_handles), start, count)
+    return simulator.get_signal_vals_bytes(
+        gpi_handles[start - low : start - low + count], word_bytes
+    )
+
 
 class RealObject(ValueObjectBase[float, float]):
     """A real/float simulation object.
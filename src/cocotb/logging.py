@@ -32,7 +32,7 @@ Everything related to logging
 import logging
 import os
 import sys
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from cocotb import _ANSI, simulator
 from cocotb._utils import want_color_output
@@ -43,6 +43,8 @@ try:
 except ValueError:
     _suppress = 1
 
+_fast = "COCOTB_LOG_FAST" in os.environ
+
 # Column alignment
 _LEVEL_CHARS = len("CRITICAL")
 _RECORD_CHARS = 34
@@ -57,6 +59,15 @@ logging.addLevelName(5, "TRACE")
 # Default log level if not overwritten by the user.
 _COCOTB_LOG_LEVEL_DEFAULT = "INFO"
 
+# Number of cached log record prefixes after which the cache is cleared
+_PREFIX_CACHE_SIZE = 1024
+
+# Simulation time of the current entry into Python from the simulator, if known
+_sim_time_cache: Optional[int] = None
+
+# Handler holding back log output in fast logging mode
+_buffered_handler: Optional["_BufferedStreamHandler"] = None
+
 
 def default_config():
     """Apply the default cocotb log formatting to the root logger.
@@ -75,11 +86,21 @@ def default_config():
     manually resetting the root logger instance.
     An example of this can be found in the section on :ref:`rotating-logger`.
 
+    If the :envvar:`COCOTB_LOG_FAST` environment variable is set,
+    the simulator time is only queried once per entry into Python from the simulator,
+    and log output is written out in batches.
+
     .. versionadded:: 1.4
     """
+    global _buffered_handler
+
     # construct an appropriate handler
-    hdlr = logging.StreamHandler(sys.stdout)
-    hdlr.addFilter(SimTimeContextFilter())
+    if _fast:
+        hdlr = _buffered_handler = _BufferedStreamHandler(sys.stdout)
+        hdlr.addFilter(_CachedSimTimeContextFilter())
+    else:
+        hdlr = logging.StreamHandler(sys.stdout)
+        hdlr.addFilter(SimTimeContextFilter())
     if want_color_output():
         hdlr.setFormatter(SimColourLogFormatter())
     else:
@@ -122,10 +143,25 @@ else:
 class SimBaseLog(LoggerClass):
     """This class only exists for backwards compatibility"""
 
-    def setLevel(self, level: Union[int, str]) -> None:
-        super().setLevel(level)
-        if self.name == "gpi":
-            simulator.log_level(self.getEffectiveLevel())
+    # The GPI caches its log level and which of its messages are enabled, so it
+    # is notified of level changes, whether through setLevel() or assignment.
+    @property  # type: ignore[override]
+    def level(self) -> int:
+        return self._level
+
+    @level.setter
+    def level(self, level: int) -> None:
+        initialized = "_level" in self.__dict__
+        self._level = level
+        if initialized:
+            _update_gpi_log_level()
+
+
+def _update_gpi_log_level() -> None:
+    # The parent of the gpi logger is the root logger, whose level and
+    # logging.disable() the GPI checks itself when its level is NOTSET.
+    simulator.log_level(logging.getLogger("gpi").level)
+    simulator.clear_log_filter_cache()
 
 
 # this used to be a class, hence the unusual capitalization
@@ -162,6 +198,71 @@ class SimTimeContextFilter(logging.Filter):
         return True
 
 
+class _CachedSimTimeContextFilter(SimTimeContextFilter):
+    """A :class:`SimTimeContextFilter` which queries the simulator time only once per entry into Python.
+
+    The cache is cleared by :func:`_clear_sim_time_cache` whenever the simulator calls into Python,
+    including to log a message from the GPI.
+    """
+
+    def filter(self, record):
+        global _sim_time_cache
+        if _sim_time_cache is None:
+            super().filter(record)
+            _sim_time_cache = record.created_sim_time
+        else:
+            record.created_sim_time = _sim_time_cache
+        return True
+
+
+def _clear_sim_time_cache() -> None:
+    """Called when the simulator calls into Python, as the simulator time may have changed."""
+    global _sim_time_cache
+    _sim_time_cache = None
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """A :class:`logging.StreamHandler` which holds back formatted records until it is flushed.
+
+    The buffer is flushed when it holds *capacity* records,
+    when a record of level *flush_level* or higher is handled,
+    and by :func:`_flush_log`.
+    """
+
+    def __init__(
+        self, stream=None, capacity: int = 4096, flush_level: int = logging.ERROR
+    ):
+        super().__init__(stream)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self._buffer: List[str] = []
+
+    def emit(self, record):
+        try:
+            self._buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+        if len(self._buffer) >= self.capacity or record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buffer and self.stream is not None:
+                self._buffer.append("")
+                self.stream.write(self.terminator.join(self._buffer))
+                self._buffer.clear()
+            super().flush()
+        finally:
+            self.release()
+
+
+def _flush_log() -> None:
+    """Write out the log output held back in fast logging mode."""
+    if _buffered_handler is not None:
+        _buffered_handler.flush()
+
+
 class SimLogFormatter(logging.Formatter):
     """Log formatter to provide consistent log message handling.
 
@@ -175,6 +276,9 @@ class SimLogFormatter(logging.Formatter):
     def __init__(self):
         """Takes no arguments."""
         super().__init__()
+        self._prefix_cache: Dict[Tuple[str, str], str] = {}
+        self._last_sim_time: Optional[int] = None
+        self._last_sim_time_str = "  -.--ns".rjust(11)
 
     # Justify and truncate
     @staticmethod
@@ -191,19 +295,25 @@ class SimLogFormatter(logging.Formatter):
 
     def _format(self, level, record, msg, coloured=False):
         sim_time = getattr(record, "created_sim_time", None)
-        if sim_time is None:
-            sim_time_str = "  -.--ns"
-        else:
-            time_ns = get_time_from_sim_steps(sim_time, "ns")
-            sim_time_str = f"{time_ns:6.2f}ns"
-        prefix = (
-            sim_time_str.rjust(11)
-            + " "
-            + level
-            + " "
-            + self.ljust(record.name, _RECORD_CHARS)
-            + " "
-        )
+        if sim_time != self._last_sim_time:
+            if sim_time is None:
+                sim_time_str = "  -.--ns"
+            else:
+                time_ns = get_time_from_sim_steps(sim_time, "ns")
+                sim_time_str = f"{time_ns:6.2f}ns"
+            self._last_sim_time = sim_time
+            self._last_sim_time_str = sim_time_str.rjust(11)
+
+        # the justified level and logger name only depend on the logger
+        key = (level, record.name)
+        name_prefix = self._prefix_cache.get(key)
+        if name_prefix is None:
+            if len(self._prefix_cache) >= _PREFIX_CACHE_SIZE:
+                self._prefix_cache.clear()
+            name_prefix = self._prefix_cache[key] = (
+                " " + level + " " + self.ljust(record.name, _RECORD_CHARS) + " "
+            )
+        prefix = self._last_sim_time_str + name_prefix
         if not _suppress:
             prefix += (
                 self.rjust(os.path.split(record.filename)[1], _FILENAME_CHARS)
@@ -225,6 +335,9 @@ class SimLogFormatter(logging.Formatter):
                 msg = msg + "\n"
             msg = msg + record.exc_text
 
+        if "\n" not in msg:
+            return prefix + msg
+
         prefix_len = len(prefix)
         if coloured:
             prefix_len -= len(level) - _LEVEL_CHARS
@@ -271,8 +384,13 @@ class SimColourLogFormatter(SimLogFormatter):
         return self._format(level, record, msg, coloured=True)
 
 
+def _is_enabled_for(logger: logging.Logger, level: int) -> bool:
+    # Logger.isEnabledFor() caches its results, which assignments to Logger.level don't clear
+    return level > logger.manager.disable and level >= logger.getEffectiveLevel()
+
+
 def _filter_from_c(logger_name: str, level: int) -> bool:
-    return logging.getLogger(logger_name).isEnabledFor(level)
+    return _is_enabled_for(logging.getLogger(logger_name), level)
 
 
 def _log_from_c(
@@ -288,7 +406,9 @@ def _log_from_c(
     information.
     """
     logger = logging.getLogger(logger_name)
-    if logger.isEnabledFor(level):
+    if _is_enabled_for(logger, level):
+        # the GPI logs outside of the callbacks which clear the cache
+        _clear_sim_time_cache()
         record = logger.makeRecord(
             logger.name, level, filename, lineno, msg, (), None, function_name
         )
@@ -4,11 +4,19 @@
 import asyncio.queues
 import collections
 import heapq
-from typing import Any, Deque, Generic, Tuple, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
 
-import cocotb
-from cocotb.task import Task
-from cocotb.triggers import Event, _pointer_str
+from cocotb.triggers import Trigger, _pointer_str
 
 
 class QueueFull(asyncio.queues.QueueFull):
@@ -22,6 +30,31 @@ class QueueEmpty(asyncio.queues.QueueEmpty):
 T = TypeVar("T")
 
 
+class _QueueWaiter(Trigger):
+    """Trigger used by a Task blocked in :meth:`Queue.put` or :meth:`Queue.get`.
+
+    Instances are recycled by the :class:`Queue` once they have been waited on,
+    so blocking does not allocate a new object each time.
+    A waiter which is un-primed before being woken,
+    e.g. because the waiting Task was killed, is discarded when it reaches the front of the queue of waiters.
+    """
+
+    def __init__(self, parent: "Queue[Any]") -> None:
+        super().__init__()
+        self._parent = parent
+        self._callback: Optional[Callable[[Trigger], None]] = None
+
+    def _prime(self, callback: Callable[[Trigger], None]) -> None:
+        self._callback = callback
+        super()._prime(callback)
+
+    def _wake(self) -> None:
+        cast(Callable[[Trigger], None], self._callback)(self)
+
+    def __repr__(self) -> str:
+        return f"<{self._parent!r} waiter at {_pointer_str(self)}>"
+
+
 class Queue(Generic[T]):
     """A queue, useful for coordinating producer and consumer coroutines.
 
@@ -33,8 +66,9 @@ class Queue(Generic[T]):
     def __init__(self, maxsize: int = 0) -> None:
         self._maxsize: int = maxsize
 
-        self._getters: Deque[Tuple[Event, Task[Any]]] = collections.deque()
-        self._putters: Deque[Tuple[Event, Task[Any]]] = collections.deque()
+        self._getters: Deque[_QueueWaiter] = collections.deque()
+        self._putters: Deque[_QueueWaiter] = collections.deque()
+        self._free_waiters: List[_QueueWaiter] = []
 
         self._init(maxsize)
 
@@ -48,12 +82,23 @@ class Queue(Generic[T]):
     def _get(self) -> T:
         return self._queue.popleft()
 
-    def _wakeup_next(self, waiters: Deque[Tuple[Event, Task[Any]]]) -> None:
+    def _wakeup_next(self, waiters: Deque[_QueueWaiter]) -> None:
         while waiters:
-            event, task = waiters.popleft()
-            if not task.done():
-                event.set()
+            waiter = waiters.popleft()
+            if waiter._primed:
+                waiter._wake()
                 break
+            # the Task stopped waiting before being woken
+            self._free_waiters.append(waiter)
+
+    async def _wait(self, waiters: Deque[_QueueWaiter]) -> None:
+        if self._free_waiters:
+            waiter = self._free_waiters.pop()
+        else:
+            waiter = _QueueWaiter(self)
+        waiters.append(waiter)
+        await waiter
+        self._free_waiters.append(waiter)
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} {self._format()} at {_pointer_str(self)}>"
@@ -103,13 +148,23 @@ class Queue(Generic[T]):
         slot is available before adding the item.
         """
         while self.full():
-            event = Event(f"{type(self).__name__} put")
-            self._putters.append(
-                (event, cast(Task[Any], cocotb._scheduler_inst._current_task))
-            )
-            await event.wait()
+            await self._wait(self._putters)
         self.put_nowait(item)
 
+    async def put_many(self, items: Iterable[T]) -> None:
+        """Put all *items* into the queue, in order.
+
+        If the queue is full, wait until a free
+        slot is available before adding each remaining item.
+
+        .. versionadded:: 2.0
+        """
+        for item in items:
+            while self.full():
+                await self._wait(self._putters)
+            self._put(item)
+            self._wakeup_next(self._getters)
+
     def put_nowait(self, item: T) -> None:
         """Put an *item* into the queue without blocking.
 
@@ -126,13 +181,36 @@ class Queue(Generic[T]):
         If the queue is empty, wait until an item is available.
         """
         while self.empty():
-            event = Event(f"{type(self).__name__} get")
-            self._getters.append(
-                (event, cast(Task[Any], cocotb._scheduler_inst._current_task))
-            )
-            await event.wait()
+            await self._wait(self._getters)
         return self.get_nowait()
 
+    async def get_many(self, n: int) -> List[T]:
+        """Remove and return a list of *n* items from the queue.
+
+        Items are removed as they become available,
+        waiting until all *n* items have been received.
+
+        .. versionadded:: 2.0
+        """
+        items: List[T] = []
+        while len(items) < n:
+            while self.empty():
+                await self._wait(self._getters)
+            items.append(self._get())
+            self._wakeup_next(self._putters)
+        return items
+
+    def drain(self) -> List[T]:
+        """Remove and return all items currently in the queue without blocking.
+
+        .. versionadded:: 2.0
+        """
+        items: List[T] = []
+        while not self.empty():
+            items.append(self._get())
+            self._wakeup_next(self._putters)
+        return items
+
     def get_nowait(self) -> T:
         """Remove and return an item from the queue.
 
@@ -64,12 +64,14 @@ import cocotb._write_scheduler
 from cocotb import _ANSI, simulator
 from cocotb._exceptions import InternalError
 from cocotb._outcomes import Error, Outcome
+from cocotb._test_durations import _balance, _TestDurations
 from cocotb._utils import (
     DocEnum,
     remove_traceback_frames,
     want_color_output,
 )
 from cocotb._xunit_reporter import XUnitReporter
+from cocotb.logging import _clear_sim_time_cache, _flush_log
 from cocotb.result import TestSuccess
 from cocotb.task import Task, _RunningTest
 from cocotb.triggers import SimTimeoutError, Timer, Trigger, with_timeout
@@ -77,6 +79,10 @@ from cocotb.utils import get_sim_time
 
 _pdb_on_exception = "COCOTB_PDB_ON_EXCEPTION" in os.environ
 
+# tests which take this much longer than the average of their previous runs are reported
+_SLOWDOWN_FACTOR = 1.5
+_SLOWDOWN_MIN_S = 0.5
+
 
 _logger = logging.getLogger(__name__)
 
@@ -261,6 +267,8 @@ class RegressionManager:
         self._tearing_down = False
         self._test_queue: List[Test] = []
         self._filters: List[re.Pattern[str]] = []
+        self._shard: Optional[Tuple[int, int]] = None
+        self._test_durations: Optional[_TestDurations] = None
         self._mode = RegressionMode.REGRESSION
         self._included: List[bool]
         self._sim_failure: Union[SimFailure, None] = None
@@ -271,8 +279,13 @@ class RegressionManager:
         results_filename = os.getenv("COCOTB_RESULTS_FILE", "results.xml")
         suite_name = os.getenv("COCOTB_RESULT_TESTSUITE", "all")
         package_name = os.getenv("COCOTB_RESULT_TESTPACKAGE", "all")
+        results_jsonl_filename = os.getenv("COCOTB_RESULTS_JSONL_FILE") or None
 
-        self.xunit = XUnitReporter(filename=results_filename)
+        self.xunit = XUnitReporter(
+            filename=results_filename,
+            jsonl_filename=results_jsonl_filename,
+            fsync="COCOTB_RESULTS_FSYNC" in os.environ,
+        )
         self.xunit.add_testsuite(name=suite_name, package=package_name)
         self.xunit.add_property(name="random_seed", value=str(cocotb._random_seed))
 
@@ -319,6 +332,45 @@ class RegressionManager:
             compiled_filter = re.compile(filter)
             self._filters.append(compiled_filter)
 
+    def set_shard(self, index: int, count: int) -> None:
+        """Only run a share of the tests, so a regression can be split over several simulator processes.
+
+        The included tests are dealt out in turn to *count* shards and only those of shard *index* are run.
+        Tests excluded by filters are only reported by shard ``0``,
+        so that the results of all the shards together report every test exactly once.
+
+        Should be called before :meth:`start_regression` is called.
+
+        Args:
+            index: The shard to run, starting at ``0``.
+            count: The total number of shards.
+
+        Raises:
+            ValueError: If *index* is not in the range ``[0, count)``.
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"Invalid shard {index} of {count} shards")
+        self._shard = (index, count)
+
+    def set_test_durations(self, filename: str) -> None:
+        """Keep the durations of the tests in *filename* between runs, and use them to schedule the tests.
+
+        Tests of the same stage are run longest first,
+        and when only a share of the tests is run (see :meth:`set_shard`),
+        the tests are dealt out so that all shards take about the same time.
+        Tests which were not run before are assumed to take the average time of those that were.
+        Tests which take much longer than the average of their previous runs are reported.
+
+        The durations are saved at the end of the regression, unless only a share of the tests is run,
+        as all shards must schedule the tests based on the same durations.
+
+        Should be called before :meth:`start_regression` is called.
+
+        Args:
+            filename: Path of the file the durations are kept in.
+        """
+        self._test_durations = _TestDurations(filename)
+
     def set_mode(self, mode: RegressionMode) -> None:
         """Set the regression mode.
 
@@ -373,8 +425,12 @@ class RegressionManager:
     def start_regression(self) -> None:
         """Start the regression."""
 
-        # sort tests into stages
-        self._test_queue.sort(key=lambda test: test.stage)
+        # sort tests into stages, longest first within a stage if their durations are known
+        if self._test_durations is not None:
+            durations = self._expected_durations()
+            self._test_queue.sort(key=lambda test: (test.stage, -durations[test]))
+        else:
+            self._test_queue.sort(key=lambda test: test.stage)
 
         # mark tests for running
         if self._filters:
@@ -386,6 +442,10 @@ class RegressionManager:
         else:
             self._included = [True] * len(self._test_queue)
 
+        # keep only the tests of this shard
+        if self._shard is not None:
+            self._apply_shard(*self._shard)
+
         # compute counts
         self.count = 1
         self.total_tests = sum(self._included)
@@ -400,6 +460,44 @@ class RegressionManager:
         self._first_test = True
         self._execute()
 
+    def _expected_durations(self) -> Dict[Test, float]:
+        """Return the expected wall clock time of each test in the queue from the durations of previous runs."""
+        assert self._test_durations is not None
+        durations = {
+            test: self._test_durations.wall_time(test.fullname)
+            for test in self._test_queue
+        }
+        known = [d for d in durations.values() if d is not None]
+        default = sum(known) / len(known) if known else 1.0
+        return {test: default if d is None else d for test, d in durations.items()}
+
+    def _apply_shard(self, index: int, count: int) -> None:
+        included_tests = [
+            test
+            for test, test_included in zip(self._test_queue, self._included)
+            if test_included
+        ]
+        if self._test_durations is not None:
+            durations = self._expected_durations()
+            shards = _balance([durations[test] for test in included_tests], count)
+        else:
+            shards = [i % count for i in range(len(included_tests))]
+
+        test_queue: List[Test] = []
+        included: List[bool] = []
+        num_included = 0
+        for test, test_included in zip(self._test_queue, self._included):
+            if test_included:
+                if shards[num_included] == index:
+                    test_queue.append(test)
+                    included.append(True)
+                num_included += 1
+            elif index == 0:
+                test_queue.append(test)
+                included.append(False)
+        self._test_queue = test_queue
+        self._included = included
+
     def _execute(self) -> None:
         """Run the main regression loop.
 
@@ -435,6 +533,9 @@ class RegressionManager:
                 self._record_test_init_failed()
                 continue
 
+            # write out the results so far, in case the test takes down the simulator
+            self.xunit.flush()
+
             self._log_test_start()
 
             # seed random number generator based on test module, name, and COCOTB_RANDOM_SEED
@@ -456,11 +557,11 @@ class RegressionManager:
         return self._tear_down()
 
     def _schedule_next_test(self, trigger: Optional[Trigger] = None) -> None:
+        _clear_sim_time_cache()
         if trigger is not None:
             # TODO move to Trigger object
             cocotb.sim_phase = cocotb.SimPhase.NORMAL
             trigger._cleanup()
-        cocotb._write_scheduler.start_write_scheduler()
 
         self._test_task._add_done_callback(
             lambda _: cocotb._scheduler_inst.shutdown_soon()
@@ -484,6 +585,10 @@ class RegressionManager:
         # Generate output reports
         self.xunit.write()
 
+        # all shards must schedule tests based on the same durations, don't change them midway
+        if self._test_durations is not None and self._shard is None:
+            self._test_durations.save()
+
         # Setup simulator finalization
         simulator.stop_simulator()
 
@@ -508,6 +613,11 @@ class RegressionManager:
         # clean up write scheduler
         cocotb._write_scheduler.stop_write_scheduler()
 
+        _flush_log()
+
+        if self._test_durations is not None and self._sim_failure is None:
+            self._record_test_duration(wall_time_s, sim_time_ns)
+
         # score test
         if self._test_outcome is not None:
             outcome = self._test_outcome
@@ -587,6 +697,24 @@ class RegressionManager:
         # continue test loop, assuming sim failure or not
         return self._execute()
 
+    def _record_test_duration(self, wall_time_s: float, sim_time_ns: float) -> None:
+        assert self._test_durations is not None
+        name = self._test.fullname
+        expected = self._test_durations.wall_time(name)
+        if (
+            expected is not None
+            and wall_time_s > expected * _SLOWDOWN_FACTOR
+            and wall_time_s - expected > _SLOWDOWN_MIN_S
+        ):
+            self.log.warning(
+                "%s took %.2f s, %.1f times the average of its previous runs of %.2f s",
+                name,
+                wall_time_s,
+                wall_time_s / expected,
+                expected,
+            )
+        self._test_durations.add(name, wall_time_s, sim_time_ns)
+
     def _get_lineno(self, test: Test) -> int:
         try:
             return inspect.getsourcelines(test.func)[1]
@@ -210,6 +210,19 @@ GPI_EXPORT const char *gpi_get_signal_value_binstr(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT const char *gpi_get_signal_value_str(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT double gpi_get_signal_value_real(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT long gpi_get_signal_value_long(gpi_sim_hdl gpi_hdl);
+
+// Get the value of a logic signal as packed 4-state bit planes.
+// Each plane is an array of (gpi_get_num_elems(gpi_hdl) + 31) / 32 words,
+// least significant word first, with the right-most element of the signal in
+// bit 0 of word 0. Each element is encoded in the (aval, bval) bits in the same
+// way as s_vpi_vecval: 0 = (0, 0), 1 = (1, 0), Z = (0, 1), X = (1, 1).
+// Returns 0 on success or non-zero if the value contains an element which
+// cannot be represented in 4 states (e.g. VHDL's U, W, L, H, and -). In that
+// case, if binstr is not NULL, *binstr is set to the value as a string of
+// binary char(s), as returned by gpi_get_signal_value_binstr(), so that the
+// value does not need to be read again.
+GPI_EXPORT int gpi_get_signal_value_vector(gpi_sim_hdl gpi_hdl, uint32_t *aval,
+                                           uint32_t *bval, const char **binstr);
 GPI_EXPORT const char *gpi_get_signal_name_str(gpi_sim_hdl gpi_hdl);
 GPI_EXPORT const char *gpi_get_signal_type_str(gpi_sim_hdl gpi_hdl);
 
@@ -237,6 +250,13 @@ GPI_EXPORT void gpi_set_signal_value_binstr(
 GPI_EXPORT void gpi_set_signal_value_str(
     gpi_sim_hdl gpi_hdl, const char *str,
     gpi_set_action_t action);  // String of ASCII char(s)
+// Set the value of a logic signal from packed 4-state bit planes in the format
+// described for gpi_get_signal_value_vector(). bval may be NULL if the value
+// contains only 0s and 1s.
+GPI_EXPORT void gpi_set_signal_value_vector(gpi_sim_hdl gpi_hdl,
+                                            const uint32_t *aval,
+                                            const uint32_t *bval,
+                                            gpi_set_action_t action);
 
 typedef enum gpi_edge {
     GPI_RISING,
@@ -257,6 +277,17 @@ GPI_EXPORT gpi_cb_hdl gpi_register_timed_callback(int (*gpi_function)(void *),
 GPI_EXPORT gpi_cb_hdl gpi_register_value_change_callback(
     int (*gpi_function)(void *), void *gpi_cb_data, gpi_sim_hdl gpi_hdl,
     gpi_edge_e edge);
+// Like gpi_register_value_change_callback(), for callback functions which get
+// the value of the signal with gpi_get_callback_value_binstr(). The simulator
+// may then pass the value with the callback, so it isn't read again.
+GPI_EXPORT gpi_cb_hdl gpi_register_value_change_binstr_callback(
+    int (*gpi_function)(void *), void *gpi_cb_data, gpi_sim_hdl gpi_hdl,
+    gpi_edge_e edge);
+// Like gpi_register_value_change_callback(), but the callback function is only
+// called once the edge has been seen num_edges times.
+GPI_EXPORT gpi_cb_hdl gpi_register_edge_count_callback(
+    int (*gpi_function)(void *), void *gpi_cb_data, gpi_sim_hdl gpi_hdl,
+    gpi_edge_e edge, uint64_t num_edges);
 GPI_EXPORT gpi_cb_hdl
 gpi_register_readonly_callback(int (*gpi_function)(void *), void *gpi_cb_data);
 GPI_EXPORT gpi_cb_hdl
@@ -273,6 +304,11 @@ GPI_EXPORT void gpi_deregister_callback(gpi_cb_hdl gpi_hdl);
 // callback data
 GPI_EXPORT void *gpi_get_callback_data(gpi_cb_hdl gpi_hdl);
 
+// Get the value of the signal of a value change callback, as a binary string,
+// at the time the callback fired. Only valid in the callback function.
+// Returns NULL if the callback is not a value change callback.
+GPI_EXPORT const char *gpi_get_callback_value_binstr(gpi_cb_hdl gpi_hdl);
+
 #ifdef __cplusplus
 }
 #endif
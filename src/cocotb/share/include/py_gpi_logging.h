@@ -18,6 +18,9 @@ extern "C" {
 
 PYGPILOG_EXPORT void py_gpi_logger_set_level(int level);
 
+// Forget which messages the filter function enabled, after log levels changed
+PYGPILOG_EXPORT void py_gpi_logger_clear_filter_cache();
+
 PYGPILOG_EXPORT void py_gpi_logger_initialize(PyObject* handler,
                                               PyObject* filter);
 
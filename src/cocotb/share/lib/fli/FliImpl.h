@@ -183,7 +183,8 @@ class FliSignalObjHdl : public GpiSignalObjHdl, public FliObj {
                    const std::string &fq_name) override;
     GpiCbHdl *register_value_change_callback(gpi_edge_e edge,
                                              int (*function)(void *),
-                                             void *cb_data) override;
+                                             void *cb_data,
+                                             bool want_value) override;
 
     bool is_variable() { return m_is_var; }
 
@@ -26,6 +26,10 @@
  * SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
  ******************************************************************************/
 
+#include <string.h>
+
+#include <algorithm>
+
 #include "gpi.h"
 #include "gpi_priv.h"
 
@@ -77,6 +81,57 @@ int GpiObjHdl::initialise(const std::string &name, const std::string &fq_name) {
     return 0;
 }
 
+int GpiSignalObjHdl::get_signal_value_vector(uint32_t *aval, uint32_t *bval,
+                                             const char **binstr_out) {
+    const char *binstr = get_signal_value_binstr();
+    size_t len = strlen(binstr);
+    size_t num_words = (static_cast<size_t>(get_num_elems()) + 31) / 32;
+
+    std::fill(aval, aval + num_words, 0);
+    std::fill(bval, bval + num_words, 0);
+
+    for (size_t i = 0; i < len && i < num_words * 32; i++) {
+        uint32_t mask = static_cast<uint32_t>(1) << (i % 32);
+        switch (binstr[len - 1 - i]) {
+            case '0':
+                break;
+            case '1':
+                aval[i / 32] |= mask;
+                break;
+            case 'z':
+            case 'Z':
+                bval[i / 32] |= mask;
+                break;
+            case 'x':
+            case 'X':
+                aval[i / 32] |= mask;
+                bval[i / 32] |= mask;
+                break;
+            default:
+                if (binstr_out) {
+                    *binstr_out = binstr;
+                }
+                return -1;
+        }
+    }
+    return 0;
+}
+
+int GpiSignalObjHdl::set_signal_value_vector(const uint32_t *aval,
+                                             const uint32_t *bval,
+                                             gpi_set_action_t action) {
+    static const char states[] = {'0', '1', 'Z', 'X'};
+    size_t len = static_cast<size_t>(get_num_elems());
+    std::string binstr(len, '0');
+
+    for (size_t i = 0; i < len; i++) {
+        uint32_t a = (aval[i / 32] >> (i % 32)) & 1;
+        uint32_t b = bval ? (bval[i / 32] >> (i % 32)) & 1 : 0;
+        binstr[len - 1 - i] = states[a | (b << 1)];
+    }
+    return set_signal_value_binstr(binstr, action);
+}
+
 void GpiCbHdl::set_call_state(gpi_cb_state_e new_state) { m_state = new_state; }
 
 gpi_cb_state_e GpiCbHdl::get_call_state() { return m_state; }
@@ -100,6 +155,12 @@ int GpiCbHdl::set_user_data(int (*_gpi_function)(void *), void *data) {
 GpiValueCbHdl::GpiValueCbHdl(GpiImplInterface *impl, GpiSignalObjHdl *signal,
                              gpi_edge_e edge)
     : GpiCbHdl(impl), m_signal(signal) {
+    set_edge(edge);
+}
+
+void GpiValueCbHdl::set_edge(gpi_edge_e edge) {
+    m_edges_remaining = 1;
+    m_value_valid = false;
     switch (edge) {
         case GPI_RISING: {
             required_value = "1";
@@ -116,23 +177,39 @@ GpiValueCbHdl::GpiValueCbHdl(GpiImplInterface *impl, GpiSignalObjHdl *signal,
     }
 }
 
+const char *GpiValueCbHdl::get_value_binstr() {
+    if (!m_value_valid) {
+        m_value = m_signal->get_signal_value_binstr();
+        m_value_valid = true;
+    }
+    return m_value.c_str();
+}
+
 int GpiValueCbHdl::run_callback() {
-    std::string current_value;
     bool pass = false;
 
     if (required_value == "X")
         pass = true;
     else {
-        current_value = m_signal->get_signal_value_binstr();
-        if (current_value == required_value) pass = true;
+        if (required_value == get_value_binstr()) pass = true;
+    }
+
+    // Keep waiting in C++ until enough edges have been seen
+    if (pass && m_edges_remaining > 1) {
+        m_edges_remaining--;
+        pass = false;
     }
 
     if (pass) {
         this->gpi_function(m_cb_data);
     } else {
-        cleanup_callback();
-        arm_callback();
+        // Value change callbacks are recurring, so stay registered with the
+        // simulator rather than removing and registering again
+        set_call_state(GPI_PRIMED);
     }
 
+    // The value is only valid while the callback is running
+    m_value_valid = false;
+
     return 0;
 }
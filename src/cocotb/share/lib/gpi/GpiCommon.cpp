@@ -478,6 +478,12 @@ long gpi_get_signal_value_long(gpi_sim_hdl sig_hdl) {
     return obj_hdl->get_signal_value_long();
 }
 
+int gpi_get_signal_value_vector(gpi_sim_hdl sig_hdl, uint32_t *aval,
+                                uint32_t *bval, const char **binstr) {
+    GpiSignalObjHdl *obj_hdl = static_cast<GpiSignalObjHdl *>(sig_hdl);
+    return obj_hdl->get_signal_value_vector(aval, bval, binstr);
+}
+
 const char *gpi_get_signal_name_str(gpi_sim_hdl sig_hdl) {
     GpiSignalObjHdl *obj_hdl = static_cast<GpiSignalObjHdl *>(sig_hdl);
     return obj_hdl->get_name_str();
@@ -522,6 +528,13 @@ void gpi_set_signal_value_str(gpi_sim_hdl sig_hdl, const char *str,
     obj_hdl->set_signal_value_str(value, action);
 }
 
+void gpi_set_signal_value_vector(gpi_sim_hdl sig_hdl, const uint32_t *aval,
+                                 const uint32_t *bval,
+                                 gpi_set_action_t action) {
+    GpiSignalObjHdl *obj_hdl = static_cast<GpiSignalObjHdl *>(sig_hdl);
+    obj_hdl->set_signal_value_vector(aval, bval, action);
+}
+
 void gpi_set_signal_value_real(gpi_sim_hdl sig_hdl, double value,
                                gpi_set_action_t action) {
     GpiSignalObjHdl *obj_hdl = static_cast<GpiSignalObjHdl *>(sig_hdl);
@@ -542,15 +555,14 @@ int gpi_get_range_dir(gpi_sim_hdl obj_hdl) {
     return static_cast<int>(obj_hdl->get_range_dir());
 }
 
-gpi_cb_hdl gpi_register_value_change_callback(int (*gpi_function)(void *),
-                                              void *gpi_cb_data,
-                                              gpi_sim_hdl sig_hdl,
-                                              gpi_edge_e edge) {
+static gpi_cb_hdl gpi_register_value_change_callback_(
+    int (*gpi_function)(void *), void *gpi_cb_data, gpi_sim_hdl sig_hdl,
+    gpi_edge_e edge, bool want_value) {
     GpiSignalObjHdl *signal_hdl = static_cast<GpiSignalObjHdl *>(sig_hdl);
 
     /* Do something based on int & GPI_RISING | GPI_FALLING */
     GpiCbHdl *gpi_hdl = signal_hdl->register_value_change_callback(
-        edge, gpi_function, gpi_cb_data);
+        edge, gpi_function, gpi_cb_data, want_value);
     if (!gpi_hdl) {
         LOG_ERROR("Failed to register a value change callback");
         return NULL;
@@ -559,6 +571,44 @@ gpi_cb_hdl gpi_register_value_change_callback(int (*gpi_function)(void *),
     }
 }
 
+gpi_cb_hdl gpi_register_value_change_callback(int (*gpi_function)(void *),
+                                              void *gpi_cb_data,
+                                              gpi_sim_hdl sig_hdl,
+                                              gpi_edge_e edge) {
+    return gpi_register_value_change_callback_(gpi_function, gpi_cb_data,
+                                               sig_hdl, edge, false);
+}
+
+gpi_cb_hdl gpi_register_value_change_binstr_callback(
+    int (*gpi_function)(void *), void *gpi_cb_data, gpi_sim_hdl sig_hdl,
+    gpi_edge_e edge) {
+    return gpi_register_value_change_callback_(gpi_function, gpi_cb_data,
+                                               sig_hdl, edge, true);
+}
+
+gpi_cb_hdl gpi_register_edge_count_callback(int (*gpi_function)(void *),
+                                            void *gpi_cb_data,
+                                            gpi_sim_hdl sig_hdl,
+                                            gpi_edge_e edge,
+                                            uint64_t num_edges) {
+    GpiCbHdl *gpi_hdl = gpi_register_value_change_callback(
+        gpi_function, gpi_cb_data, sig_hdl, edge);
+    if (!gpi_hdl) {
+        return NULL;
+    }
+
+    GpiValueCbHdl *value_cb_hdl = dynamic_cast<GpiValueCbHdl *>(gpi_hdl);
+    if (!value_cb_hdl) {
+        // LCOV_EXCL_START
+        LOG_ERROR("Value change callback does not support edge counting");
+        gpi_deregister_callback(gpi_hdl);
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+    value_cb_hdl->set_num_edges(num_edges);
+    return gpi_hdl;
+}
+
 gpi_cb_hdl gpi_register_timed_callback(int (*gpi_function)(void *),
                                        void *gpi_cb_data, uint64_t time) {
     // It should not matter which implementation we use for this so just pick
@@ -623,6 +673,17 @@ void *gpi_get_callback_data(gpi_cb_hdl cb_hdl) {
     return cb_hdl->get_user_data();
 }
 
+const char *gpi_get_callback_value_binstr(gpi_cb_hdl cb_hdl) {
+    GpiValueCbHdl *value_cb_hdl = dynamic_cast<GpiValueCbHdl *>(cb_hdl);
+    if (!value_cb_hdl) {
+        return NULL;
+    }
+    g_binstr = value_cb_hdl->get_value_binstr();
+    std::transform(g_binstr.begin(), g_binstr.end(), g_binstr.begin(),
+                   ::toupper);
+    return g_binstr.c_str();
+}
+
 const char *GpiImplInterface::get_name_c() { return m_name.c_str(); }
 
 const string &GpiImplInterface::get_name_s() { return m_name; }
@@ -155,6 +155,9 @@ class GPI_EXPORT GpiSignalObjHdl : public GpiObjHdl {
     virtual const char *get_signal_value_str() = 0;
     virtual double get_signal_value_real() = 0;
     virtual long get_signal_value_long() = 0;
+    // Default implementation converts the result of get_signal_value_binstr()
+    virtual int get_signal_value_vector(uint32_t *aval, uint32_t *bval,
+                                        const char **binstr);
 
     int m_length = 0;
 
@@ -166,12 +169,21 @@ class GPI_EXPORT GpiSignalObjHdl : public GpiObjHdl {
                                      gpi_set_action_t action) = 0;
     virtual int set_signal_value_binstr(std::string &value,
                                         gpi_set_action_t action) = 0;
+    // Default implementation converts to a binstr and calls
+    // set_signal_value_binstr()
+    virtual int set_signal_value_vector(const uint32_t *aval,
+                                        const uint32_t *bval,
+                                        gpi_set_action_t action);
     // virtual GpiCbHdl monitor_value(bool rising_edge) = 0; this was for the
     // triggers
     // but the explicit ones are probably better
 
+    // want_value: the callback function gets the value of the signal through
+    // GpiValueCbHdl::get_value_binstr(), so the implementation may have the
+    // simulator pass it with the callback
     virtual GpiCbHdl *register_value_change_callback(
-        gpi_edge_e edge, int (*gpi_function)(void *), void *gpi_cb_data) = 0;
+        gpi_edge_e edge, int (*gpi_function)(void *), void *gpi_cb_data,
+        bool want_value) = 0;
 };
 
 /* GPI Callback handle */
@@ -208,9 +220,22 @@ class GPI_EXPORT GpiValueCbHdl : public virtual GpiCbHdl {
                   gpi_edge_e edge);
     int run_callback() override;
 
+    // Reset the edge to wait for, so a cached callback can be re-armed
+    void set_edge(gpi_edge_e edge);
+
+    // Number of edges to wait for before calling the callback function
+    void set_num_edges(uint64_t num_edges) { m_edges_remaining = num_edges; }
+
+    // Value of the signal as a binary string when the callback fired,
+    // read from the signal unless the implementation captured it
+    const char *get_value_binstr();
+
   protected:
     std::string required_value;
     GpiSignalObjHdl *m_signal;
+    uint64_t m_edges_remaining = 1;
+    std::string m_value;
+    bool m_value_valid = false;
 };
 
 class GPI_EXPORT GpiIterator : public GpiHdl {
@@ -7,9 +7,12 @@
 #include <gpi_logging.h>     // all things GPI logging
 #include <py_gpi_logging.h>  // this library
 
-#include <cstdarg>  // va_list, va_copy, va_end
-#include <cstdio>   // fprintf, vsnprintf
-#include <vector>   // std::vector
+#include <atomic>         // std::atomic
+#include <cstdarg>        // va_list, va_copy, va_end
+#include <cstdio>         // fprintf, vsnprintf
+#include <string>         // std::string
+#include <unordered_map>  // std::unordered_map
+#include <vector>         // std::vector
 
 static PyObject *pLogHandler = nullptr;
 
@@ -17,6 +20,61 @@ static PyObject *pLogFilter = nullptr;
 
 static int py_gpi_log_level = GPIInfo;
 
+// Results of the filter function by logger name and level, so that disabled
+// messages don't call into Python. Cleared when the generation is bumped by
+// py_gpi_logger_clear_filter_cache(), which cocotb does when the level of one
+// of its loggers changes, or when the level of the root logger or
+// logging.disable() changes, which are checked on each use.
+static std::unordered_map<std::string, std::unordered_map<int, bool>>
+    filter_cache;
+static unsigned filter_cache_generation = 0;
+static std::atomic<unsigned> filter_generation{0};
+
+static PyObject *pLogRoot = nullptr;
+static PyObject *pLogManager = nullptr;
+static PyObject *pLevelAttr = nullptr;
+static PyObject *pDisableAttr = nullptr;
+static long filter_cache_root_level = -1;
+static long filter_cache_disable = -1;
+
+static long get_long_attr(PyObject *obj, PyObject *attr) {
+    // Returns -1 with the Python exception printed on failure
+    PyObject *value = PyObject_GetAttr(obj, attr);  // New reference
+    if (value == NULL) {
+        // LCOV_EXCL_START
+        PyErr_Print();
+        return -1;
+        // LCOV_EXCL_STOP
+    }
+    long res = PyLong_AsLong(value);
+    Py_DECREF(value);
+    if (res == -1 && PyErr_Occurred()) {
+        // LCOV_EXCL_START
+        PyErr_Print();
+        // LCOV_EXCL_STOP
+    }
+    return res;
+}
+
+static void validate_filter_cache() {
+    // Must be called with the GIL held
+    unsigned generation = filter_generation.load();
+    long root_level = -1;
+    long disable = -1;
+    if (pLogRoot && pLogManager) {
+        root_level = get_long_attr(pLogRoot, pLevelAttr);
+        disable = get_long_attr(pLogManager, pDisableAttr);
+    }
+    if (generation != filter_cache_generation ||
+        root_level != filter_cache_root_level ||
+        disable != filter_cache_disable || root_level < 0 || disable < 0) {
+        filter_cache.clear();
+        filter_cache_generation = generation;
+        filter_cache_root_level = root_level;
+        filter_cache_disable = disable;
+    }
+}
+
 static void fallback_handler(const char *name, int level, const char *pathname,
                              const char *funcname, long lineno,
                              const char *msg) {
@@ -27,6 +85,42 @@ static void fallback_handler(const char *name, int level, const char *pathname,
                           "while logging the above");
 }
 
+static bool py_gpi_log_filter(const char *name, int level) {
+    // Returns whether the message is enabled, true if the filter function
+    // failed with the Python exception printed
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    DEFER(PyGILState_Release(gstate));
+
+    validate_filter_cache();
+
+    auto &levels = filter_cache[name];
+    auto it = levels.find(level);
+    if (it != levels.end()) {
+        return it->second;
+    }
+
+    PyObject *filter_ret =
+        PyObject_CallFunction(pLogFilter, "si", name, level);  // New reference
+    if (filter_ret == NULL) {
+        // LCOV_EXCL_START
+        PyErr_Print();
+        return true;
+        // LCOV_EXCL_STOP
+    }
+
+    int is_enabled = PyObject_IsTrue(filter_ret);
+    Py_DECREF(filter_ret);
+    if (is_enabled < 0) {
+        // LCOV_EXCL_START
+        PyErr_Print();
+        return true;
+        // LCOV_EXCL_STOP
+    }
+
+    levels[level] = is_enabled;
+    return is_enabled;
+}
+
 static void py_gpi_log_handler(void *, const char *name, int level,
                                const char *pathname, const char *funcname,
                                long lineno, const char *msg, va_list argp) {
@@ -34,6 +128,11 @@ static void py_gpi_log_handler(void *, const char *name, int level,
         return;
     }
 
+    // check if log level is enabled
+    if (!py_gpi_log_filter(name, level)) {
+        return;
+    }
+
     va_list argp_copy;
     va_copy(argp_copy, argp);
     DEFER(va_end(argp_copy));
@@ -99,31 +198,6 @@ static void py_gpi_log_handler(void *, const char *name, int level,
     }
     DEFER(Py_DECREF(logger_name_arg));
 
-    // check if log level is enabled
-    PyObject *filter_ret = PyObject_CallFunctionObjArgs(
-        pLogFilter, logger_name_arg, level_arg, NULL);
-    if (filter_ret == NULL) {
-        // LCOV_EXCL_START
-        PyErr_Print();
-        return fallback_handler(name, level, pathname, funcname, lineno,
-                                log_buff.data());
-        // LCOV_EXCL_STOP
-    }
-
-    int is_enabled = PyObject_IsTrue(filter_ret);
-    Py_DECREF(filter_ret);
-    if (is_enabled < 0) {
-        // LCOV_EXCL_START
-        PyErr_Print();
-        return fallback_handler(name, level, pathname, funcname, lineno,
-                                log_buff.data());
-        // LCOV_EXCL_STOP
-    }
-
-    if (!is_enabled) {
-        return;
-    }
-
     PyObject *filename_arg = PyUnicode_FromString(pathname);  // New reference
     if (filename_arg == NULL) {
         // LCOV_EXCL_START
@@ -183,11 +257,35 @@ extern "C" void py_gpi_logger_set_level(int level) {
     gpi_native_logger_set_level(level);
 }
 
+extern "C" void py_gpi_logger_clear_filter_cache() { filter_generation++; }
+
 extern "C" void py_gpi_logger_initialize(PyObject *handler, PyObject *filter) {
     Py_INCREF(handler);
     Py_INCREF(filter);
     pLogHandler = handler;
     pLogFilter = filter;
+
+    // the filter cache is checked against logging.root.level and
+    // logging.root.manager.disable, which cocotb doesn't get notified of
+    pLevelAttr = PyUnicode_InternFromString("level");
+    pDisableAttr = PyUnicode_InternFromString("disable");
+    PyObject *logging_mod = PyImport_ImportModule("logging");  // New reference
+    if (logging_mod != NULL) {
+        pLogRoot = PyObject_GetAttrString(logging_mod, "root");
+        Py_DECREF(logging_mod);
+    }
+    if (pLogRoot != NULL) {
+        pLogManager = PyObject_GetAttrString(pLogRoot, "manager");
+    }
+    if (!pLevelAttr || !pDisableAttr || !pLogRoot || !pLogManager) {
+        // LCOV_EXCL_START
+        // without these, the filter cache is never used
+        PyErr_Print();
+        Py_CLEAR(pLogRoot);
+        Py_CLEAR(pLogManager);
+        // LCOV_EXCL_STOP
+    }
+    py_gpi_logger_clear_filter_cache();
     gpi_set_log_handler(py_gpi_log_handler, nullptr);
 }
 
@@ -195,6 +293,10 @@ extern "C" void py_gpi_logger_finalize() {
     gpi_clear_log_handler();
     Py_XDECREF(pLogHandler);
     Py_XDECREF(pLogFilter);
+    Py_CLEAR(pLogRoot);
+    Py_CLEAR(pLogManager);
+    Py_CLEAR(pLevelAttr);
+    Py_CLEAR(pDisableAttr);
 }
 
 PyObject *pEventFn = NULL;
@@ -38,9 +38,14 @@
 #include <cocotb_utils.h>    // to_python to_simulator
 #include <py_gpi_logging.h>  // py_gpi_logger_set_level
 
+#include <algorithm>
 #include <cerrno>
+#include <cstring>
 #include <limits>
+#include <string>
 #include <type_traits>
+#include <unordered_map>
+#include <vector>
 
 #include "gpi.h"
 
@@ -53,6 +58,13 @@
 
 #define MODULE_NAME "simulator"
 
+// Arbitrary large value, it's doubtful more than 256 callbacks will be
+// registered at any time
+static constexpr size_t PYTHON_CALLBACK_CACHE_SIZE = 256;
+
+// storage of released callback user data, re-used by the next registration
+static std::vector<void *> python_callback_free_list;
+
 // callback user data
 struct PythonCallback {
     PythonCallback(PyObject *func, PyObject *_args, PyObject *_kwargs)
@@ -70,6 +82,28 @@ struct PythonCallback {
     PyObject *function;    // Function to call when the callback fires
     PyObject *args;        // The arguments to call the function with
     PyObject *kwargs;      // Keyword arguments to call the function with
+    gpi_cb_hdl value_hdl =
+        nullptr;  // Value change callback whose value is passed to function
+    PyObject *py_hdl = nullptr;  // Python handle of the callback, if alive
+
+    // A callback is registered for every trigger, so take the storage from
+    // the cache instead of allocating
+    static void *operator new(size_t size) {
+        if (python_callback_free_list.empty()) {
+            return ::operator new(size);
+        }
+        void *ptr = python_callback_free_list.back();
+        python_callback_free_list.pop_back();
+        return ptr;
+    }
+
+    static void operator delete(void *ptr) {
+        if (python_callback_free_list.size() < PYTHON_CALLBACK_CACHE_SIZE) {
+            python_callback_free_list.push_back(ptr);
+        } else {
+            ::operator delete(ptr);
+        }
+    }
 };
 
 class GpiClock;
@@ -164,6 +198,30 @@ template <>
 PyTypeObject gpi_hdl_Object<gpi_cb_hdl>::py_type;
 template <>
 PyTypeObject gpi_hdl_Object<gpi_clk_hdl>::py_type;
+
+/**
+ * Create the Python handle of the callback *hdl* with user data *cb_data*.
+ *
+ * The GPI re-arms callback objects once they are released, so the handle is
+ * invalidated when the callback fires or is deregistered. A stale handle then
+ * can't deregister the callback its object was re-armed for.
+ */
+PyObject *gpi_cb_hdl_New(gpi_cb_hdl hdl, PythonCallback *cb_data) {
+    PyObject *obj = gpi_hdl_New(hdl);
+    if (obj != NULL && hdl != NULL) {
+        cb_data->py_hdl = obj;
+    }
+    return obj;
+}
+
+/** Detach the Python handle, if any, from the callback with *cb_data* */
+void invalidate_cb_hdl(PythonCallback *cb_data) {
+    if (cb_data->py_hdl) {
+        reinterpret_cast<gpi_hdl_Object<gpi_cb_hdl> *>(cb_data->py_hdl)->hdl =
+            nullptr;
+        cb_data->py_hdl = nullptr;
+    }
+}
 }  // namespace
 
 typedef int (*gpi_function_t)(void *);
@@ -199,6 +257,7 @@ int handle_gpi_callback(void *user_data) {
         return 1;
     }
     cb_data->id_value = COCOTB_INACTIVE_ID;
+    invalidate_cb_hdl(cb_data);
 
     PyGILState_STATE gstate = PyGILState_Ensure();
     DEFER(PyGILState_Release(gstate));
@@ -210,9 +269,42 @@ int handle_gpi_callback(void *user_data) {
         return 1;
     }
 
+    // Pass the value of the signal after the other arguments
+    PyObject *args = cb_data->args;
+    if (cb_data->value_hdl) {
+        const char *binstr = gpi_get_callback_value_binstr(cb_data->value_hdl);
+        Py_ssize_t numargs = PyTuple_Size(cb_data->args);
+        args = PyTuple_New(numargs + 1);
+        if (args == NULL) {
+            PyErr_Print();
+            gpi_sim_end();
+            return 0;
+        }
+        for (Py_ssize_t i = 0; i < numargs; ++i) {
+            PyObject *arg = PyTuple_GET_ITEM(cb_data->args, i);
+            Py_INCREF(arg);
+            PyTuple_SET_ITEM(args, i, arg);
+        }
+        PyObject *value = Py_None;
+        if (binstr) {
+            value = PyUnicode_FromString(binstr);
+            if (value == NULL) {
+                Py_DECREF(args);
+                PyErr_Print();
+                gpi_sim_end();
+                return 0;
+            }
+        } else {
+            Py_INCREF(value);
+        }
+        PyTuple_SET_ITEM(args, numargs, value);
+    } else {
+        Py_INCREF(args);
+    }
+    DEFER(Py_XDECREF(args));
+
     // Call the callback
-    PyObject *pValue =
-        PyObject_Call(cb_data->function, cb_data->args, cb_data->kwargs);
+    PyObject *pValue = PyObject_Call(cb_data->function, args, cb_data->kwargs);
 
     // If the return value is NULL a Python exception has occurred
     // The best thing to do here is shutdown as any subsequent
@@ -273,7 +365,7 @@ static PyObject *register_readonly_callback(PyObject *, PyObject *args) {
     gpi_cb_hdl hdl = gpi_register_readonly_callback(
         (gpi_function_t)handle_gpi_callback, cb_data);
 
-    PyObject *rv = gpi_hdl_New(hdl);
+    PyObject *rv = gpi_cb_hdl_New(hdl, cb_data);
 
     return rv;
 }
@@ -314,7 +406,7 @@ static PyObject *register_rwsynch_callback(PyObject *, PyObject *args) {
     gpi_cb_hdl hdl = gpi_register_readwrite_callback(
         (gpi_function_t)handle_gpi_callback, cb_data);
 
-    PyObject *rv = gpi_hdl_New(hdl);
+    PyObject *rv = gpi_cb_hdl_New(hdl, cb_data);
 
     return rv;
 }
@@ -355,7 +447,7 @@ static PyObject *register_nextstep_callback(PyObject *, PyObject *args) {
     gpi_cb_hdl hdl = gpi_register_nexttime_callback(
         (gpi_function_t)handle_gpi_callback, cb_data);
 
-    PyObject *rv = gpi_hdl_New(hdl);
+    PyObject *rv = gpi_cb_hdl_New(hdl, cb_data);
 
     return rv;
 }
@@ -416,7 +508,7 @@ static PyObject *register_timed_callback(PyObject *, PyObject *args) {
         (gpi_function_t)handle_gpi_callback, cb_data, time);
 
     // Check success
-    PyObject *rv = gpi_hdl_New(hdl);
+    PyObject *rv = gpi_cb_hdl_New(hdl, cb_data);
 
     return rv;
 }
@@ -475,7 +567,127 @@ static PyObject *register_value_change_callback(
         (gpi_function_t)handle_gpi_callback, cb_data, sig_hdl, edge);
 
     // Check success
-    PyObject *rv = gpi_hdl_New(hdl);
+    PyObject *rv = gpi_cb_hdl_New(hdl, cb_data);
+
+    return rv;
+}
+
+static PyObject *register_value_change_binstr_callback(PyObject *,
+                                                       PyObject *args) {
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    Py_ssize_t numargs = PyTuple_Size(args);
+
+    if (numargs < 3) {
+        PyErr_SetString(PyExc_TypeError,
+                        "Attempt to register value change callback without "
+                        "enough arguments!\n");
+        return NULL;
+    }
+
+    PyObject *pSigHdl = PyTuple_GetItem(args, 0);
+    if (Py_TYPE(pSigHdl) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+        PyErr_SetString(PyExc_TypeError,
+                        "First argument must be a gpi_sim_hdl");
+        return NULL;
+    }
+    gpi_sim_hdl sig_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+
+    // Extract the callback function
+    PyObject *function = PyTuple_GetItem(args, 1);
+    if (!PyCallable_Check(function)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "Attempt to register value change callback without "
+                        "passing a callable callback!\n");
+        return NULL;
+    }
+    Py_INCREF(function);
+
+    PyObject *pedge = PyTuple_GetItem(args, 2);
+    gpi_edge_e edge = (gpi_edge_e)PyLong_AsLong(pedge);
+
+    // Remaining args for function
+    PyObject *fArgs = PyTuple_GetSlice(args, 3, numargs);  // New reference
+    if (fArgs == NULL) {
+        return NULL;
+    }
+
+    PythonCallback *cb_data = new PythonCallback(function, fArgs, NULL);
+
+    gpi_cb_hdl hdl = gpi_register_value_change_binstr_callback(
+        (gpi_function_t)handle_gpi_callback, cb_data, sig_hdl, edge);
+    cb_data->value_hdl = hdl;
+
+    // Check success
+    PyObject *rv = gpi_cb_hdl_New(hdl, cb_data);
+
+    return rv;
+}
+
+static PyObject *register_edge_count_callback(PyObject *, PyObject *args) {
+    if (!gpi_has_registered_impl()) {
+        PyErr_SetString(PyExc_RuntimeError, "No simulator available!");
+        return NULL;
+    }
+
+    Py_ssize_t numargs = PyTuple_Size(args);
+
+    if (numargs < 4) {
+        PyErr_SetString(PyExc_TypeError,
+                        "Attempt to register edge count callback without "
+                        "enough arguments!\n");
+        return NULL;
+    }
+
+    PyObject *pSigHdl = PyTuple_GetItem(args, 0);
+    if (Py_TYPE(pSigHdl) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+        PyErr_SetString(PyExc_TypeError,
+                        "First argument must be a gpi_sim_hdl");
+        return NULL;
+    }
+    gpi_sim_hdl sig_hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)pSigHdl)->hdl;
+
+    // Extract the callback function
+    PyObject *function = PyTuple_GetItem(args, 1);
+    if (!PyCallable_Check(function)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "Attempt to register edge count callback without "
+                        "passing a callable callback!\n");
+        return NULL;
+    }
+
+    PyObject *pedge = PyTuple_GetItem(args, 2);
+    gpi_edge_e edge = (gpi_edge_e)PyLong_AsLong(pedge);
+
+    PyObject *pcount = PyTuple_GetItem(args, 3);
+    unsigned long long num_edges = PyLong_AsUnsignedLongLong(pcount);
+    if (num_edges == (unsigned long long)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (num_edges == 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Number of edges must be greater than 0");
+        return NULL;
+    }
+
+    // Remaining args for function
+    PyObject *fArgs = PyTuple_GetSlice(args, 4, numargs);  // New reference
+    if (fArgs == NULL) {
+        return NULL;
+    }
+
+    Py_INCREF(function);
+    PythonCallback *cb_data = new PythonCallback(function, fArgs, NULL);
+
+    gpi_cb_hdl hdl = gpi_register_edge_count_callback(
+        (gpi_function_t)handle_gpi_callback, cb_data, sig_hdl, edge,
+        (uint64_t)num_edges);
+
+    // Check success
+    PyObject *rv = gpi_cb_hdl_New(hdl, cb_data);
 
     return rv;
 }
@@ -551,6 +763,69 @@ static PyObject *get_signal_val_long(gpi_hdl_Object<gpi_sim_hdl> *self,
     return PyLong_FromLong(result);
 }
 
+// Serialize bit plane words as a tuple of little-endian bytes objects
+// ``(aval, bval)``, so that Python can use int.from_bytes() regardless of the
+// host byte order.
+static PyObject *vector_planes_to_py(const std::vector<uint32_t> &aval,
+                                     const std::vector<uint32_t> &bval) {
+    size_t num_words = aval.size();
+    std::vector<unsigned char> aval_bytes(num_words * 4);
+    std::vector<unsigned char> bval_bytes(num_words * 4);
+    for (size_t i = 0; i < num_words; i++) {
+        for (size_t j = 0; j < 4; j++) {
+            aval_bytes[i * 4 + j] =
+                static_cast<unsigned char>(aval[i] >> (8 * j));
+            bval_bytes[i * 4 + j] =
+                static_cast<unsigned char>(bval[i] >> (8 * j));
+        }
+    }
+
+    PyObject *aval_obj = PyBytes_FromStringAndSize(
+        reinterpret_cast<const char *>(aval_bytes.data()),
+        static_cast<Py_ssize_t>(aval_bytes.size()));
+    if (aval_obj == NULL) {
+        // LCOV_EXCL_START
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+    PyObject *bval_obj = PyBytes_FromStringAndSize(
+        reinterpret_cast<const char *>(bval_bytes.data()),
+        static_cast<Py_ssize_t>(bval_bytes.size()));
+    if (bval_obj == NULL) {
+        // LCOV_EXCL_START
+        Py_DECREF(aval_obj);
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+    return Py_BuildValue("(NN)", aval_obj, bval_obj);
+}
+
+static PyObject *get_signal_val_vector(gpi_hdl_Object<gpi_sim_hdl> *self,
+                                       PyObject *) {
+    size_t num_words =
+        (static_cast<size_t>(gpi_get_num_elems(self->hdl)) + 31) / 32;
+    std::vector<uint32_t> aval(num_words);
+    std::vector<uint32_t> bval(num_words);
+    const char *binstr = NULL;
+
+    if (gpi_get_signal_value_vector(self->hdl, aval.data(), bval.data(),
+                                    &binstr)) {
+        // Return the value that was read rather than making the caller read
+        // it again as a binstr.
+        if (binstr == NULL) {
+            // LCOV_EXCL_START
+            PyErr_SetString(
+                PyExc_RuntimeError,
+                "Simulator yielded a null pointer instead of binstr");
+            return NULL;
+            // LCOV_EXCL_STOP
+        }
+        return PyUnicode_FromString(binstr);
+    }
+
+    return vector_planes_to_py(aval, bval);
+}
+
 static PyObject *set_signal_val_binstr(gpi_hdl_Object<gpi_sim_hdl> *self,
                                        PyObject *args) {
     const char *binstr;
@@ -564,6 +839,67 @@ static PyObject *set_signal_val_binstr(gpi_hdl_Object<gpi_sim_hdl> *self,
     Py_RETURN_NONE;
 }
 
+// Parse the arguments of set_signal_val_vector() for hdl into bit plane words.
+// bval is left empty if the value only contains 0s and 1s.
+static bool parse_signal_val_vector(gpi_sim_hdl hdl, PyObject *args,
+                                    gpi_set_action_t *action,
+                                    std::vector<uint32_t> &aval,
+                                    std::vector<uint32_t> &bval) {
+    Py_buffer aval_buf;
+    Py_buffer bval_buf;
+    bval_buf.buf = NULL;
+
+    if (!PyArg_ParseTuple(args, "iy*|y*:set_signal_val_vector", action,
+                          &aval_buf, &bval_buf)) {
+        return false;
+    }
+    DEFER(PyBuffer_Release(&aval_buf));
+    DEFER(if (bval_buf.buf != NULL) PyBuffer_Release(&bval_buf));
+
+    size_t num_words = (static_cast<size_t>(gpi_get_num_elems(hdl)) + 31) / 32;
+    Py_ssize_t num_bytes = static_cast<Py_ssize_t>(num_words * 4);
+    if (aval_buf.len != num_bytes ||
+        (bval_buf.buf != NULL && bval_buf.len != num_bytes)) {
+        PyErr_Format(PyExc_ValueError,
+                     "set_signal_val_vector expected %zd bytes per plane",
+                     num_bytes);
+        return false;
+    }
+
+    // Deserialize the little-endian bytes into words.
+    const unsigned char *aval_bytes =
+        static_cast<const unsigned char *>(aval_buf.buf);
+    const unsigned char *bval_bytes =
+        static_cast<const unsigned char *>(bval_buf.buf);
+    aval.assign(num_words, 0);
+    bval.assign(bval_bytes != NULL ? num_words : 0, 0);
+    for (size_t i = 0; i < num_words; i++) {
+        for (size_t j = 0; j < 4; j++) {
+            aval[i] |= static_cast<uint32_t>(aval_bytes[i * 4 + j]) << (8 * j);
+            if (bval_bytes != NULL) {
+                bval[i] |= static_cast<uint32_t>(bval_bytes[i * 4 + j])
+                           << (8 * j);
+            }
+        }
+    }
+    return true;
+}
+
+static PyObject *set_signal_val_vector(gpi_hdl_Object<gpi_sim_hdl> *self,
+                                       PyObject *args) {
+    gpi_set_action_t action;
+    std::vector<uint32_t> aval;
+    std::vector<uint32_t> bval;
+
+    if (!parse_signal_val_vector(self->hdl, args, &action, aval, bval)) {
+        return NULL;
+    }
+
+    gpi_set_signal_value_vector(self->hdl, aval.data(),
+                                bval.empty() ? NULL : bval.data(), action);
+    Py_RETURN_NONE;
+}
+
 static PyObject *set_signal_val_str(gpi_hdl_Object<gpi_sim_hdl> *self,
                                     PyObject *args) {
     gpi_set_action_t action;
@@ -603,6 +939,595 @@ static PyObject *set_signal_val_int(gpi_hdl_Object<gpi_sim_hdl> *self,
     Py_RETURN_NONE;
 }
 
+// Get the binstr values of many signals in a single call.
+// The argument is a sequence of signal handles, the result is a single string
+// which is the concatenation of the binstr value of each signal in order.
+static PyObject *get_signal_vals_binstr(PyObject *, PyObject *args) {
+    PyObject *pHandles;
+
+    if (!PyArg_ParseTuple(args, "O:get_signal_vals_binstr", &pHandles)) {
+        return NULL;
+    }
+
+    PyObject *seq = PySequence_Fast(pHandles, "handles must be a sequence");
+    if (seq == NULL) {
+        return NULL;
+    }
+    DEFER(Py_DECREF(seq));
+
+    Py_ssize_t num_handles = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+
+    std::string result;
+    for (Py_ssize_t i = 0; i < num_handles; i++) {
+        if (Py_TYPE(items[i]) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+            PyErr_SetString(PyExc_TypeError,
+                            "handles must be a sequence of gpi_sim_hdl");
+            return NULL;
+        }
+        gpi_sim_hdl hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)items[i])->hdl;
+        const char *value = gpi_get_signal_value_binstr(hdl);
+        if (value == NULL) {
+            // LCOV_EXCL_START
+            PyErr_SetString(
+                PyExc_RuntimeError,
+                "Simulator yielded a null pointer instead of binstr");
+            return NULL;
+            // LCOV_EXCL_STOP
+        }
+        result += value;
+    }
+
+    return PyUnicode_FromStringAndSize(result.data(),
+                                       static_cast<Py_ssize_t>(result.size()));
+}
+
+// Get the values of many logic signals in a single call, as the bit planes of
+// their concatenation with the first signal as the most significant part.
+// The planes are returned as for get_signal_val_vector(), or the concatenated
+// binstr if any of the values can't be represented in 4 states.
+static PyObject *get_signal_vals_vector(PyObject *, PyObject *args) {
+    PyObject *pHandles;
+
+    if (!PyArg_ParseTuple(args, "O:get_signal_vals_vector", &pHandles)) {
+        return NULL;
+    }
+
+    PyObject *seq = PySequence_Fast(pHandles, "handles must be a sequence");
+    if (seq == NULL) {
+        return NULL;
+    }
+    DEFER(Py_DECREF(seq));
+
+    Py_ssize_t num_handles = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+
+    // Read every value first, the binstr is only needed if any of them is not
+    // 4-state.
+    std::vector<size_t> widths(static_cast<size_t>(num_handles));
+    std::vector<std::vector<uint32_t>> avals(static_cast<size_t>(num_handles));
+    std::vector<std::vector<uint32_t>> bvals(static_cast<size_t>(num_handles));
+    std::vector<std::string> binstrs(static_cast<size_t>(num_handles));
+    size_t total_width = 0;
+    bool all_4state = true;
+    for (Py_ssize_t i = 0; i < num_handles; i++) {
+        if (Py_TYPE(items[i]) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+            PyErr_SetString(PyExc_TypeError,
+                            "handles must be a sequence of gpi_sim_hdl");
+            return NULL;
+        }
+        gpi_sim_hdl hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)items[i])->hdl;
+        size_t n = static_cast<size_t>(i);
+        widths[n] = static_cast<size_t>(gpi_get_num_elems(hdl));
+        avals[n].assign((widths[n] + 31) / 32, 0);
+        bvals[n].assign((widths[n] + 31) / 32, 0);
+        const char *binstr = NULL;
+        if (gpi_get_signal_value_vector(hdl, avals[n].data(), bvals[n].data(),
+                                        &binstr)) {
+            if (binstr == NULL) {
+                // LCOV_EXCL_START
+                PyErr_SetString(
+                    PyExc_RuntimeError,
+                    "Simulator yielded a null pointer instead of binstr");
+                return NULL;
+                // LCOV_EXCL_STOP
+            }
+            binstrs[n] = binstr;
+            all_4state = false;
+        }
+        total_width += widths[n];
+    }
+
+    if (!all_4state) {
+        static const char states[] = {'0', '1', 'Z', 'X'};
+        std::string result;
+        result.reserve(total_width);
+        for (size_t n = 0; n < widths.size(); n++) {
+            if (!binstrs[n].empty()) {
+                result += binstrs[n];
+                continue;
+            }
+            for (size_t bit = widths[n]; bit-- > 0;) {
+                uint32_t a = (avals[n][bit / 32] >> (bit % 32)) & 1;
+                uint32_t b = (bvals[n][bit / 32] >> (bit % 32)) & 1;
+                result += states[a | (b << 1)];
+            }
+        }
+        return PyUnicode_FromStringAndSize(
+            result.data(), static_cast<Py_ssize_t>(result.size()));
+    }
+
+    // Shift each value into place, starting from the least significant part.
+    size_t num_words = (total_width + 31) / 32;
+    std::vector<uint32_t> aval(num_words, 0);
+    std::vector<uint32_t> bval(num_words, 0);
+    size_t offset = 0;
+    for (size_t n = widths.size(); n-- > 0;) {
+        size_t word = offset / 32;
+        size_t shift = offset % 32;
+        for (size_t w = 0; w < avals[n].size(); w++) {
+            aval[word + w] |= avals[n][w] << shift;
+            bval[word + w] |= bvals[n][w] << shift;
+            if (shift != 0 && word + w + 1 < num_words) {
+                aval[word + w + 1] |= avals[n][w] >> (32 - shift);
+                bval[word + w + 1] |= bvals[n][w] >> (32 - shift);
+            }
+        }
+        offset += widths[n];
+    }
+
+    return vector_planes_to_py(aval, bval);
+}
+
+// Parse the arguments of set_signal_vals_binstr() into the signal handles and
+// their binstr values.
+static bool parse_signal_vals_binstr(PyObject *args, gpi_set_action_t *action,
+                                     std::vector<gpi_sim_hdl> &hdls,
+                                     std::vector<std::string> &values) {
+    PyObject *pHandles;
+    PyObject *pValues;
+
+    if (!PyArg_ParseTuple(args, "iOO:set_signal_vals_binstr", action, &pHandles,
+                          &pValues)) {
+        return false;
+    }
+
+    PyObject *handles = PySequence_Fast(pHandles, "handles must be a sequence");
+    if (handles == NULL) {
+        return false;
+    }
+    DEFER(Py_DECREF(handles));
+
+    PyObject *pValuesFast =
+        PySequence_Fast(pValues, "values must be a sequence");
+    if (pValuesFast == NULL) {
+        return false;
+    }
+    DEFER(Py_DECREF(pValuesFast));
+
+    Py_ssize_t num_handles = PySequence_Fast_GET_SIZE(handles);
+    if (PySequence_Fast_GET_SIZE(pValuesFast) != num_handles) {
+        PyErr_SetString(PyExc_ValueError,
+                        "handles and values must be the same length");
+        return false;
+    }
+    PyObject **handle_items = PySequence_Fast_ITEMS(handles);
+    PyObject **value_items = PySequence_Fast_ITEMS(pValuesFast);
+
+    hdls.clear();
+    values.clear();
+    hdls.reserve(static_cast<size_t>(num_handles));
+    values.reserve(static_cast<size_t>(num_handles));
+    for (Py_ssize_t i = 0; i < num_handles; i++) {
+        if (Py_TYPE(handle_items[i]) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+            PyErr_SetString(PyExc_TypeError,
+                            "handles must be a sequence of gpi_sim_hdl");
+            return false;
+        }
+        if (!PyUnicode_Check(value_items[i])) {
+            PyErr_SetString(PyExc_TypeError,
+                            "values must be a sequence of str");
+            return false;
+        }
+        Py_ssize_t len;
+        const char *binstr = PyUnicode_AsUTF8AndSize(value_items[i], &len);
+        if (binstr == NULL) {
+            return false;
+        }
+        hdls.push_back(((gpi_hdl_Object<gpi_sim_hdl> *)handle_items[i])->hdl);
+        values.emplace_back(binstr, static_cast<size_t>(len));
+    }
+    return true;
+}
+
+// Set the binstr values of many signals in a single call.
+// Takes the action, a sequence of signal handles, and a sequence of binstr
+// values of the same length.
+static PyObject *set_signal_vals_binstr(PyObject *, PyObject *args) {
+    gpi_set_action_t action;
+    std::vector<gpi_sim_hdl> hdls;
+    std::vector<std::string> values;
+
+    // Everything is validated before writing so a bad argument doesn't result
+    // in a partially applied write.
+    if (!parse_signal_vals_binstr(args, &action, hdls, values)) {
+        return NULL;
+    }
+
+    for (size_t i = 0; i < hdls.size(); i++) {
+        gpi_set_signal_value_binstr(hdls[i], values[i].c_str(), action);
+    }
+
+    Py_RETURN_NONE;
+}
+
+// Get a sequence of signal handles as a vector, so that the handles of the
+// elements of an array are looked up once by the caller rather than on each
+// call.
+static bool parse_signal_hdls(PyObject *pHandles,
+                              std::vector<gpi_sim_hdl> &hdls) {
+    PyObject *seq = PySequence_Fast(pHandles, "handles must be a sequence");
+    if (seq == NULL) {
+        return false;
+    }
+    DEFER(Py_DECREF(seq));
+
+    Py_ssize_t num_handles = PySequence_Fast_GET_SIZE(seq);
+    PyObject **items = PySequence_Fast_ITEMS(seq);
+    hdls.reserve(static_cast<size_t>(num_handles));
+    for (Py_ssize_t i = 0; i < num_handles; i++) {
+        if (Py_TYPE(items[i]) != &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+            PyErr_SetString(PyExc_TypeError,
+                            "handles must be a sequence of gpi_sim_hdl");
+            return false;
+        }
+        hdls.push_back(((gpi_hdl_Object<gpi_sim_hdl> *)items[i])->hdl);
+    }
+    return true;
+}
+
+// Set the values of many logic signals from a buffer of little-endian words
+// of word_bytes bytes each, one word per signal.
+static PyObject *set_signal_vals_bytes(PyObject *, PyObject *args) {
+    gpi_set_action_t action;
+    PyObject *pHandles;
+    Py_ssize_t word_bytes;
+    Py_buffer data_buf;
+
+    if (!PyArg_ParseTuple(args, "iOny*:set_signal_vals_bytes", &action,
+                          &pHandles, &word_bytes, &data_buf)) {
+        return NULL;
+    }
+    DEFER(PyBuffer_Release(&data_buf));
+
+    std::vector<gpi_sim_hdl> hdls;
+    if (!parse_signal_hdls(pHandles, hdls)) {
+        return NULL;
+    }
+
+    if (word_bytes <= 0 ||
+        data_buf.len != static_cast<Py_ssize_t>(hdls.size()) * word_bytes) {
+        PyErr_Format(PyExc_ValueError,
+                     "data length %zd is not %zu words of %zd bytes",
+                     data_buf.len, hdls.size(), word_bytes);
+        return NULL;
+    }
+
+    const unsigned char *data =
+        static_cast<const unsigned char *>(data_buf.buf);
+    std::vector<uint32_t> aval;
+
+    for (size_t i = 0; i < hdls.size(); i++) {
+        size_t width = static_cast<size_t>(gpi_get_num_elems(hdls[i]));
+        size_t num_words = (width + 31) / 32;
+        aval.assign(num_words, 0);
+        const unsigned char *word = data + i * word_bytes;
+        size_t num_bytes =
+            std::min(static_cast<size_t>(word_bytes), num_words * 4);
+        for (size_t j = 0; j < num_bytes; j++) {
+            aval[j / 4] |= static_cast<uint32_t>(word[j]) << (8 * (j % 4));
+        }
+        if (width % 32 != 0) {
+            aval[num_words - 1] &= (UINT32_C(1) << (width % 32)) - 1;
+        }
+
+        gpi_set_signal_value_vector(hdls[i], aval.data(), NULL, action);
+    }
+
+    Py_RETURN_NONE;
+}
+
+// Get the values of many logic signals as a buffer of little-endian words of
+// word_bytes bytes each, one word per signal. Bits which are not 0 or 1 are
+// read as 0.
+static PyObject *get_signal_vals_bytes(PyObject *, PyObject *args) {
+    PyObject *pHandles;
+    Py_ssize_t word_bytes;
+
+    if (!PyArg_ParseTuple(args, "On:get_signal_vals_bytes", &pHandles,
+                          &word_bytes)) {
+        return NULL;
+    }
+
+    if (word_bytes <= 0) {
+        PyErr_SetString(PyExc_ValueError, "word size must be positive");
+        return NULL;
+    }
+
+    std::vector<gpi_sim_hdl> hdls;
+    if (!parse_signal_hdls(pHandles, hdls)) {
+        return NULL;
+    }
+
+    Py_ssize_t count = static_cast<Py_ssize_t>(hdls.size());
+    PyObject *result = PyBytes_FromStringAndSize(NULL, count * word_bytes);
+    if (result == NULL) {
+        // LCOV_EXCL_START
+        return NULL;
+        // LCOV_EXCL_STOP
+    }
+    unsigned char *data =
+        reinterpret_cast<unsigned char *>(PyBytes_AS_STRING(result));
+    memset(data, 0, static_cast<size_t>(count * word_bytes));
+    std::vector<uint32_t> aval;
+    std::vector<uint32_t> bval;
+
+    for (size_t i = 0; i < hdls.size(); i++) {
+        gpi_sim_hdl elem = hdls[i];
+        size_t width = static_cast<size_t>(gpi_get_num_elems(elem));
+        size_t num_words = (width + 31) / 32;
+        aval.assign(num_words, 0);
+        bval.assign(num_words, 0);
+        const char *binstr = NULL;
+        if (gpi_get_signal_value_vector(elem, aval.data(), bval.data(),
+                                        &binstr)) {
+            // value contains states other than 0, 1, X, and Z
+            if (binstr == NULL) {
+                // LCOV_EXCL_START
+                Py_DECREF(result);
+                PyErr_SetString(
+                    PyExc_RuntimeError,
+                    "Simulator yielded a null pointer instead of binstr");
+                return NULL;
+                // LCOV_EXCL_STOP
+            }
+            aval.assign(num_words, 0);
+            bval.assign(num_words, 0);
+            for (size_t bit = 0; bit < width; bit++) {
+                char c = binstr[width - 1 - bit];
+                if (c == '1' || c == 'H') {
+                    aval[bit / 32] |= UINT32_C(1) << (bit % 32);
+                }
+            }
+        }
+
+        unsigned char *word = data + i * word_bytes;
+        size_t num_bytes =
+            std::min(static_cast<size_t>(word_bytes), num_words * 4);
+        for (size_t j = 0; j < num_bytes; j++) {
+            uint32_t bits = aval[j / 4] & ~bval[j / 4];
+            word[j] = static_cast<unsigned char>(bits >> (8 * (j % 4)));
+        }
+    }
+
+    return result;
+}
+
+// A write queued by schedule_write(), applied by apply_scheduled_writes().
+// Writes done with the setters of this module are stored as the handles,
+// action, and values to write, other writes as the Python call to make.
+struct ScheduledWrite {
+    enum Kind { BINSTR, STR, INT, REAL, VECTOR, BINSTRS, CALL };
+
+    Kind kind;
+    // The handle or Python object the write is keyed on, or NULL if the write
+    // was superseded by a later write with the same key.
+    void *key;
+    gpi_set_action_t action;
+    std::vector<gpi_sim_hdl> hdls;
+    std::vector<std::string> strs;
+    int32_t int_value;
+    double real_value;
+    std::vector<uint32_t> aval;
+    std::vector<uint32_t> bval;
+    // Owned references, only set for BINSTRS and CALL writes
+    PyObject *key_obj;
+    PyObject *func;
+    PyObject *args;
+};
+
+// Pending writes, oldest to newest, and the index of the live write per key.
+static std::vector<ScheduledWrite> scheduled_writes;
+static std::vector<ScheduledWrite> applying_writes;
+static std::unordered_map<void *, size_t> scheduled_write_index;
+
+static void release_scheduled_write(ScheduledWrite &write) {
+    write.key = NULL;
+    Py_CLEAR(write.key_obj);
+    Py_CLEAR(write.func);
+    Py_CLEAR(write.args);
+}
+
+static int apply_scheduled_write(const ScheduledWrite &write) {
+    switch (write.kind) {
+        case ScheduledWrite::BINSTR:
+            gpi_set_signal_value_binstr(write.hdls[0], write.strs[0].c_str(),
+                                        write.action);
+            break;
+        case ScheduledWrite::STR:
+            gpi_set_signal_value_str(write.hdls[0], write.strs[0].c_str(),
+                                     write.action);
+            break;
+        case ScheduledWrite::INT:
+            gpi_set_signal_value_int(write.hdls[0], write.int_value,
+                                     write.action);
+            break;
+        case ScheduledWrite::REAL:
+            gpi_set_signal_value_real(write.hdls[0], write.real_value,
+                                      write.action);
+            break;
+        case ScheduledWrite::VECTOR:
+            gpi_set_signal_value_vector(
+                write.hdls[0], write.aval.data(),
+                write.bval.empty() ? NULL : write.bval.data(), write.action);
+            break;
+        case ScheduledWrite::BINSTRS:
+            for (size_t i = 0; i < write.hdls.size(); i++) {
+                gpi_set_signal_value_binstr(
+                    write.hdls[i], write.strs[i].c_str(), write.action);
+            }
+            break;
+        case ScheduledWrite::CALL: {
+            PyObject *res = PyObject_Call(write.func, write.args, NULL);
+            if (res == NULL) {
+                return -1;
+            }
+            Py_DECREF(res);
+            break;
+        }
+    }
+    return 0;
+}
+
+// Apply all pending writes, oldest to newest.
+// Returns -1 with a Python exception set if a CALL write raised, in which case
+// the remaining writes are discarded.
+static int apply_pending_writes() {
+    // Writes scheduled by CALL writes while applying are kept for the next
+    // call.
+    applying_writes.swap(scheduled_writes);
+    scheduled_write_index.clear();
+
+    int rc = 0;
+    for (auto &write : applying_writes) {
+        if (rc == 0 && write.key != NULL) {
+            rc = apply_scheduled_write(write);
+        }
+        release_scheduled_write(write);
+    }
+    applying_writes.clear();
+    return rc;
+}
+
+// Queue the write done by calling func(*args) until apply_scheduled_writes().
+// Only the last write with a given key is applied.
+static PyObject *schedule_write(PyObject *, PyObject *args) {
+    PyObject *key;
+    PyObject *func;
+    PyObject *pArgs;
+
+    if (!PyArg_ParseTuple(args, "OOO:schedule_write", &key, &func, &pArgs)) {
+        return NULL;
+    }
+
+    PyObject *func_args = PySequence_Tuple(pArgs);
+    if (func_args == NULL) {
+        return NULL;
+    }
+    DEFER(Py_DECREF(func_args));
+
+    ScheduledWrite write{};
+    write.kind = ScheduledWrite::CALL;
+    write.key = key;
+
+    // Store writes done with the setters of this module natively, so they can
+    // be applied without calling back into Python.
+    if (PyCFunction_Check(func)) {
+        PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+        PyObject *self = PyCFunction_GET_SELF(func);
+        if (self != NULL &&
+            Py_TYPE(self) == &gpi_hdl_Object<gpi_sim_hdl>::py_type) {
+            gpi_sim_hdl hdl = ((gpi_hdl_Object<gpi_sim_hdl> *)self)->hdl;
+            const char *str;
+            long long int_value;
+            if (meth == (PyCFunction)set_signal_val_binstr) {
+                if (!PyArg_ParseTuple(func_args, "is:set_signal_val_binstr",
+                                      &write.action, &str)) {
+                    return NULL;
+                }
+                write.kind = ScheduledWrite::BINSTR;
+                write.strs.emplace_back(str);
+            } else if (meth == (PyCFunction)set_signal_val_str) {
+                if (!PyArg_ParseTuple(func_args, "iy:set_signal_val_str",
+                                      &write.action, &str)) {
+                    return NULL;
+                }
+                write.kind = ScheduledWrite::STR;
+                write.strs.emplace_back(str);
+            } else if (meth == (PyCFunction)set_signal_val_int) {
+                if (!PyArg_ParseTuple(func_args, "iL:set_signal_val_int",
+                                      &write.action, &int_value)) {
+                    return NULL;
+                }
+                write.kind = ScheduledWrite::INT;
+                write.int_value = static_cast<int32_t>(int_value);
+            } else if (meth == (PyCFunction)set_signal_val_real) {
+                if (!PyArg_ParseTuple(func_args, "id:set_signal_val_real",
+                                      &write.action, &write.real_value)) {
+                    return NULL;
+                }
+                write.kind = ScheduledWrite::REAL;
+            } else if (meth == (PyCFunction)set_signal_val_vector) {
+                if (!parse_signal_val_vector(hdl, func_args, &write.action,
+                                             write.aval, write.bval)) {
+                    return NULL;
+                }
+                write.kind = ScheduledWrite::VECTOR;
+            }
+            if (write.kind != ScheduledWrite::CALL) {
+                write.key = hdl;
+                write.hdls.push_back(hdl);
+            }
+        } else if (meth == (PyCFunction)set_signal_vals_binstr) {
+            if (!parse_signal_vals_binstr(func_args, &write.action, write.hdls,
+                                          write.strs)) {
+                return NULL;
+            }
+            write.kind = ScheduledWrite::BINSTRS;
+        }
+    }
+
+    if (write.kind == ScheduledWrite::BINSTRS ||
+        write.kind == ScheduledWrite::CALL) {
+        // keep the key alive so its address isn't reused by another object
+        Py_INCREF(key);
+        write.key_obj = key;
+    }
+    if (write.kind == ScheduledWrite::CALL) {
+        Py_INCREF(func);
+        write.func = func;
+        Py_INCREF(func_args);
+        write.args = func_args;
+    }
+
+    auto it = scheduled_write_index.find(write.key);
+    if (it != scheduled_write_index.end()) {
+        release_scheduled_write(scheduled_writes[it->second]);
+        it->second = scheduled_writes.size();
+    } else {
+        scheduled_write_index.emplace(write.key, scheduled_writes.size());
+    }
+    scheduled_writes.push_back(std::move(write));
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *apply_scheduled_writes(PyObject *, PyObject *) {
+    if (apply_pending_writes() < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *clear_scheduled_writes(PyObject *, PyObject *) {
+    for (auto &write : scheduled_writes) {
+        release_scheduled_write(write);
+    }
+    scheduled_writes.clear();
+    scheduled_write_index.clear();
+    Py_RETURN_NONE;
+}
+
 static PyObject *get_definition_name(gpi_hdl_Object<gpi_sim_hdl> *self,
                                      PyObject *) {
     const char *result = gpi_get_definition_name(self->hdl);
@@ -779,16 +1704,34 @@ static PyObject *stop_simulator(PyObject *, PyObject *) {
 }
 
 static PyObject *deregister(gpi_hdl_Object<gpi_cb_hdl> *self, PyObject *) {
+    // the callback has already fired or been deregistered
+    gpi_cb_hdl hdl = self->hdl;
+    if (hdl == NULL) {
+        Py_RETURN_NONE;
+    }
+
     // cleanup uncalled callback
-    auto cb = static_cast<PythonCallback *>(gpi_get_callback_data(self->hdl));
+    auto cb = static_cast<PythonCallback *>(gpi_get_callback_data(hdl));
+    invalidate_cb_hdl(cb);
     delete cb;
 
     // deregister from interface
-    gpi_deregister_callback(self->hdl);
+    gpi_deregister_callback(hdl);
 
     Py_RETURN_NONE;
 }
 
+static void cb_hdl_dealloc(PyObject *self) {
+    // a callback which is still registered outlives its handle
+    gpi_cb_hdl hdl = ((gpi_hdl_Object<gpi_cb_hdl> *)self)->hdl;
+    if (hdl != NULL) {
+        auto cb = static_cast<PythonCallback *>(gpi_get_callback_data(hdl));
+        cb->py_hdl = nullptr;
+    }
+
+    Py_TYPE(self)->tp_free(self);
+}
+
 static PyObject *log_level(PyObject *, PyObject *args) {
     int l_level;
 
@@ -801,6 +1744,11 @@ static PyObject *log_level(PyObject *, PyObject *args) {
     Py_RETURN_NONE;
 }
 
+static PyObject *clear_log_filter_cache(PyObject *, PyObject *) {
+    py_gpi_logger_clear_filter_cache();
+    Py_RETURN_NONE;
+}
+
 static PyObject *initialize_logger(PyObject *, PyObject *args) {
     PyObject *log_func;
     PyObject *filter_func;
@@ -843,7 +1791,13 @@ class GpiClock {
     //  - EBUSY if the clock was already started (stop first)
     //  - EINVAL if the parameters are invalid
     //  - EAGAIN if registering the toggle callback failed
-    int start(uint64_t period_steps, uint64_t high_steps, bool start_high);
+    int start(uint64_t period_steps, uint64_t high_steps, bool start_high,
+              uint64_t phase_steps = 0, uint64_t jitter_steps = 0,
+              uint64_t seed = 0);
+
+    // Change the period and high time, effective from the next edge.
+    // Returns EINVAL if the parameters are invalid.
+    int set_period(uint64_t period_steps, uint64_t high_steps);
 
     int stop();
 
@@ -854,27 +1808,71 @@ class GpiClock {
     uint64_t period = 0;
     uint64_t t_high = 0;
 
+    // Each edge is moved from its ideal time by an offset drawn uniformly from
+    // [-jitter, jitter], so jitter does not accumulate over periods.
+    uint64_t jitter = 0;
+    uint64_t rng_state = 0;
+    int64_t last_offset = 0;
+
     int clk_val = 0;
 
+    static bool valid_timing(uint64_t period_steps, uint64_t high_steps,
+                             uint64_t jitter_steps);
+    int64_t next_jitter_offset();
     int toggle(bool initialSet);
     static int toggle_cb(void *gpi_clk);
+    static int start_cb(void *gpi_clk);
 };
 
-int GpiClock::start(uint64_t period_steps, uint64_t high_steps,
-                    bool start_high) {
+bool GpiClock::valid_timing(uint64_t period_steps, uint64_t high_steps,
+                            uint64_t jitter_steps) {
+    if ((period_steps < 2) || (high_steps < 1) ||
+        (high_steps >= period_steps)) {
+        return false;
+    }
+    // Edges must stay at least one step apart and in order.
+    uint64_t t_min = std::min(high_steps, period_steps - high_steps);
+    return jitter_steps <= (t_min - 1) / 2;
+}
+
+int GpiClock::start(uint64_t period_steps, uint64_t high_steps, bool start_high,
+                    uint64_t phase_steps, uint64_t jitter_steps,
+                    uint64_t seed) {
     if (clk_toggle_cb_hdl) {
         return EBUSY;
     }
-    if ((period_steps < 2) || (high_steps < 1) ||
-        (high_steps >= period_steps)) {
+    if (!valid_timing(period_steps, high_steps, jitter_steps)) {
         return EINVAL;
     }
 
     period = period_steps;
     t_high = high_steps;
+    jitter = jitter_steps;
+    rng_state = seed;
+    last_offset = 0;
 
     clk_val = start_high;
-    return toggle(true);
+    if (phase_steps == 0) {
+        return toggle(true);
+    }
+
+    clk_toggle_cb_hdl =
+        gpi_register_timed_callback(&GpiClock::start_cb, this, phase_steps);
+    if (!clk_toggle_cb_hdl) {
+        // LCOV_EXCL_START
+        return EAGAIN;
+        // LCOV_EXCL_STOP
+    }
+    return 0;
+}
+
+int GpiClock::set_period(uint64_t period_steps, uint64_t high_steps) {
+    if (!valid_timing(period_steps, high_steps, jitter)) {
+        return EINVAL;
+    }
+    period = period_steps;
+    t_high = high_steps;
+    return 0;
 }
 
 int GpiClock::stop() {
@@ -886,6 +1884,17 @@ int GpiClock::stop() {
     return 0;
 }
 
+int64_t GpiClock::next_jitter_offset() {
+    // splitmix64, matching cocotb.clock._jitter_offsets
+    rng_state += 0x9E3779B97F4A7C15ULL;
+    uint64_t z = rng_state;
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL;
+    z = z ^ (z >> 31);
+    return static_cast<int64_t>(z % (2 * jitter + 1)) -
+           static_cast<int64_t>(jitter);
+}
+
 int GpiClock::toggle(bool initialSet) {
     if (!initialSet) {
         clk_val = !clk_val;
@@ -893,6 +1902,12 @@ int GpiClock::toggle(bool initialSet) {
     gpi_set_signal_value_int(clk_signal, clk_val, GPI_DEPOSIT);
 
     uint64_t to_next_edge = clk_val ? t_high : (period - t_high);
+    if (jitter) {
+        int64_t offset = next_jitter_offset();
+        to_next_edge = static_cast<uint64_t>(
+            static_cast<int64_t>(to_next_edge) + offset - last_offset);
+        last_offset = offset;
+    }
 
     clk_toggle_cb_hdl =
         gpi_register_timed_callback(&GpiClock::toggle_cb, this, to_next_edge);
@@ -916,6 +1931,17 @@ int GpiClock::toggle_cb(void *gpi_clk) {
     return clk_obj->toggle(false);
 }
 
+int GpiClock::start_cb(void *gpi_clk) {
+    GpiClock *clk_obj = (GpiClock *)gpi_clk;
+    int ret = clk_obj->toggle(true);
+    if (ret) {
+        // LCOV_EXCL_START
+        LOG_ERROR("Clock will be stopped: failed to register toggle cb");
+        // LCOV_EXCL_STOP
+    }
+    return ret;
+}
+
 // Create a new clock object
 static PyObject *clock_create(PyObject *, PyObject *args) {
     if (!gpi_has_registered_impl()) {
@@ -970,12 +1996,14 @@ static void clock_dealloc(PyObject *self) {
 static PyObject *clk_start(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *args) {
     unsigned long long period, t_high;
     int start_high;
+    unsigned long long phase = 0, jitter = 0, seed = 0;
 
-    if (!PyArg_ParseTuple(args, "KKp:start", &period, &t_high, &start_high)) {
+    if (!PyArg_ParseTuple(args, "KKp|KKK:start", &period, &t_high, &start_high,
+                          &phase, &jitter, &seed)) {
         return NULL;
     }
 
-    int ret = self->hdl->start(period, t_high, start_high);
+    int ret = self->hdl->start(period, t_high, start_high, phase, jitter, seed);
 
     if (ret != 0) {
         if (ret == EINVAL) {
@@ -995,6 +2023,23 @@ static PyObject *clk_start(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *args) {
     Py_RETURN_NONE;
 }
 
+static PyObject *clk_set_period(gpi_hdl_Object<gpi_clk_hdl> *self,
+                                PyObject *args) {
+    unsigned long long period, t_high;
+
+    if (!PyArg_ParseTuple(args, "KK:set_period", &period, &t_high)) {
+        return NULL;
+    }
+
+    if (self->hdl->set_period(period, t_high) != 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Failed to set clock period: invalid arguments!\n");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
 static PyObject *clk_stop(gpi_hdl_Object<gpi_clk_hdl> *self, PyObject *) {
     self->hdl->stop();
 
@@ -1110,6 +2155,31 @@ static PyMethodDef SimulatorMethods[] = {
                "cocotb.simulator.gpi_sim_hdl, func: Callable[..., Any], edge: "
                "int, *args: Any) -> cocotb.simulator.gpi_cb_hdl\n"
                "Register a signal change callback.")},
+    {"register_value_change_binstr_callback",
+     register_value_change_binstr_callback, METH_VARARGS,
+     PyDoc_STR(
+         "register_value_change_binstr_callback(signal, func, edge, /, "
+         "*args)\n"
+         "--\n\n"
+         "register_value_change_binstr_callback(signal: "
+         "cocotb.simulator.gpi_sim_hdl, func: Callable[..., Any], edge: "
+         "int, *args: Any) -> cocotb.simulator.gpi_cb_hdl\n"
+         "Register a signal change callback which passes the value of the "
+         "signal to *func*.\n\n"
+         "The value is passed as a binary string after *args*, as the "
+         "simulator gave it to the callback where supported.\n\n"
+         ".. versionadded:: 2.0")},
+    {"register_edge_count_callback", register_edge_count_callback, METH_VARARGS,
+     PyDoc_STR("register_edge_count_callback(signal, func, edge, count, /, "
+               "*args)\n"
+               "--\n\n"
+               "register_edge_count_callback(signal: "
+               "cocotb.simulator.gpi_sim_hdl, func: Callable[..., Any], edge: "
+               "int, count: int, *args: Any) -> cocotb.simulator.gpi_cb_hdl\n"
+               "Register a callback for after *count* edges of a signal.\n\n"
+               "The edges are counted in the GPI, so *func* is only called "
+               "once.\n\n"
+               ".. versionadded:: 2.0")},
     {"register_readonly_callback", register_readonly_callback, METH_VARARGS,
      PyDoc_STR("register_readonly_callback(func, /, *args)\n"
                "--\n\n"
@@ -1139,6 +2209,16 @@ static PyMethodDef SimulatorMethods[] = {
                "--\n\n"
                "log_level(level: int) -> None\n"
                "Set the log level for GPI.")},
+    {"clear_log_filter_cache", clear_log_filter_cache, METH_NOARGS,
+     PyDoc_STR("clear_log_filter_cache()\n"
+               "--\n\n"
+               "clear_log_filter_cache() -> None\n"
+               "Forget which log messages the filter function given to "
+               ":func:`initialize_logger` enabled.\n\n"
+               "The GPI logger only calls the filter function once for each "
+               "logger name and level, so this must be called when log levels "
+               "change.\n\n"
+               ".. versionadded:: 2.0")},
     {"is_running", is_running, METH_NOARGS,
      PyDoc_STR("is_running()\n"
                "--\n\n"
@@ -1172,6 +2252,82 @@ static PyMethodDef SimulatorMethods[] = {
                "--\n\n"
                "get_simulator_version() -> str\n"
                "Get the simulator's product version string.")},
+    {"get_signal_vals_binstr", get_signal_vals_binstr, METH_VARARGS,
+     PyDoc_STR("get_signal_vals_binstr(handles, /)\n"
+               "--\n\n"
+               "get_signal_vals_binstr(handles: "
+               "Sequence[cocotb.simulator.gpi_sim_hdl]) -> str\n"
+               "Get the values of many logic signals as a single string of "
+               "(``0``, ``1``, ``X``, etc.), which is the concatenation of the "
+               "value of each signal in order.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
+    {"get_signal_vals_bytes", get_signal_vals_bytes, METH_VARARGS,
+     PyDoc_STR("get_signal_vals_bytes(handles, word_bytes, /)\n"
+               "--\n\n"
+               "get_signal_vals_bytes(handles: "
+               "Sequence[cocotb.simulator.gpi_sim_hdl], word_bytes: int) -> "
+               "bytes\n"
+               "Get the values of many logic signals as little-endian words "
+               "of *word_bytes* bytes each, one word per signal in order.\n\n"
+               "Bits which are not ``0`` or ``1`` are read as ``0``.\n\n"
+               ".. versionadded:: 2.0")},
+    {"get_signal_vals_vector", get_signal_vals_vector, METH_VARARGS,
+     PyDoc_STR("get_signal_vals_vector(handles, /)\n"
+               "--\n\n"
+               "get_signal_vals_vector(handles: "
+               "Sequence[cocotb.simulator.gpi_sim_hdl]) -> "
+               "Union[Tuple[bytes, bytes], str]\n"
+               "Get the values of many logic signals as the bit planes of the "
+               "concatenation of the value of each signal in order, "
+               "as :meth:`gpi_sim_hdl.get_signal_val_vector` does for one "
+               "signal.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
+    {"set_signal_vals_binstr", set_signal_vals_binstr, METH_VARARGS,
+     PyDoc_STR("set_signal_vals_binstr(action, handles, values, /)\n"
+               "--\n\n"
+               "set_signal_vals_binstr(action: int, handles: "
+               "Sequence[cocotb.simulator.gpi_sim_hdl], values: Sequence[str]"
+               ") -> None\n"
+               "Set the values of many logic signals, each using a string of "
+               "(``0``, ``1``, ``X``, etc.), one element per character.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
+    {"set_signal_vals_bytes", set_signal_vals_bytes, METH_VARARGS,
+     PyDoc_STR("set_signal_vals_bytes(action, handles, word_bytes, data, /)\n"
+               "--\n\n"
+               "set_signal_vals_bytes(action: int, handles: "
+               "Sequence[cocotb.simulator.gpi_sim_hdl], word_bytes: int, "
+               "data: Buffer) -> None\n"
+               "Set the values of many logic signals from a buffer of "
+               "little-endian words of *word_bytes* bytes each, one word per "
+               "signal in order.\n\n"
+               ".. versionadded:: 2.0")},
+    {"schedule_write", schedule_write, METH_VARARGS,
+     PyDoc_STR("schedule_write(key, func, args, /)\n"
+               "--\n\n"
+               "schedule_write(key: object, func: Callable[..., None], args: "
+               "Sequence[Any]) -> None\n"
+               "Queue the write done by ``func(*args)`` until "
+               ":func:`apply_scheduled_writes` is called.\n\n"
+               "Only the last write with the same *key* is applied, "
+               "writes are applied in the order they were last queued. "
+               "Writes done with the value setters of this module are stored "
+               "natively and applied without calling *func*.\n\n"
+               ".. versionadded:: 2.0")},
+    {"apply_scheduled_writes", apply_scheduled_writes, METH_NOARGS,
+     PyDoc_STR("apply_scheduled_writes()\n"
+               "--\n\n"
+               "apply_scheduled_writes() -> None\n"
+               "Apply the writes queued with :func:`schedule_write` now.\n\n"
+               ".. versionadded:: 2.0")},
+    {"clear_scheduled_writes", clear_scheduled_writes, METH_NOARGS,
+     PyDoc_STR("clear_scheduled_writes()\n"
+               "--\n\n"
+               "clear_scheduled_writes() -> None\n"
+               "Discard the writes queued with :func:`schedule_write`.\n\n"
+               ".. versionadded:: 2.0")},
     {"clock_create", clock_create, METH_VARARGS,
      PyDoc_STR("clock_create(signal, /)\n"
                "--\n\n"
@@ -1275,6 +2431,18 @@ static PyMethodDef gpi_sim_hdl_methods[] = {
                "get_signal_val_binstr() -> str\n"
                "Get the value of a logic vector signal as a string of (``0``, "
                "``1``, ``X``, etc.), one element per character.")},
+    {"get_signal_val_vector", (PyCFunction)get_signal_val_vector, METH_NOARGS,
+     PyDoc_STR("get_signal_val_vector($self)\n"
+               "--\n\n"
+               "get_signal_val_vector() -> Union[Tuple[bytes, bytes], str]\n"
+               "Get the value of a logic vector signal as a pair of "
+               "little-endian bit planes ``(aval, bval)``.\n\n"
+               "Each element is encoded as ``0`` = (0, 0), ``1`` = (1, 0), "
+               "``Z`` = (0, 1), and ``X`` = (1, 1). "
+               "If the value cannot be represented with only those four "
+               "states, returns it as a string as "
+               ":meth:`get_signal_val_binstr` does.\n\n"
+               ".. versionadded:: 2.0")},
     {"get_signal_val_real", (PyCFunction)get_signal_val_real, METH_NOARGS,
      PyDoc_STR("get_signal_val_real($self)\n"
                "--\n\n"
@@ -1285,6 +2453,16 @@ static PyMethodDef gpi_sim_hdl_methods[] = {
                "--\n\n"
                "set_signal_val_int(action: int, value: int) -> None\n"
                "Set the value of a signal using an int.")},
+    {"set_signal_val_vector", (PyCFunction)set_signal_val_vector, METH_VARARGS,
+     PyDoc_STR("set_signal_val_vector($self, action, aval, bval=None, /)\n"
+               "--\n\n"
+               "set_signal_val_vector(action: int, aval: bytes, bval: "
+               "Optional[bytes] = None) -> None\n"
+               "Set the value of a logic vector signal using little-endian "
+               "bit planes, as returned by :meth:`get_signal_val_vector`.\n\n"
+               "If *bval* is not given, the value only contains ``0`` and "
+               "``1``.\n\n"
+               ".. versionadded:: 2.0")},
     {"set_signal_val_str", (PyCFunction)set_signal_val_str, METH_VARARGS,
      PyDoc_STR("set_signal_val_str($self, action, value, /)\n"
                "--\n\n"
@@ -1398,7 +2576,9 @@ static PyMethodDef gpi_cb_hdl_methods[] = {
      PyDoc_STR("deregister($self)\n"
                "--\n\n"
                "deregister() -> None\n"
-               "De-register this callback.")},
+               "De-register this callback.\n"
+               "Does nothing if the callback has already fired or been "
+               "de-registered.")},
     {NULL, NULL, 0, NULL} /* Sentinel */
 };
 
@@ -1408,15 +2588,18 @@ PyTypeObject gpi_hdl_Object<gpi_cb_hdl>::py_type = []() -> PyTypeObject {
     type.tp_name = "cocotb.simulator.gpi_cb_hdl";
     type.tp_doc = "GPI callback handle";
     type.tp_methods = gpi_cb_hdl_methods;
+    type.tp_dealloc = cb_hdl_dealloc;
     return type;
 }();
 
 static PyMethodDef gpi_clk_methods[] = {
     {"start", (PyCFunction)clk_start, METH_VARARGS,
      PyDoc_STR(
-         "start($self, period_steps, high_steps, start_high)\n"
+         "start($self, period_steps, high_steps, start_high, phase_steps=0, "
+         "jitter_steps=0, seed=0)\n"
          "--\n\n"
-         "start(period_steps: int, high_steps: int, start_high: bool) -> None\n"
+         "start(period_steps: int, high_steps: int, start_high: bool, "
+         "phase_steps: int = 0, jitter_steps: int = 0, seed: int = 0) -> None\n"
          "Start this clock now.\n"
          "\n"
          "The clock will have a period of *period_steps* time steps, "
@@ -1425,15 +2608,39 @@ static PyMethodDef gpi_clk_methods[] = {
          "state, "
          "otherwise start at the beginning of the low state.\n"
          "\n"
+         "If *phase_steps* is given, the first edge is driven after that "
+         "many time steps rather than immediately. "
+         "If *jitter_steps* is given, each edge is moved from its ideal time "
+         "by a pseudo-random number of time steps in "
+         "``[-jitter_steps, jitter_steps]`` generated from *seed*.\n"
+         "\n"
          "Raises:\n"
          "    TypeError: If there are an incorrect number of arguments or "
          "they are of the wrong type.\n"
          "    ValueError: If *period_steps* and *high_steps* are such that in "
          "one "
          "period the duration of the low or high state would be less "
-         "than one time step, or *high_steps* is greater than *period_steps*.\n"
+         "than one time step, or *high_steps* is greater than *period_steps*, "
+         "or *jitter_steps* would allow edges to cross.\n"
          "    RuntimeError: If the clock was already started, or the "
-         "GPI callback could not be registered.")},
+         "GPI callback could not be registered.\n"
+         "\n"
+         ".. versionchanged:: 2.0\n"
+         "    Added the *phase_steps*, *jitter_steps*, and *seed* "
+         "arguments.")},
+    {"set_period", (PyCFunction)clk_set_period, METH_VARARGS,
+     PyDoc_STR("set_period($self, period_steps, high_steps)\n"
+               "--\n\n"
+               "set_period(period_steps: int, high_steps: int) -> None\n"
+               "Change the period and high time of this clock.\n"
+               "\n"
+               "The new timing takes effect from the next edge.\n"
+               "\n"
+               "Raises:\n"
+               "    ValueError: If the timing is invalid, as for "
+               ":meth:`start`.\n"
+               "\n"
+               ".. versionadded:: 2.0")},
     {"stop", (PyCFunction)clk_stop, METH_NOARGS,
      PyDoc_STR("stop($self)\n"
                "--\n\n"
@@ -27,6 +27,7 @@
 
 #include <assert.h>
 
+#include <algorithm>
 #include <cinttypes>  // fixed-size int types and format strings
 #include <limits>     // numeric_limits
 #include <stdexcept>
@@ -540,6 +541,63 @@ vhpiEnumT VhpiSignalObjHdl::chr2vhpi(const char value) {
     }
 }
 
+int VhpiLogicSignalObjHdl::get_signal_value_vector(uint32_t *aval,
+                                                   uint32_t *bval,
+                                                   const char **binstr) {
+    if (m_value.format != vhpiLogicVecVal) {
+        return GpiSignalObjHdl::get_signal_value_vector(aval, bval, binstr);
+    }
+
+    int ret = vhpi_get_value(GpiObjHdl::get_handle<vhpiHandleT>(), &m_value);
+    if (ret) {
+        // LCOV_EXCL_START
+        check_vhpi_error();
+        LOG_ERROR(
+            "VHPI: Size of m_value.value.enumvs was not large enough: req=%d "
+            "have=%d",
+            ret, m_value.bufSize);
+        return -1;
+        // LCOV_EXCL_STOP
+    }
+
+    int num_words = (m_num_elems + 31) / 32;
+    std::fill(aval, aval + num_words, 0);
+    std::fill(bval, bval + num_words, 0);
+
+    for (int i = 0; i < m_num_elems; i++) {
+        uint32_t mask = static_cast<uint32_t>(1) << (i % 32);
+        switch (m_value.value.enumvs[m_num_elems - i - 1]) {
+            case vhpi0:
+                break;
+            case vhpi1:
+                aval[i / 32] |= mask;
+                break;
+            case vhpiZ:
+                bval[i / 32] |= mask;
+                break;
+            case vhpiX:
+                aval[i / 32] |= mask;
+                bval[i / 32] |= mask;
+                break;
+            default:
+                if (binstr) {
+                    // render the value already read rather than reading it
+                    // again, in the order of the std_logic enumeration
+                    static const char states[] = "UX01ZWLH-";
+                    m_vector_binstr.resize(static_cast<size_t>(m_num_elems));
+                    for (int j = 0; j < m_num_elems; j++) {
+                        vhpiEnumT v = m_value.value.enumvs[j];
+                        m_vector_binstr[static_cast<size_t>(j)] =
+                            v <= vhpiDontCare ? states[v] : 'X';
+                    }
+                    *binstr = m_vector_binstr.c_str();
+                }
+                return -1;
+        }
+    }
+    return 0;
+}
+
 // Value related functions
 int VhpiLogicSignalObjHdl::set_signal_value(int32_t value,
                                             gpi_set_action_t action) {
@@ -625,6 +683,30 @@ int VhpiLogicSignalObjHdl::set_signal_value_binstr(std::string &value,
     return 0;
 }
 
+int VhpiLogicSignalObjHdl::set_signal_value_vector(const uint32_t *aval,
+                                                   const uint32_t *bval,
+                                                   gpi_set_action_t action) {
+    if (m_value.format != vhpiLogicVecVal) {
+        return GpiSignalObjHdl::set_signal_value_vector(aval, bval, action);
+    }
+
+    static const vhpiEnumT states[] = {vhpi0, vhpi1, vhpiZ, vhpiX};
+    for (int i = 0; i < m_num_elems; i++) {
+        uint32_t a = (aval[i / 32] >> (i % 32)) & 1;
+        uint32_t b = bval ? (bval[i / 32] >> (i % 32)) & 1 : 0;
+        m_value.value.enumvs[m_num_elems - i - 1] = states[a | (b << 1)];
+    }
+    m_value.numElems = m_num_elems;
+
+    if (vhpi_put_value(GpiObjHdl::get_handle<vhpiHandleT>(), &m_value,
+                       map_put_value_mode(action))) {
+        check_vhpi_error();
+        return -1;
+    }
+
+    return 0;
+}
+
 // Value related functions
 int VhpiSignalObjHdl::set_signal_value(int32_t value, gpi_set_action_t action) {
     switch (m_value.format) {
@@ -864,15 +946,28 @@ long VhpiSignalObjHdl::get_signal_value_long() {
 }
 
 GpiCbHdl *VhpiSignalObjHdl::register_value_change_callback(
-    gpi_edge_e edge, int (*function)(void *), void *cb_data) {
-    VhpiValueCbHdl *cb = new VhpiValueCbHdl(m_impl, this, edge);
+    gpi_edge_e edge, int (*function)(void *), void *cb_data, bool) {
+    // re-enable a cached callback instead of registering a new one
+    VhpiValueCbHdl *cb;
+    if (!m_value_cb_free_list.empty()) {
+        cb = m_value_cb_free_list.back();
+        m_value_cb_free_list.pop_back();
+        cb->set_edge(edge);
+    } else {
+        cb = new VhpiValueCbHdl(m_impl, this, edge);
+    }
     cb->set_user_data(function, cb_data);
     if (cb->arm_callback()) {
+        m_value_cb_free_list.push_back(cb);
         return NULL;
     }
     return cb;
 }
 
+void VhpiSignalObjHdl::put_value_callback(VhpiValueCbHdl *cb) {
+    m_value_cb_free_list.push_back(cb);
+}
+
 VhpiValueCbHdl::VhpiValueCbHdl(GpiImplInterface *impl, VhpiSignalObjHdl *sig,
                                gpi_edge_e edge)
     : GpiCbHdl(impl), VhpiCbHdl(impl), GpiValueCbHdl(impl, sig, edge) {
@@ -881,6 +976,18 @@ VhpiValueCbHdl::VhpiValueCbHdl(GpiImplInterface *impl, VhpiSignalObjHdl *sig,
     cb_data.obj = m_signal->get_handle<vhpiHandleT>();
 }
 
+int VhpiValueCbHdl::cleanup_callback() {
+    if (m_state == GPI_FREE) return 0;
+
+    VhpiCbHdl::cleanup_callback();
+
+    // put disabled callback back on the signal instead of leaking it
+    if (m_state == GPI_FREE) {
+        static_cast<VhpiSignalObjHdl *>(m_signal)->put_value_callback(this);
+    }
+    return 0;
+}
+
 VhpiStartupCbHdl::VhpiStartupCbHdl(GpiImplInterface *impl)
     : GpiCbHdl(impl), VhpiCbHdl(impl) {
     cb_data.reason = vhpiCbStartOfSimulation;
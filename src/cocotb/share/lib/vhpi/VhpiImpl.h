@@ -117,7 +117,7 @@ class VhpiValueCbHdl : public VhpiCbHdl, public GpiValueCbHdl {
   public:
     VhpiValueCbHdl(GpiImplInterface *impl, VhpiSignalObjHdl *sig,
                    gpi_edge_e edge);
-    int cleanup_callback() override { return VhpiCbHdl::cleanup_callback(); }
+    int cleanup_callback() override;
 
   private:
     std::string initial_value;
@@ -212,12 +212,17 @@ class VhpiSignalObjHdl : public GpiSignalObjHdl {
                    const std::string &fq_name) override;
     GpiCbHdl *register_value_change_callback(gpi_edge_e edge,
                                              int (*function)(void *),
-                                             void *cb_data) override;
+                                             void *cb_data,
+                                             bool want_value) override;
+    void put_value_callback(VhpiValueCbHdl *cb);
 
   protected:
     vhpiEnumT chr2vhpi(char value);
     vhpiValueT m_value;
     vhpiValueT m_binvalue;
+
+    /* Value change callbacks which have been disabled, ready to re-enable */
+    std::vector<VhpiValueCbHdl *> m_value_cb_free_list;
 };
 
 class VhpiLogicSignalObjHdl : public VhpiSignalObjHdl {
@@ -226,13 +231,23 @@ class VhpiLogicSignalObjHdl : public VhpiSignalObjHdl {
                           gpi_objtype_t objtype, bool is_const)
         : VhpiSignalObjHdl(impl, hdl, objtype, is_const) {}
 
+    int get_signal_value_vector(uint32_t *aval, uint32_t *bval,
+                                const char **binstr) override;
+
     using GpiSignalObjHdl::set_signal_value;
     int set_signal_value(int32_t value, gpi_set_action_t action) override;
     int set_signal_value_binstr(std::string &value,
                                 gpi_set_action_t action) override;
+    int set_signal_value_vector(const uint32_t *aval, const uint32_t *bval,
+                                gpi_set_action_t action) override;
 
     int initialise(const std::string &name,
                    const std::string &fq_name) override;
+
+  private:
+    // The value of the signal read by get_signal_value_vector() as a binstr,
+    // if it could not be represented in 4 states.
+    std::string m_vector_binstr;
 };
 
 class VhpiIterator : public GpiIterator {
@@ -119,6 +119,19 @@ int VpiCbHdl::cleanup_callback() {
     return 0;
 }
 
+/* Value change callbacks have the value of the signal formatted by the
+ * simulator, so it does not have to be read again by the edge check or the
+ * callback function.
+ */
+static int32_t handle_vpi_value_callback(p_cb_data cb_data) {
+    VpiValueCbHdl *cb_hdl =
+        static_cast<VpiValueCbHdl *>((VpiCbHdl *)cb_data->user_data);
+    if (cb_hdl && cb_data->value) {
+        cb_hdl->capture_value(cb_data->value);
+    }
+    return handle_vpi_callback(cb_data);
+}
+
 VpiValueCbHdl::VpiValueCbHdl(GpiImplInterface *impl, VpiSignalObjHdl *sig,
                              gpi_edge_e edge)
     : GpiCbHdl(impl), VpiCbHdl(impl), GpiValueCbHdl(impl, sig, edge) {
@@ -131,6 +144,24 @@ VpiValueCbHdl::VpiValueCbHdl(GpiImplInterface *impl, VpiSignalObjHdl *sig,
     cb_data.obj = m_signal->get_handle<vpiHandle>();
 }
 
+void VpiValueCbHdl::set_value_format(bool binstr) {
+    if (binstr && (m_signal->get_type() == GPI_LOGIC ||
+                   m_signal->get_type() == GPI_LOGIC_ARRAY)) {
+        m_vpi_value.format = vpiBinStrVal;
+        cb_data.cb_rtn = handle_vpi_value_callback;
+    } else {
+        m_vpi_value.format = vpiIntVal;
+        cb_data.cb_rtn = handle_vpi_callback;
+    }
+}
+
+void VpiValueCbHdl::capture_value(p_vpi_value value) {
+    if (value->format == vpiBinStrVal && value->value.str) {
+        m_value = value->value.str;
+        m_value_valid = true;
+    }
+}
+
 int VpiValueCbHdl::cleanup_callback() {
     if (m_state == GPI_FREE) return 0;
 
@@ -143,6 +174,9 @@ int VpiValueCbHdl::cleanup_callback() {
 
     m_obj_hdl = NULL;
     m_state = GPI_FREE;
+
+    // put callback back on the signal instead of leaking it
+    static_cast<VpiSignalObjHdl *>(m_signal)->put_value_callback(this);
     return 0;
 }
 
@@ -191,8 +225,15 @@ VpiTimedCbHdl::VpiTimedCbHdl(GpiImplInterface *impl, uint64_t time)
     cb_data.reason = cbAfterDelay;
 }
 
+void VpiTimedCbHdl::reset_time(uint64_t new_time) {
+    vpi_time.high = (uint32_t)(new_time >> 32);
+    vpi_time.low = (uint32_t)(new_time);
+}
+
 int VpiTimedCbHdl::cleanup_callback() {
     switch (m_state) {
+        case GPI_FREE:
+            return 0;
         case GPI_PRIMED:
             /* Issue #188: Work around for modelsim that is harmless to others
                too, we tag the time as delete, let it fire then do not pass up
@@ -206,8 +247,10 @@ int VpiTimedCbHdl::cleanup_callback() {
             break;
     }
     VpiCbHdl::cleanup_callback();
-    /* Return one so we delete this object */
-    return 1;
+    // put Timer back on cache instead of deleting
+    VpiImpl *impl = (VpiImpl *)m_impl;
+    impl->cache.put_timer(this);
+    return 0;
 }
 
 VpiReadWriteCbHdl::VpiReadWriteCbHdl(GpiImplInterface *impl)
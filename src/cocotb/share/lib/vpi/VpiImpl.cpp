@@ -657,7 +657,8 @@ GpiIterator *VpiImpl::iterate_handle(GpiObjHdl *obj_hdl,
 GpiCbHdl *VpiImpl::register_timed_callback(uint64_t time,
                                            int (*function)(void *),
                                            void *cb_data) {
-    VpiTimedCbHdl *hdl = new VpiTimedCbHdl(this, time);
+    // get timer from cache instead of allocating
+    VpiTimedCbHdl *hdl = cache.get_timer(time);
 
     if (hdl->arm_callback()) {
         delete (hdl);
@@ -689,14 +690,47 @@ GpiCbHdl *VpiImpl::register_nexttime_callback(int (*function)(void *),
 }
 
 int VpiImpl::deregister_callback(GpiCbHdl *gpi_hdl) {
+    vpi_remove_queued_callback(gpi_hdl);
+
+    return gpi_hdl->cleanup_callback();
+}
+
+void vpi_remove_queued_callback(GpiCbHdl *cb_hdl) {
 #ifndef VPI_NO_QUEUE_SETIMMEDIATE_CALLBACKS
-    auto it = std::find(cb_queue.begin(), cb_queue.end(), gpi_hdl);
-    if (it != cb_queue.end()) {
-        cb_queue.erase(it);
-    }
+    cb_queue.erase(std::remove(cb_queue.begin(), cb_queue.end(), cb_hdl),
+                   cb_queue.end());
+#else
+    (void)cb_hdl;
 #endif
+}
 
-    return gpi_hdl->cleanup_callback();
+VpiTimedCbHdl *VpiTimerCache::get_timer(uint64_t time) {
+    VpiTimedCbHdl *hdl;
+
+    if (!free_list.empty()) {
+        hdl = free_list.back();
+        free_list.pop_back();
+        // calls queued before the timer was released are stale
+        vpi_remove_queued_callback(hdl);
+        hdl->reset_time(time);
+    } else {
+        hdl = new VpiTimedCbHdl(impl, time);
+    }
+
+    return hdl;
+}
+
+static constexpr size_t VPI_TIMER_CACHE_SIZE =
+    256;  // Arbitrary large value, it's doubtful more than 256 simultaneous
+          // Timer triggers will be active at any time
+
+void VpiTimerCache::put_timer(VpiTimedCbHdl *hdl) {
+    // save VPI_TIMER_CACHE_SIZE Timer objects before deleting
+    if (free_list.size() < VPI_TIMER_CACHE_SIZE) {
+        free_list.push_back(hdl);
+    } else {
+        delete hdl;
+    }
 }
 
 // If the Python world wants things to shut down then unregister
@@ -782,8 +816,10 @@ int32_t handle_vpi_callback(p_cb_data cb_data) {
     reacting = true;
     int32_t ret = handle_vpi_callback_(cb_hdl);
     while (!cb_queue.empty()) {
-        handle_vpi_callback_(cb_queue.front());
+        // pop first, as the callback may remove queued calls
+        GpiCbHdl *queued_cb_hdl = cb_queue.front();
         cb_queue.pop_front();
+        handle_vpi_callback_(queued_cb_hdl);
     }
     reacting = false;
     return ret;
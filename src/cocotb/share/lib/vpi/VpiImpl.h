@@ -110,6 +110,13 @@ class VpiValueCbHdl : public VpiCbHdl, public GpiValueCbHdl {
                   gpi_edge_e edge);
     int cleanup_callback() override;
 
+    // Have the simulator pass the value as a binary string with the callback,
+    // or as an int as for edge triggers, which usually don't read it
+    void set_value_format(bool binstr);
+
+    // Keep the value handed over by the simulator for the callback
+    void capture_value(p_vpi_value value);
+
   private:
     s_vpi_value m_vpi_value;
 };
@@ -117,6 +124,7 @@ class VpiValueCbHdl : public VpiCbHdl, public GpiValueCbHdl {
 class VpiTimedCbHdl : public VpiCbHdl {
   public:
     VpiTimedCbHdl(GpiImplInterface *impl, uint64_t time);
+    void reset_time(uint64_t new_time);
     int cleanup_callback() override;
 };
 
@@ -183,6 +191,8 @@ class VpiSignalObjHdl : public GpiSignalObjHdl {
     const char *get_signal_value_str() override;
     double get_signal_value_real() override;
     long get_signal_value_long() override;
+    int get_signal_value_vector(uint32_t *aval, uint32_t *bval,
+                                const char **binstr) override;
 
     int set_signal_value(const int32_t value, gpi_set_action_t action) override;
     int set_signal_value(const double value, gpi_set_action_t action) override;
@@ -190,16 +200,24 @@ class VpiSignalObjHdl : public GpiSignalObjHdl {
                                 gpi_set_action_t action) override;
     int set_signal_value_str(std::string &value,
                              gpi_set_action_t action) override;
+    int set_signal_value_vector(const uint32_t *aval, const uint32_t *bval,
+                                gpi_set_action_t action) override;
 
     /* Value change callback accessor */
     int initialise(const std::string &name,
                    const std::string &fq_name) override;
     GpiCbHdl *register_value_change_callback(gpi_edge_e edge,
                                              int (*function)(void *),
-                                             void *cb_data) override;
+                                             void *cb_data,
+                                             bool want_value) override;
+
+    void put_value_callback(VpiValueCbHdl *cb);
 
   private:
     int set_signal_value(s_vpi_value value, gpi_set_action_t action);
+
+    /* Value change callbacks which have been cleaned up, ready to re-arm */
+    std::vector<VpiValueCbHdl *> m_value_cb_free_list;
 };
 
 class VpiIterator : public GpiIterator {
@@ -267,10 +285,30 @@ class VpiPackageIterator : public GpiIterator {
     vpiHandle m_iterator = nullptr;
 };
 
+// Drop the calls of cb_hdl queued for re-entrant callbacks, once it is
+// deregistered, or before it is re-armed for a new registration
+void vpi_remove_queued_callback(GpiCbHdl *cb_hdl);
+
+/** Cache of Timer callback objects, so they can be re-armed rather than
+ * allocated for every Timer.
+ */
+class VpiTimerCache {
+  public:
+    VpiTimerCache(GpiImplInterface *_impl) : impl(_impl) {}
+
+    VpiTimedCbHdl *get_timer(uint64_t time);
+    void put_timer(VpiTimedCbHdl *);
+
+  private:
+    std::vector<VpiTimedCbHdl *> free_list;
+    GpiImplInterface *impl;
+};
+
 class VpiImpl : public GpiImplInterface {
   public:
     VpiImpl(const std::string &name)
         : GpiImplInterface(name),
+          cache(this),
           m_read_write(this),
           m_next_phase(this),
           m_read_only(this) {}
@@ -312,6 +350,8 @@ class VpiImpl : public GpiImplInterface {
 
     const char *get_type_delimiter(GpiObjHdl *obj_hdl);
 
+    VpiTimerCache cache;
+
   private:
     /* Singleton callbacks */
     VpiReadWriteCbHdl m_read_write;
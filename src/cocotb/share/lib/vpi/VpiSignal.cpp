@@ -155,6 +155,40 @@ long VpiSignalObjHdl::get_signal_value_long() {
     return value_s.value.integer;
 }
 
+int VpiSignalObjHdl::get_signal_value_vector(uint32_t *aval, uint32_t *bval,
+                                             const char **binstr) {
+#ifdef GHDL
+    // GHDL does not support vpiVectorVal
+    return GpiSignalObjHdl::get_signal_value_vector(aval, bval, binstr);
+#else
+    s_vpi_value value_s = {vpiVectorVal, {NULL}};
+
+    vpi_get_value(GpiObjHdl::get_handle<vpiHandle>(), &value_s);
+    check_vpi_error();
+
+    if (value_s.value.vector == NULL) {
+        // LCOV_EXCL_START
+        return GpiSignalObjHdl::get_signal_value_vector(aval, bval, binstr);
+        // LCOV_EXCL_STOP
+    }
+
+    int num_words = (m_num_elems + 31) / 32;
+    for (int i = 0; i < num_words; i++) {
+        aval[i] = static_cast<uint32_t>(value_s.value.vector[i].aval);
+        bval[i] = static_cast<uint32_t>(value_s.value.vector[i].bval);
+    }
+
+    // Bits above the size of the signal are unspecified
+    int top_bits = m_num_elems % 32;
+    if (top_bits != 0) {
+        uint32_t mask = (static_cast<uint32_t>(1) << top_bits) - 1;
+        aval[num_words - 1] &= mask;
+        bval[num_words - 1] &= mask;
+    }
+    return 0;
+#endif
+}
+
 // Value related functions
 int VpiSignalObjHdl::set_signal_value(int32_t value, gpi_set_action_t action) {
     s_vpi_value value_s;
@@ -200,6 +234,29 @@ int VpiSignalObjHdl::set_signal_value_str(std::string &value,
     return set_signal_value(value_s, action);
 }
 
+int VpiSignalObjHdl::set_signal_value_vector(const uint32_t *aval,
+                                             const uint32_t *bval,
+                                             gpi_set_action_t action) {
+#ifdef GHDL
+    // GHDL does not support vpiVectorVal
+    return GpiSignalObjHdl::set_signal_value_vector(aval, bval, action);
+#else
+    s_vpi_value value_s;
+
+    std::vector<s_vpi_vecval> vector(
+        static_cast<size_t>((m_num_elems + 31) / 32));
+    for (size_t i = 0; i < vector.size(); i++) {
+        vector[i].aval = static_cast<PLI_INT32>(aval[i]);
+        vector[i].bval = bval ? static_cast<PLI_INT32>(bval[i]) : 0;
+    }
+
+    value_s.value.vector = vector.data();
+    value_s.format = vpiVectorVal;
+
+    return set_signal_value(value_s, action);
+#endif
+}
+
 int VpiSignalObjHdl::set_signal_value(s_vpi_value value_s,
                                       gpi_set_action_t action) {
     PLI_INT32 vpi_put_flag = -1;
@@ -253,11 +310,27 @@ int VpiSignalObjHdl::set_signal_value(s_vpi_value value_s,
 }
 
 GpiCbHdl *VpiSignalObjHdl::register_value_change_callback(
-    gpi_edge_e edge, int (*function)(void *), void *cb_data) {
-    VpiValueCbHdl *cb = new VpiValueCbHdl(this->m_impl, this, edge);
+    gpi_edge_e edge, int (*function)(void *), void *cb_data, bool want_value) {
+    // re-arm a cached callback instead of allocating
+    VpiValueCbHdl *cb;
+    if (!m_value_cb_free_list.empty()) {
+        cb = m_value_cb_free_list.back();
+        m_value_cb_free_list.pop_back();
+        // calls queued before the callback was released are stale
+        vpi_remove_queued_callback(cb);
+        cb->set_edge(edge);
+    } else {
+        cb = new VpiValueCbHdl(this->m_impl, this, edge);
+    }
+    cb->set_value_format(want_value);
     cb->set_user_data(function, cb_data);
     if (cb->arm_callback()) {
+        m_value_cb_free_list.push_back(cb);
         return NULL;
     }
     return cb;
 }
+
+void VpiSignalObjHdl::put_value_callback(VpiValueCbHdl *cb) {
+    m_value_cb_free_list.push_back(cb);
+}
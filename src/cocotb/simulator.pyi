@@ -4,7 +4,7 @@
 
 # generated with mypy's stubgen script
 
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
 DRIVERS: int
 ENUM: int
@@ -57,6 +57,7 @@ class gpi_sim_hdl:
     def get_signal_val_long(self) -> int: ...
     def get_signal_val_real(self) -> float: ...
     def get_signal_val_str(self) -> bytes: ...
+    def get_signal_val_vector(self) -> tuple[bytes, bytes] | str: ...
     def get_type(self) -> int: ...
     def get_type_string(self) -> str: ...
     def iterate(self, mode: int) -> gpi_iterator_hdl: ...
@@ -64,35 +65,70 @@ class gpi_sim_hdl:
     def set_signal_val_int(self, action: int, value: int) -> None: ...
     def set_signal_val_real(self, action: int, value: float) -> None: ...
     def set_signal_val_str(self, action: int, value: bytes) -> None: ...
+    def set_signal_val_vector(
+        self, action: int, aval: bytes, bval: bytes | None = None
+    ) -> None: ...
     def __eq__(self, other: object) -> bool: ...
     def __ne__(self, other: object) -> bool: ...
     def __hash__(self) -> int: ...
 
+def apply_scheduled_writes() -> None: ...
+def clear_log_filter_cache() -> None: ...
+def clear_scheduled_writes() -> None: ...
 def get_precision() -> int: ...
 def get_root_handle(name: str | None) -> gpi_sim_hdl | None: ...
 def get_sim_time() -> tuple[int, int]: ...
+def get_signal_vals_binstr(handles: Sequence[gpi_sim_hdl]) -> str: ...
+def get_signal_vals_bytes(handles: Sequence[gpi_sim_hdl], word_bytes: int) -> bytes: ...
+def get_signal_vals_vector(
+    handles: Sequence[gpi_sim_hdl],
+) -> tuple[bytes, bytes] | str: ...
+def schedule_write(
+    key: object, func: Callable[..., None], args: Sequence[Any]
+) -> None: ...
+def set_signal_vals_binstr(
+    action: int, handles: Sequence[gpi_sim_hdl], values: Sequence[str]
+) -> None: ...
+def set_signal_vals_bytes(
+    action: int, handles: Sequence[gpi_sim_hdl], word_bytes: int, data: Any
+) -> None: ...
 def get_simulator_product() -> str: ...
 def get_simulator_version() -> str: ...
 def is_running() -> bool: ...
 def log_level(level: int) -> None: ...
 def package_iterate() -> gpi_iterator_hdl: ...
+def register_edge_count_callback(
+    signal: gpi_sim_hdl, func: Callable[..., Any], edge: int, count: int, *args: Any
+) -> gpi_cb_hdl: ...
 def register_nextstep_callback(func: Callable[..., Any], *args: Any) -> gpi_cb_hdl: ...
 def register_readonly_callback(func: Callable[..., Any], *args: Any) -> gpi_cb_hdl: ...
 def register_rwsynch_callback(func: Callable[..., Any], *args: Any) -> gpi_cb_hdl: ...
 def register_timed_callback(
     time: int, func: Callable[..., Any], *args: Any
 ) -> gpi_cb_hdl: ...
+def register_value_change_binstr_callback(
+    signal: gpi_sim_hdl, func: Callable[..., Any], edge: int, *args: Any
+) -> gpi_cb_hdl: ...
 def register_value_change_callback(
     signal: gpi_sim_hdl, func: Callable[..., Any], edge: int, *args: Any
 ) -> gpi_cb_hdl: ...
 def stop_simulator() -> None: ...
 
-class cpp_clock:
+class GpiClock:
     def __init__(self, signal: gpi_sim_hdl) -> None: ...
-    def start(self, period_steps: int, high_steps: int, start_high: bool) -> None: ...
+    def start(
+        self,
+        period_steps: int,
+        high_steps: int,
+        start_high: bool,
+        phase_steps: int = 0,
+        jitter_steps: int = 0,
+        seed: int = 0,
+    ) -> None: ...
+    def set_period(self, period_steps: int, high_steps: int) -> None: ...
     def stop(self) -> None: ...
 
-def clock_create(hdl: gpi_sim_hdl) -> cpp_clock: ...
+def clock_create(hdl: gpi_sim_hdl) -> GpiClock: ...
 def initialize_logger(
     log_func: Callable[[str, int, str, int, str, str], None],
     filter_func: Callable[[str, int], bool],
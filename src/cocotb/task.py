@@ -17,6 +17,7 @@ from typing import (
     List,
     Optional,
     TypeVar,
+    Union,
 )
 
 import cocotb
@@ -80,7 +81,9 @@ class Task(Generic[ResultType]):
         self._coro: Coroutine = inst
         self._state: Task._State = Task._State.UNSTARTED
         self._outcome: Optional[Outcome[ResultType]] = None
-        self._trigger: Optional[cocotb.triggers.Trigger] = None
+        self._trigger: Optional[
+            Union[cocotb.triggers.Trigger, cocotb.triggers._TriggerGroup]
+        ] = None
         self._cancelled_error: Optional[CancelledError] = None
         self._done_callbacks: List[Callable[[Task[Any]], Any]] = []
 
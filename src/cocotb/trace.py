@@ -0,0 +1,301 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Recording of the value changes of selected simulation objects."""
+
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+from array import array
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import cocotb
+from cocotb import simulator
+from cocotb.handle import (
+    EnumObject,
+    IntegerObject,
+    LogicArrayObject,
+    LogicObject,
+    RealObject,
+    StringObject,
+    ValueObjectBase,
+)
+from cocotb.utils import _get_log_time_scale, _get_simulator_precision, _ldexp10
+
+_MAGIC = b"COCOTB-TRACE\n"
+_VERSION = 1
+
+_LE_U32 = struct.Struct("<I")
+_LE_I64 = struct.Struct("<q")
+_LE_F64 = struct.Struct("<d")
+
+_Chunk = Tuple[List[int], List[int], List[Any]]
+
+
+def _to_le(arr: "array[int]") -> bytes:
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_le(typecode: str, data: bytes) -> "array[int]":
+    arr = array(typecode, data)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr
+
+
+class TraceRecorder:
+    r"""Record the value changes of *handles* to a binary trace file.
+
+    Unlike waveform dumps made by the simulator,
+    only the simulation objects given are recorded, using value change callbacks.
+    The values are written out to *filename* in chunks of *chunk_size* value changes
+    by a background thread.
+
+    The recording starts with the current values of all *handles* when :meth:`start` is called,
+    and ends when :meth:`stop` is called.
+    The recorder can also be used as a context manager.
+
+    The trace file can be read back with :func:`read_trace`.
+
+    .. code-block:: python
+
+        with TraceRecorder("bus.trace", [dut.valid, dut.ready, dut.data]):
+            await ClockCycles(dut.clk, 1000)
+
+        for time, name, value in read_trace("bus.trace", units="ns"):
+            ...
+
+    Args:
+        filename: Path of the trace file to write.
+        handles: The simulation objects to record.
+            Supported are :class:`~cocotb.handle.LogicObject`, :class:`~cocotb.handle.LogicArrayObject`,
+            :class:`~cocotb.handle.IntegerObject`, :class:`~cocotb.handle.EnumObject`,
+            :class:`~cocotb.handle.RealObject` and :class:`~cocotb.handle.StringObject`.
+        chunk_size: Number of value changes held in memory before they are handed to the writer thread.
+
+    Raises:
+        TypeError: If any of *handles* is not a supported simulation object.
+
+    .. versionadded:: 2.0
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, "os.PathLike[str]"],
+        handles: Iterable[ValueObjectBase[Any, Any]],
+        chunk_size: int = 65536,
+    ) -> None:
+        self._filename = filename
+        self._handles = list(handles)
+        self._chunk_size = chunk_size
+        self._signals: List[Tuple[str, str, int]] = []
+        self._getters: List[Callable[[], Any]] = []
+        for handle in self._handles:
+            width = 0
+            if isinstance(handle, LogicObject):
+                kind = "logic"
+                width = 1
+                getter = handle._handle.get_signal_val_binstr
+            elif isinstance(handle, LogicArrayObject):
+                kind = "logic"
+                width = len(handle)
+                getter = handle._handle.get_signal_val_binstr
+            elif isinstance(handle, (IntegerObject, EnumObject)):
+                kind = "int"
+                getter = handle._handle.get_signal_val_long
+            elif isinstance(handle, RealObject):
+                kind = "real"
+                getter = handle._handle.get_signal_val_real
+            elif isinstance(handle, StringObject):
+                kind = "bytes"
+                getter = handle._handle.get_signal_val_str
+            else:
+                raise TypeError(
+                    f"Unable to record value changes of {type(handle).__qualname__} objects"
+                )
+            self._signals.append((handle._path, kind, width))
+            self._getters.append(getter)
+
+        self._cbhdls: List[Optional[simulator.gpi_cb_hdl]] = [None] * len(self._handles)
+        self._times: List[int] = []
+        self._ids: List[int] = []
+        self._values: List[Any] = []
+        self._chunks: queue.Queue[Optional[_Chunk]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Record the current values of the simulation objects and start recording their value changes."""
+        if self._thread is not None:
+            raise RuntimeError("Trace recording was already started")
+        header = json.dumps(
+            {
+                "version": _VERSION,
+                "precision": _get_simulator_precision(),
+                "signals": [
+                    {"name": name, "kind": kind, "width": width}
+                    for name, kind, width in self._signals
+                ],
+            }
+        ).encode()
+        f = open(self._filename, "wb")
+        f.write(_MAGIC)
+        f.write(_LE_U32.pack(len(header)))
+        f.write(header)
+        self._thread = threading.Thread(
+            target=self._write_chunks,
+            args=(f,),
+            name="cocotb trace writer",
+            daemon=True,
+        )
+        self._thread.start()
+        # write out the trace if the simulation ends while recording
+        cocotb._register_shutdown_callback(self.stop)
+
+        for index in range(len(self._handles)):
+            self._record(index)
+
+    def stop(self) -> None:
+        """Stop recording and write out the remaining value changes."""
+        if self._thread is None:
+            return
+        for index, cbhdl in enumerate(self._cbhdls):
+            if cbhdl is not None:
+                cbhdl.deregister()
+                self._cbhdls[index] = None
+        self._flush_chunk()
+        self._chunks.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "TraceRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def _record(self, index: int) -> None:
+        # value change callbacks only fire once, re-register before recording the new value
+        self._cbhdls[index] = simulator.register_value_change_callback(
+            self._handles[index]._handle,
+            self._record,
+            simulator.VALUE_CHANGE,
+            index,
+        )
+        timeh, timel = simulator.get_sim_time()
+        self._times.append(timeh << 32 | timel)
+        self._ids.append(index)
+        self._values.append(self._getters[index]())
+        if len(self._times) >= self._chunk_size:
+            self._flush_chunk()
+
+    def _flush_chunk(self) -> None:
+        if self._times:
+            self._chunks.put((self._times, self._ids, self._values))
+            self._times = []
+            self._ids = []
+            self._values = []
+
+    def _write_chunks(self, f: Any) -> None:
+        with f:
+            while True:
+                chunk = self._chunks.get()
+                if chunk is None:
+                    return
+                f.write(self._encode_chunk(chunk))
+
+    def _encode_chunk(self, chunk: _Chunk) -> bytes:
+        times, ids, values = chunk
+        blob = bytearray()
+        for index, value in zip(ids, values):
+            kind = self._signals[index][1]
+            if kind == "logic":
+                blob += value.encode("ascii")
+            elif kind == "int":
+                blob += _LE_I64.pack(value)
+            elif kind == "real":
+                blob += _LE_F64.pack(value)
+            else:
+                blob += _LE_U32.pack(len(value))
+                blob += value
+        return b"".join(
+            (
+                _LE_U32.pack(len(times)),
+                _to_le(array("Q", times)),
+                _to_le(array("I", ids)),
+                _LE_U32.pack(len(blob)),
+                blob,
+            )
+        )
+
+
+def read_trace(
+    filename: Union[str, "os.PathLike[str]"], units: str = "step"
+) -> Iterator[Tuple[Union[int, float], str, Any]]:
+    """Read back a trace file written by :class:`TraceRecorder`.
+
+    Yields a tuple of the time, the path of the simulation object and the value of each recorded value change, in order.
+    Values of :class:`~cocotb.handle.LogicObject` and :class:`~cocotb.handle.LogicArrayObject` objects
+    are given as strings of the values of the bits, e.g. ``"01XZ"``,
+    of :class:`~cocotb.handle.IntegerObject` and :class:`~cocotb.handle.EnumObject` objects as :class:`int`,
+    of :class:`~cocotb.handle.RealObject` objects as :class:`float`,
+    and of :class:`~cocotb.handle.StringObject` objects as :class:`bytes`.
+
+    Args:
+        filename: Path of the trace file.
+        units: String specifying the units of the times
+            (one of ``'step'``, ``'fs'``, ``'ps'``, ``'ns'``, ``'us'``, ``'ms'``, ``'sec'``).
+            ``'step'`` gives the times in the simulator time steps of the recording simulation.
+
+    Raises:
+        ValueError: If *filename* is not a trace file.
+
+    .. versionadded:: 2.0
+    """
+    with open(filename, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{filename} is not a cocotb trace file")
+        (header_len,) = _LE_U32.unpack(f.read(_LE_U32.size))
+        header = json.loads(f.read(header_len))
+        if header["version"] != _VERSION:
+            raise ValueError(
+                f"Unsupported trace file version {header['version']} in {filename}"
+            )
+        signals = [(s["name"], s["kind"], s["width"]) for s in header["signals"]]
+        exp = 0
+        if units != "step":
+            exp = header["precision"] - _get_log_time_scale(units)
+
+        while True:
+            count_bytes = f.read(_LE_U32.size)
+            if len(count_bytes) < _LE_U32.size:
+                return
+            (count,) = _LE_U32.unpack(count_bytes)
+            times = _from_le("Q", f.read(8 * count))
+            ids = _from_le("I", f.read(4 * count))
+            (blob_len,) = _LE_U32.unpack(f.read(_LE_U32.size))
+            blob = f.read(blob_len)
+
+            offset = 0
+            for time, index in zip(times, ids):
+                name, kind, width = signals[index]
+                if kind == "logic":
+                    value: Any = blob[offset : offset + width].decode("ascii")
+                    offset += width
+                elif kind == "int":
+                    (value,) = _LE_I64.unpack_from(blob, offset)
+                    offset += _LE_I64.size
+                elif kind == "real":
+                    (value,) = _LE_F64.unpack_from(blob, offset)
+                    offset += _LE_F64.size
+                else:
+                    (length,) = _LE_U32.unpack_from(blob, offset)
+                    offset += _LE_U32.size
+                    value = bytes(blob[offset : offset + length])
+                    offset += length
+                yield (time if exp == 0 else _ldexp10(time, exp)), name, value
@@ -40,8 +40,10 @@ from typing import (
     Callable,
     ClassVar,
     Coroutine,
+    Dict,
     Generator,
     Generic,
+    Iterable,
     List,
     Optional,
     Type,
@@ -56,12 +58,13 @@ import cocotb.task
 from cocotb import simulator
 from cocotb._deprecation import deprecated
 from cocotb._outcomes import Error, Outcome, Value
-from cocotb._py_compat import cached_property
+from cocotb._py_compat import cached_property, insertion_ordered_dict
 from cocotb._utils import (
     ParameterizedSingletonMetaclass,
     remove_traceback_frames,
     singleton,
 )
+from cocotb.types import Logic, LogicArray
 from cocotb.utils import get_sim_steps, get_time_from_sim_steps
 
 T = TypeVar("T")
@@ -439,6 +442,73 @@ class Edge(_EdgeBase):
         return signal
 
 
+class ValueChange(_EdgeBase):
+    """Fires on any value change of *signal*, keeping the new value in :attr:`value`.
+
+    Like :class:`Edge`, but the value is passed up with the value change callback,
+    as given by the simulator where supported,
+    so it does not have to be read from *signal* again.
+
+    .. code-block:: python
+
+        while True:
+            data = (await ValueChange(dut.data)).value
+
+    Args:
+        signal: The signal upon which to wait for a value change.
+
+    Raises:
+        TypeError: If *signal* is not a :class:`~cocotb.handle.LogicObject` or :class:`~cocotb.handle.LogicArrayObject`.
+
+    .. versionadded:: 2.0
+    """
+
+    _edge_type = simulator.VALUE_CHANGE
+
+    _value: Optional[Union[Logic, LogicArray]] = None
+
+    @property
+    def value(self) -> Union[Logic, LogicArray]:
+        """The value of *signal* when the trigger last fired, or its current value if the trigger hasn't fired yet.
+
+        All waiters on *signal* share the trigger, and the value is replaced each time it fires,
+        so read it right after the ``await``.
+        """
+        if self._value is None:
+            return self.signal.value
+        return self._value
+
+    @classmethod
+    def __singleton_key__(
+        cls,
+        signal: Union[cocotb.handle.LogicObject, cocotb.handle.LogicArrayObject],
+    ) -> Union[cocotb.handle.LogicObject, cocotb.handle.LogicArrayObject]:
+        if not isinstance(
+            signal, (cocotb.handle.LogicObject, cocotb.handle.LogicArrayObject)
+        ):
+            raise TypeError(
+                f"{cls.__qualname__} requires a LogicObject or LogicArrayObject. Got {signal!r} of type {type(signal).__qualname__}"
+            )
+        return signal
+
+    def _prime(self, callback: Callable[[Trigger], None]) -> None:
+        if self._cbhdl is None:
+            self._cbhdl = simulator.register_value_change_binstr_callback(
+                self.signal._handle, self._react, type(self)._edge_type, callback
+            )
+            if self._cbhdl is None:
+                raise RuntimeError(f"Unable set up {str(self)} Trigger")
+        # skip _EdgeBase._prime, which registers a callback without the value
+        super(_EdgeBase, self)._prime(callback)
+
+    def _react(self, callback: Callable[[Trigger], None], binstr: str) -> None:
+        if isinstance(self.signal, cocotb.handle.LogicObject):
+            self._value = Logic(binstr)
+        else:
+            self._value = LogicArray._from_handle(binstr)
+        callback(self)
+
+
 class _Event(Trigger):
     """Unique instance used by the Event object.
 
@@ -500,7 +570,8 @@ class Event:
     """
 
     def __init__(self, name: Optional[str] = None) -> None:
-        self._pending_events: List[_Event] = []
+        # dict used as an ordered set, for O(1) removal
+        self._pending_events: Dict[_Event, None] = insertion_ordered_dict()
         self.name: Optional[str] = name
         self._fired: bool = False
         self._data: Any = None
@@ -524,10 +595,10 @@ class Event:
     def _prime_trigger(
         self, trigger: _Event, callback: Callable[[Trigger], None]
     ) -> None:
-        self._pending_events.append(trigger)
+        self._pending_events[trigger] = None
 
     def _unprime_trigger(self, trigger: _Event) -> None:
-        self._pending_events.remove(trigger)
+        del self._pending_events[trigger]
 
     def set(self, data: Optional[Any] = None) -> None:
         """Set the Event and unblock all Tasks blocked on this Event."""
@@ -539,7 +610,7 @@ class Event:
             )
         self._data = data
 
-        pending_events, self._pending_events = self._pending_events, []
+        pending_events, self._pending_events = self._pending_events, {}
         for event in pending_events:
             event._callback(event)
 
@@ -883,6 +954,28 @@ class _AggregateWaitable(Waitable[T]):
                     f"All triggers must be instances of Trigger! Got: {type(t).__qualname__}"
                 )
 
+    def _trigger_group(self, wait_all: bool) -> Optional["_TriggerGroup"]:
+        """Return a group waiting on *triggers* in the scheduler, or ``None`` if any of them is a :class:`Waitable`.
+
+        Tasks are waited on through their :attr:`~cocotb.task.Task.complete` trigger,
+        unstarted Tasks are started.
+        """
+        triggers: List[Trigger] = []
+        for t in self._triggers:
+            if isinstance(t, Trigger):
+                triggers.append(t)
+            elif isinstance(t, cocotb.task.Task):
+                triggers.append(t.complete)
+            else:
+                return None
+        for t in self._triggers:
+            if (
+                isinstance(t, cocotb.task.Task)
+                and t._state is cocotb.task.Task._State.UNSTARTED
+            ):
+                cocotb._scheduler_inst._schedule_task(t)
+        return _TriggerGroup(triggers, wait_all)
+
     def __repr__(self) -> str:
         # no _pointer_str here, since this is not a trigger, so identity
         # doesn't matter.
@@ -892,6 +985,31 @@ class _AggregateWaitable(Waitable[T]):
         )
 
 
+class _TriggerGroup:
+    """Awaitable which waits on several triggers at once in the scheduler.
+
+    The awaiting Task is registered with the scheduler as a waiter of every trigger.
+    If *wait_all* is ``False``, it is resumed when the first trigger fires and the others are unprimed,
+    otherwise it is resumed once every trigger has fired.
+    Awaiting this object returns the trigger that fired last.
+    """
+
+    def __init__(self, triggers: Iterable[Trigger], wait_all: bool) -> None:
+        # dict used as an ordered set, also removes duplicates
+        self._remaining: Dict[Trigger, None] = dict.fromkeys(triggers)
+        self._wait_all = wait_all
+
+    def __await__(self) -> Generator[Any, Any, Trigger]:
+        trigger = yield self
+        return trigger
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            "Combine" if self._wait_all else "First",
+            ", ".join(repr(t) for t in self._remaining),
+        )
+
+
 async def _wait_callback(
     trigger: Union[Trigger, Waitable[T], "cocotb.task.Task[T]"],
     callback: Callable[[Outcome[T]], None],
@@ -920,6 +1038,12 @@ class Combine(_AggregateWaitable["Combine"]):
     """
 
     async def _wait(self) -> "Combine":
+        group = self._trigger_group(wait_all=True)
+        if group is not None:
+            # wait on all the triggers at once, without helper Tasks
+            await group
+            return self
+
         waiters: List[cocotb.task.Task[Any]] = []
         e = _InternalEvent(self)
         triggers = list(self._triggers)
@@ -972,6 +1096,16 @@ class First(_AggregateWaitable[Any]):
     """
 
     async def _wait(self) -> Any:
+        group = self._trigger_group(wait_all=False)
+        if group is not None:
+            # wait on all the triggers at once, without helper Tasks
+            fired = await group
+            # awaiting a Task returns its result, but awaiting its trigger returns the trigger
+            for t in self._triggers:
+                if isinstance(t, cocotb.task.Task) and fired is t.complete:
+                    return t.result()
+            return fired
+
         waiters: List[cocotb.task.Task[Any]] = []
         e = _InternalEvent(self)
         completed: List[Outcome[Any]] = []
@@ -996,6 +1130,38 @@ class First(_AggregateWaitable[Any]):
         return completed[0].get()
 
 
+class _EdgeCount(GPITrigger):
+    """Fires after *num_edges* edges of type *edge_type* on *signal*.
+
+    The edges are counted by the GPI, so the scheduler is only woken up once.
+    """
+
+    def __init__(
+        self,
+        signal: cocotb.handle.LogicObject,
+        num_edges: int,
+        edge_type: Union[Type[RisingEdge], Type[FallingEdge]],
+    ) -> None:
+        super().__init__()
+        # type check the signal the same way the edge trigger would
+        edge_type.__singleton_key__(signal)
+        self.signal = signal
+        self.num_edges = num_edges
+        self._edge_type = edge_type._edge_type
+
+    def _prime(self, callback: Callable[[Trigger], None]) -> None:
+        if self._cbhdl is None:
+            self._cbhdl = simulator.register_edge_count_callback(
+                self.signal._handle, callback, self._edge_type, self.num_edges, self
+            )
+            if self._cbhdl is None:
+                raise RuntimeError(f"Unable set up {str(self)} Trigger")
+        super()._prime(callback)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({self.signal!r}, {self.num_edges!r})"
+
+
 class ClockCycles(Waitable["ClockCycles"]):
     r"""Fires after *num_cycles* transitions of *signal*.
 
@@ -1026,9 +1192,8 @@ class ClockCycles(Waitable["ClockCycles"]):
             self._type = FallingEdge
 
     async def _wait(self) -> "ClockCycles":
-        trigger = self._type(self.signal)
-        for _ in range(self.num_cycles):
-            await trigger
+        if self.num_cycles > 0:
+            await _EdgeCount(self.signal, self.num_cycles, self._type)
         return self
 
     def __repr__(self) -> str:
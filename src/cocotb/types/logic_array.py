@@ -10,6 +10,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Tuple,
     Union,
     cast,
     overload,
@@ -90,6 +91,54 @@ _resolve_tables = {
 }
 
 
+# Packed "bitplane" representation of 4-state values. Each bit position of the
+# LogicArray maps to one bit in two integers, the *value* plane and the *X/Z* plane,
+# using the same encoding as VPI's ``s_vpi_vecval`` aval/bval pairs:
+#
+#   Logic | value | X/Z
+#   ------+-------+----
+#     0   |   0   |  0
+#     1   |   1   |  0
+#     Z   |   0   |  1
+#     X   |   1   |  1
+#
+# Only values composed entirely of ``0``, ``1``, ``X``, and ``Z`` have a bitplane
+# representation. Arrays containing any of the other 5 values fall back to the
+# element-wise implementations so the full 9-value semantics of Logic are preserved.
+_value_plane_table = str.maketrans("01XZ", "0110")
+_xz_plane_table = str.maketrans("01XZ", "0011")
+_4state_literals = frozenset("01XZ")
+_planes_str_table = str.maketrans("23", "ZX")
+
+
+def _str_to_planes(value: str) -> Union[Tuple[int, int], None]:
+    if not value:
+        return (0, 0)
+    if not (set(value) <= _4state_literals):
+        return None
+    return (
+        int(value.translate(_value_plane_table), 2),
+        int(value.translate(_xz_plane_table), 2),
+    )
+
+
+def _planes_to_str(value: int, xz: int, n: int) -> str:
+    value_str = format(value, f"0{n}b")
+    if not xz:
+        return value_str
+    # Combine the two planes without iterating bit-by-bit. Each character of the
+    # binary strings is the byte 0x30 ("0") or 0x31 ("1"), so treating the encoded
+    # strings as big integers and summing ``value + 2 * xz - 0x60`` per byte yields
+    # the bytes "0", "1", "2", or "3" without carrying between bytes.
+    # "2" and "3" are then translated to "Z" and "X".
+    combined = (
+        int.from_bytes(value_str.encode("ascii"), "big")
+        + 2 * int.from_bytes(format(xz, f"0{n}b").encode("ascii"), "big")
+        - int.from_bytes(b"\x60" * n, "big")
+    )
+    return combined.to_bytes(n, "big").decode("ascii").translate(_planes_str_table)
+
+
 class LogicArray(ArrayLike[Logic]):
     r"""Fixed-sized, arbitrarily-indexed, array of :class:`cocotb.types.Logic`.
 
@@ -227,14 +276,17 @@ class LogicArray(ArrayLike[Logic]):
         TypeError: When invalid argument types are used.
     """
 
-    # These three attribute contain the current value of the array in one or more of
-    # three different implementations. This is done for performance reasons, as certain
+    # These four attribute contain the current value of the array in one or more of
+    # four different implementations. This is done for performance reasons, as certain
     # implementations are faster for particular operations.
     # Each implementation can be present, or None if the implementation has not been
     # computed or has been invalidated by a mutating operation.
+    # The packed bitplane implementation is only available for 4-state values
+    # (see _str_to_planes).
     _value_as_array: Union[List[Logic], None]
     _value_as_int: Union[int, None]
     _value_as_str: Union[str, None]
+    _value_as_planes: Union[Tuple[int, int], None]
     _range: Range
 
     @overload
@@ -342,6 +394,7 @@ class LogicArray(ArrayLike[Logic]):
         self._value_as_array = None
         self._value_as_int = None
         self._value_as_str = None
+        self._value_as_planes = None
         range = _make_range(range, width)
         if isinstance(value, str):
             if not (set(value) <= _str_literals):
@@ -393,6 +446,8 @@ class LogicArray(ArrayLike[Logic]):
         if self._value_as_str is None:
             if self._value_as_int is not None:
                 self._value_as_str = format(self._value_as_int, f"0{len(self)}b")
+            elif self._value_as_planes is not None:
+                self._value_as_str = _planes_to_str(*self._value_as_planes, len(self))
             else:
                 self._value_as_str = "".join(
                     str(v) for v in cast(List[Logic], self._value_as_array)
@@ -404,23 +459,53 @@ class LogicArray(ArrayLike[Logic]):
         resolve: "ResolveX | Literal['error'] | Literal['zeros'] | Literal['ones'] | Literal['random'] | None",
     ) -> int:
         if self._value_as_int is None:
+            if self._value_as_planes is not None and not self._value_as_planes[1]:
+                self._value_as_int = self._value_as_planes[0]
+                return self._value_as_int
             # May convert list to str before converting to int.
             value_as_str = self._get_str()
             # resolve L and H to 0 and 1
-            value_as_str = value_as_str.translate(_resolve_lh_table)
+            resolved_str = value_as_str.translate(_resolve_lh_table)
             try:
-                self._value_as_int = int(value_as_str, 2)
+                value = int(resolved_str, 2)
             except ValueError:
                 # value needs resolving
                 if resolve is None:
                     resolve = RESOLVE_X
 
                 resolve_table = _resolve_tables[resolve]
-                value_as_str = value_as_str.translate(resolve_table)
-                return int(value_as_str, 2)
+                resolved_str = resolved_str.translate(resolve_table)
+                return int(resolved_str, 2)
+            # The cached int stands for a value of only 0s and 1s,
+            # the bitplanes and resolvability are derived from it.
+            if resolved_str == value_as_str:
+                self._value_as_int = value
+            return value
 
         return self._value_as_int
 
+    def _get_planes(self) -> Union[Tuple[int, int], None]:
+        if self._value_as_planes is None:
+            if self._value_as_int is not None:
+                self._value_as_planes = (self._value_as_int, 0)
+            else:
+                # May convert list to str before converting to planes.
+                self._value_as_planes = _str_to_planes(self._get_str())
+        return self._value_as_planes
+
+    @classmethod
+    def _from_planes(cls, value: int, xz: int, range: Range) -> "LogicArray":
+        # Used to make LogicArrays from the results of bitwise operations on the packed
+        # representation and by cocotb.handle classes from the packed values gotten from
+        # the simulator. Expects both planes to already be masked to the width.
+        self = super().__new__(cls)
+        self._value_as_array = None
+        self._value_as_int = None if xz else value
+        self._value_as_str = None
+        self._value_as_planes = (value, xz)
+        self._range = range
+        return self
+
     @overload
     @classmethod
     def from_unsigned(cls, value: int, *, range: Range) -> "LogicArray": ...
@@ -587,6 +672,7 @@ class LogicArray(ArrayLike[Logic]):
         self._value_as_array = None
         self._value_as_int = None
         self._value_as_str = value
+        self._value_as_planes = None
         self._range = Range(len(value) - 1, "downto", 0)
         return self
 
@@ -634,7 +720,10 @@ class LogicArray(ArrayLike[Logic]):
             # Prefers checking against str vs any type since that is going to be the
             #   most common type and also the "middle" type for conversions.
             # Always converts away from ints to prevent issues with non-0/1 data.
-            if self._value_as_str is not None and other._value_as_str is not None:
+            if self._value_as_planes is not None and other._value_as_planes is not None:
+                # (PLANES, PLANES)
+                return self._value_as_planes == other._value_as_planes
+            elif self._value_as_str is not None and other._value_as_str is not None:
                 # (STR, STR)
                 return self._value_as_str == other._value_as_str
             elif self._value_as_array is not None and other._value_as_array is not None:
@@ -643,6 +732,14 @@ class LogicArray(ArrayLike[Logic]):
             elif self._value_as_int is not None and other._value_as_int is not None:
                 # (INT, INT)
                 return self._value_as_int == other._value_as_int
+            elif (
+                self._value_as_planes is not None or other._value_as_planes is not None
+            ):
+                # (PLANES, ANY)
+                # (ANY, PLANES)
+                # Values without a bitplane representation can't be equal to one with.
+                self_planes = self._get_planes()
+                return self_planes is not None and self_planes == other._get_planes()
             elif self._value_as_str is not None:
                 # (STR, INT)
                 # (STR, ARRAY)
@@ -678,6 +775,10 @@ class LogicArray(ArrayLike[Logic]):
     @property
     def is_resolvable(self) -> bool:
         """``True`` if all elements are ``0`` or ``1``."""
+        if self._value_as_int is not None:
+            return True
+        if self._value_as_planes is not None:
+            return not self._value_as_planes[1]
         return all(bit in (Logic(0), Logic(1)) for bit in self)
 
     @property
@@ -803,10 +904,9 @@ class LogicArray(ArrayLike[Logic]):
     def __getitem__(self, item: slice) -> "LogicArray": ...
 
     def __getitem__(self, item: Union[int, slice]) -> Union[Logic, "LogicArray"]:
-        array = self._get_array()
         if isinstance(item, int):
             idx = self._translate_index(item)
-            return array[idx]
+            return self._get_array()[idx]
         elif isinstance(item, slice):
             start = item.start if item.start is not None else self.left
             stop = item.stop if item.stop is not None else self.right
@@ -818,8 +918,19 @@ class LogicArray(ArrayLike[Logic]):
                 raise IndexError(
                     f"slice [{start}:{stop}] direction does not match array direction [{self.left}:{self.right}]"
                 )
-            value = array[start_i : stop_i + 1]
             range = Range(start, self.direction, stop)
+            if self._value_as_array is None and self._value_as_planes is not None:
+                # Slice the packed representation without materializing the array.
+                # Index 0 is the left-most and therefore most significant bit.
+                shift = len(self) - 1 - stop_i
+                mask = (1 << (stop_i - start_i + 1)) - 1
+                value, xz = self._value_as_planes
+                return LogicArray._from_planes(
+                    (value >> shift) & mask, (xz >> shift) & mask, range
+                )
+            elif self._value_as_array is None and self._value_as_str is not None:
+                return LogicArray(self._value_as_str[start_i : stop_i + 1], range)
+            value = self._get_array()[start_i : stop_i + 1]
             return LogicArray(value=value, range=range)
         raise TypeError(f"indexes must be ints or slices, not {type(item).__name__}")
 
@@ -840,6 +951,7 @@ class LogicArray(ArrayLike[Logic]):
         # invalid other impls
         self._value_as_str = None
         self._value_as_int = None
+        self._value_as_planes = None
         if isinstance(item, int):
             idx = self._translate_index(item)
             array[idx] = Logic(cast(LogicConstructibleT, value))
@@ -894,6 +1006,13 @@ class LogicArray(ArrayLike[Logic]):
                 f"between {type(self).__qualname__} of length {len(self)} "
                 f"and {type(other).__qualname__} of length {len(other)}"
             )
+        self_planes = self._get_planes()
+        other_planes = other._get_planes()
+        if self_planes is not None and other_planes is not None:
+            return LogicArray._from_planes(
+                *_planes_and(self_planes, other_planes, len(self)),
+                Range(len(self) - 1, "downto", 0),
+            )
         return LogicArray(a & b for a, b in zip(self, other))
 
     def __or__(self, other: "LogicArray") -> "LogicArray":
@@ -905,6 +1024,13 @@ class LogicArray(ArrayLike[Logic]):
                 f"between {type(self).__qualname__} of length {len(self)} "
                 f"and {type(other).__qualname__} of length {len(other)}"
             )
+        self_planes = self._get_planes()
+        other_planes = other._get_planes()
+        if self_planes is not None and other_planes is not None:
+            return LogicArray._from_planes(
+                *_planes_or(self_planes, other_planes, len(self)),
+                Range(len(self) - 1, "downto", 0),
+            )
         return LogicArray(a | b for a, b in zip(self, other))
 
     def __xor__(self, other: "LogicArray") -> "LogicArray":
@@ -916,9 +1042,24 @@ class LogicArray(ArrayLike[Logic]):
                 f"between {type(self).__qualname__} of length {len(self)} "
                 f"and {type(other).__qualname__} of length {len(other)}"
             )
+        self_planes = self._get_planes()
+        other_planes = other._get_planes()
+        if self_planes is not None and other_planes is not None:
+            return LogicArray._from_planes(
+                *_planes_xor(self_planes, other_planes, len(self)),
+                Range(len(self) - 1, "downto", 0),
+            )
         return LogicArray(a ^ b for a, b in zip(self, other))
 
     def __invert__(self) -> "LogicArray":
+        planes = self._get_planes()
+        if planes is not None:
+            value, xz = planes
+            mask = (1 << len(self)) - 1
+            # X and Z both invert to X
+            return LogicArray._from_planes(
+                (~value & mask) | xz, xz, Range(len(self) - 1, "downto", 0)
+            )
         return LogicArray(~v for v in self)
 
     def __bool__(self) -> bool:
@@ -931,6 +1072,33 @@ class LogicArray(ArrayLike[Logic]):
         return any(v in (Logic("H"), Logic("1")) for v in self)
 
 
+def _planes_and(a: Tuple[int, int], b: Tuple[int, int], n: int) -> Tuple[int, int]:
+    mask = (1 << n) - 1
+    (a_value, a_xz), (b_value, b_xz) = a, b
+    # A known 0 in either operand forces 0, a known 1 in both gives 1, otherwise X.
+    zeros = (~a_value & ~a_xz) | (~b_value & ~b_xz)
+    ones = a_value & ~a_xz & b_value & ~b_xz
+    xs = ~(zeros | ones) & mask
+    return (ones | xs, xs)
+
+
+def _planes_or(a: Tuple[int, int], b: Tuple[int, int], n: int) -> Tuple[int, int]:
+    mask = (1 << n) - 1
+    (a_value, a_xz), (b_value, b_xz) = a, b
+    # A known 1 in either operand forces 1, a known 0 in both gives 0, otherwise X.
+    ones = (a_value & ~a_xz) | (b_value & ~b_xz)
+    zeros = ~a_value & ~a_xz & ~b_value & ~b_xz
+    xs = ~(zeros | ones) & mask
+    return (ones | xs, xs)
+
+
+def _planes_xor(a: Tuple[int, int], b: Tuple[int, int], n: int) -> Tuple[int, int]:
+    (a_value, a_xz), (b_value, b_xz) = a, b
+    # Any X or Z in either operand gives X.
+    xs = a_xz | b_xz
+    return (((a_value ^ b_value) & ~xs) | xs, xs)
+
+
 def _make_range(
     range: Union[Range, int, None], width: Union[int, None]
 ) -> Union[Range, None]:
@@ -4,12 +4,51 @@
 """Checks if a JUnit results file exists and whether there was failing tests."""
 
 import argparse
+import json
+import os
 import sys
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, Union
 from xml.etree import ElementTree
 
 
+def _read_results(
+    results_file: Union[str, "os.PathLike[str]"],
+) -> ElementTree.Element:
+    """Return the ``testsuites`` element of the results in *results_file*.
+
+    Files with a ``.jsonl`` suffix are read as the JSON Lines results written by cocotb
+    when :envvar:`COCOTB_RESULTS_JSONL_FILE` is set,
+    other files as xUnit XML.
+    A truncated last line of a JSON Lines file is ignored.
+    """
+    if Path(results_file).suffix != ".jsonl":
+        return ElementTree.parse(results_file).getroot()
+
+    result = ElementTree.Element("testsuites", name="results")
+    testsuite = None
+    with open(results_file, encoding="UTF-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if "testsuite" in record:
+                testsuite = ElementTree.SubElement(
+                    result, "testsuite", record["testsuite"]
+                )
+                continue
+            if testsuite is None:
+                testsuite = ElementTree.SubElement(result, "testsuite")
+            elem = None
+            for tag, attrib in record.items():
+                if elem is None:
+                    elem = ElementTree.SubElement(testsuite, tag, attrib)
+                else:
+                    ElementTree.SubElement(elem, tag, attrib)
+    return result
+
+
 def get_results(results_xml_file: Path) -> Tuple[int, int]:
     """Return number of tests and fails in *results_xml_file*.
 
@@ -30,7 +69,7 @@ def get_results(results_xml_file: Path) -> Tuple[int, int]:
     num_tests = 0
     num_failed = 0
 
-    tree = ElementTree.parse(results_xml_file)
+    tree = _read_results(results_xml_file)
     for ts in tree.iter("testsuite"):
         for tc in ts.iter("testcase"):
             num_tests += 1
@@ -44,7 +83,9 @@ def _get_parser() -> argparse.ArgumentParser:
     """Return the cmdline parser"""
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
-        "results_file", help="Path to XML file holding JUnit test results.", type=Path
+        "results_file",
+        help="Path to XML file holding JUnit test results, or JSON Lines file (*.jsonl) holding cocotb test results.",
+        type=Path,
     )
     return parser
 
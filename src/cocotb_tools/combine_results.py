@@ -10,9 +10,24 @@ import argparse
 import os
 import re
 import sys
-from typing import Iterable, Pattern
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    TextIO,
+    Tuple,
+)
 from xml.etree import ElementTree as ET
 
+from cocotb_tools.check_results import _read_results
+
 
 def _find_all(name: Pattern, path: str) -> Iterable[str]:
     for root, _, files in os.walk(path):
@@ -21,6 +36,203 @@ def _find_all(name: Pattern, path: str) -> Iterable[str]:
                 yield os.path.join(root, file)
 
 
+def _combine_testsuites(
+    result: ET.Element, fnames: Iterable[str], verbose: bool = False
+) -> None:
+    """Add the testsuites in the XML or JSON Lines files *fnames* to the *result* element.
+
+    Testsuites with the same name and package are merged into one.
+    """
+    index = {(ts.get("name"), ts.get("package")): ts for ts in result}
+    for fname in fnames:
+        if verbose:
+            print(f"Reading file {fname}.")
+        tree = _read_results(fname)
+        for ts in tree.iter("testsuite"):
+            if verbose:
+                print(
+                    "Testsuite name: {!r}, package: {!r}".format(
+                        ts.get("name"), ts.get("package")
+                    )
+                )
+            key = (ts.get("name"), ts.get("package"))
+            existing = index.get(key)
+            if existing is not None:
+                if verbose:
+                    print("Testsuite already exists in combined results. Extending it.")
+                existing.extend(list(ts))
+            else:
+                if verbose:
+                    print(
+                        "Testsuite does not already exist in combined results. Adding it."
+                    )
+                result.append(ts)
+                index[key] = ts
+
+
+class _Failure(NamedTuple):
+    classname: Optional[str]
+    name: Optional[str]
+    file: Optional[str]
+    lineno: Optional[str]
+
+
+class _Duration(NamedTuple):
+    classname: Optional[str]
+    name: Optional[str]
+    time: float
+    sim_time_ns: float
+
+
+class _Testsuite(NamedTuple):
+    """A testsuite read from a results file, serialized for merging."""
+
+    name: Optional[str]
+    package: Optional[str]
+    start_tag: str
+    text: str
+    children: str
+    tail: str
+    num_testcases: int
+    failures: List[_Failure]
+    durations: List[_Duration]
+
+
+def _escape(text: Optional[str]) -> str:
+    elem = ET.Element("x")
+    elem.text = text
+    return ET.tostring(elem, encoding="unicode")[len("<x>") : -len("</x>")]
+
+
+def _start_tag(elem: ET.Element) -> str:
+    # ElementTree writes empty elements as "<tag attrs />"
+    empty = ET.tostring(ET.Element(elem.tag, elem.attrib), encoding="unicode")
+    return empty[: -len(" />")] + ">"
+
+
+def _write_element(
+    f: TextIO, tag: str, start_tag: str, text: str, children: str
+) -> None:
+    """Write an element the way ElementTree does, given its serialized parts."""
+    if text or children:
+        f.write(f"{start_tag}{text}{children}</{tag}>")
+    else:
+        f.write(start_tag[: -len(">")] + " />")
+
+
+def _float(value: Optional[str]) -> float:
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _serialize_testsuite(ts: ET.Element, statistics: bool) -> _Testsuite:
+    failures = []
+    durations = []
+    num_testcases = 0
+    for testcase in ts.iter("testcase"):
+        num_testcases += 1
+        for _ in testcase.iter("failure"):
+            failures.append(
+                _Failure(
+                    testcase.get("classname"),
+                    testcase.get("name"),
+                    testcase.get("file"),
+                    testcase.get("lineno"),
+                )
+            )
+        if statistics:
+            durations.append(
+                _Duration(
+                    testcase.get("classname"),
+                    testcase.get("name"),
+                    _float(testcase.get("time")),
+                    _float(testcase.get("sim_time_ns")),
+                )
+            )
+    return _Testsuite(
+        name=ts.get("name"),
+        package=ts.get("package"),
+        start_tag=_start_tag(ts),
+        text=_escape(ts.text),
+        children="".join(ET.tostring(child, encoding="unicode") for child in ts),
+        tail=_escape(ts.tail),
+        num_testcases=num_testcases,
+        failures=failures,
+        durations=durations,
+    )
+
+
+def _read_testsuites(fname: str, statistics: bool = False) -> List[_Testsuite]:
+    """Read the testsuites in the XML or JSON Lines file *fname*.
+
+    XML files are parsed incrementally, dropping each testsuite once it is serialized.
+    """
+    if Path(fname).suffix == ".jsonl":
+        return [
+            _serialize_testsuite(ts, statistics)
+            for ts in _read_results(fname).iter("testsuite")
+        ]
+
+    testsuites = []
+    parents: List[ET.Element] = []
+    for event, elem in ET.iterparse(fname, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        # only testsuites which are the root or children of the root
+        if elem.tag == "testsuite" and len(parents) <= 1:
+            testsuites.append(_serialize_testsuite(elem, statistics))
+            if parents:
+                parents[0].remove(elem)
+    return testsuites
+
+
+class _MergedTestsuite:
+    """Testsuites with the same name and package, merged into the first one."""
+
+    def __init__(self, ts: _Testsuite) -> None:
+        self.name = ts.name
+        self.package = ts.package
+        self.start_tag = ts.start_tag
+        self.text = ts.text
+        self.children = [ts.children]
+        self.tail = ts.tail
+        self.num_testcases = ts.num_testcases
+        self.failures = list(ts.failures)
+
+    def extend(self, ts: _Testsuite) -> None:
+        self.children.append(ts.children)
+        self.num_testcases += ts.num_testcases
+        self.failures.extend(ts.failures)
+
+    def write(self, f: TextIO) -> None:
+        _write_element(
+            f, "testsuite", self.start_tag, self.text, "".join(self.children)
+        )
+        f.write(self.tail)
+
+
+def _print_statistics(durations: List[_Duration], count: int) -> None:
+    total_time = sum(d.time for d in durations)
+    total_sim_time_ns = sum(d.sim_time_ns for d in durations)
+    ratio = total_sim_time_ns / total_time if total_time > 0 else 0.0
+    print(
+        f"Total time: {total_time:.2f} s, total simulation time: {total_sim_time_ns:.2f} ns,"
+        f" ratio: {ratio:.2f} ns/s"
+    )
+    slowest = sorted(durations, key=lambda d: d.time, reverse=True)[:count]
+    if slowest:
+        print(f"Slowest {len(slowest)} TestCases:")
+    for d in slowest:
+        d_ratio = d.sim_time_ns / d.time if d.time > 0 else 0.0
+        print(
+            f"  {d.time:10.2f} s {d.sim_time_ns:14.2f} ns {d_ratio:12.2f} ns/s  {d.classname}.{d.name}"
+        )
+
+
 def _get_parser() -> argparse.ArgumentParser:
     """Return the cmdline parser"""
     parser = argparse.ArgumentParser(
@@ -36,7 +248,7 @@ def _get_parser() -> argparse.ArgumentParser:
         "-i",
         "--input-filename",
         default=r"results.*\.xml",
-        help="A regular expression to match input filenames.",
+        help="A regular expression to match input filenames. Files ending in '.jsonl' are read as JSON Lines.",
     )
     parser.add_argument(
         "-o",
@@ -54,92 +266,117 @@ def _get_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enables verbose output.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes to read the input files in.",
+    )
+    parser.add_argument(
+        "--statistics",
+        type=int,
+        nargs="?",
+        const=10,
+        default=None,
+        metavar="N",
+        help="Print the total time, simulation time and their ratio, and the N slowest TestCases.",
+    )
     return parser
 
 
+def _read_all(
+    fnames: List[str], jobs: int, statistics: bool
+) -> Iterator[Tuple[str, List[_Testsuite]]]:
+    read = partial(_read_testsuites, statistics=statistics)
+    if jobs <= 1 or len(fnames) <= 1:
+        yield from zip(fnames, map(read, fnames))
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunksize = max(1, len(fnames) // (jobs * 4))
+        yield from zip(fnames, executor.map(read, fnames, chunksize=chunksize))
+
+
 def main() -> int:
     parser = _get_parser()
     args = parser.parse_args()
     rc = 0
 
-    result = ET.Element("testsuites", name=args.output_testsuites_name)
-
     input_pattern = re.compile(args.input_filename)
 
+    fnames: List[str] = []
     for directory in args.directories:
         if args.verbose:
             print(f"Searching in {directory} for results.xml files.")
-        for fname in _find_all(input_pattern, directory):
+        fnames.extend(_find_all(input_pattern, directory))
+
+    # testsuites are merged by name and package, in the order they are first seen
+    testsuites: Dict[Tuple[Optional[str], Optional[str]], _MergedTestsuite] = {}
+    durations: List[_Duration] = []
+    statistics = args.statistics is not None
+    for fname, file_testsuites in _read_all(fnames, args.jobs, statistics):
+        if args.verbose:
+            print(f"Reading file {fname}.")
+        for ts in file_testsuites:
             if args.verbose:
-                print(f"Reading file {fname}.")
-            tree = ET.parse(fname)
-            for ts in tree.iter("testsuite"):
+                print(f"Testsuite name: {ts.name!r}, package: {ts.package!r}")
+            durations.extend(ts.durations)
+            existing = testsuites.get((ts.name, ts.package))
+            if existing is not None:
+                if args.verbose:
+                    print("Testsuite already exists in combined results. Extending it.")
+                existing.extend(ts)
+            else:
                 if args.verbose:
                     print(
-                        "Testsuite name: {!r}, package: {!r}".format(
-                            ts.get("name"), ts.get("package")
-                        )
+                        "Testsuite does not already exist in combined results. Adding it."
                     )
-                for existing in result:
-                    if (existing.get("name") == ts.get("name")) and (
-                        existing.get("package") == ts.get("package")
-                    ):
-                        if args.verbose:
-                            print(
-                                "Testsuite already exists in combined results. Extending it."
-                            )
-                        existing.extend(list(ts))
-                        break
-                else:
-                    if args.verbose:
-                        print(
-                            "Testsuite does not already exist in combined results. Adding it."
-                        )
-                    result.append(ts)
+                testsuites[(ts.name, ts.package)] = _MergedTestsuite(ts)
 
     testsuite_count = 0
     testcase_count = 0
-    for testsuite in result.iter("testsuite"):
+    for testsuite in testsuites.values():
         testsuite_count += 1
-        for testcase in testsuite.iter("testcase"):
-            testcase_count += 1
-            for failure in testcase.iter("failure"):
-                rc = 1
+        testcase_count += testsuite.num_testcases
+        for failure in testsuite.failures:
+            rc = 1
+            print(
+                f"Failure in testsuite: '{testsuite.name}' classname: '{failure.classname}' testcase: '{failure.name}' with parameters '{testsuite.package}'"
+            )
+            if os.getenv("GITHUB_ACTIONS") is not None:
+                # Get test file relative to root of repo
+                file = failure.file
+                assert (
+                    file is not None
+                )  # if this file was output by cocotb, it has this attribute
+                repo_root = os.path.commonprefix(
+                    [
+                        os.path.abspath(file),
+                        os.path.abspath(__file__),
+                    ]
+                )
+                relative_file = file.replace(repo_root, "")
                 print(
-                    "Failure in testsuite: '{}' classname: '{}' testcase: '{}' with parameters '{}'".format(
-                        testsuite.get("name"),
-                        testcase.get("classname"),
-                        testcase.get("name"),
-                        testsuite.get("package"),
-                    )
+                    f"::error file={relative_file},line={failure.lineno}::Test {failure.classname}:{failure.name} failed"
                 )
-                if os.getenv("GITHUB_ACTIONS") is not None:
-                    # Get test file relative to root of repo
-                    file = testcase.get("file")
-                    assert (
-                        file is not None
-                    )  # if this file was output by cocotb, it has this attribute
-                    repo_root = os.path.commonprefix(
-                        [
-                            os.path.abspath(file),
-                            os.path.abspath(__file__),
-                        ]
-                    )
-                    relative_file = file.replace(repo_root, "")
-                    print(
-                        "::error file={},line={}::Test {}:{} failed".format(
-                            relative_file,
-                            testcase.get("lineno"),
-                            testcase.get("classname"),
-                            testcase.get("name"),
-                        )
-                    )
 
     print(f"Ran a total of {testsuite_count} TestSuites and {testcase_count} TestCases")
 
+    if statistics:
+        _print_statistics(durations, args.statistics)
+
     if args.verbose:
         print(f"Writing combined results to {args.output_file}")
-    ET.ElementTree(result).write(args.output_file, encoding="UTF-8")
+    # written piece by piece, as ElementTree would write the combined tree
+    root = ET.Element("testsuites", name=args.output_testsuites_name)
+    with open(args.output_file, "w", encoding="UTF-8", errors="xmlcharrefreplace") as f:
+        if not testsuites:
+            _write_element(f, "testsuites", _start_tag(root), "", "")
+        else:
+            f.write(_start_tag(root))
+            for testsuite in testsuites.values():
+                testsuite.write(f)
+            f.write("</testsuites>")
     return rc
 
 
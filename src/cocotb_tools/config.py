@@ -87,7 +87,9 @@ def _help_vars_text() -> str:
         COCOTB_REDUCED_LOG_FMT    Display log lines shorter
         COCOTB_ATTACH             Pause time value in seconds before the simulator start
         COCOTB_ENABLE_PROFILING   Performance analysis of the Python portion of cocotb
+        COCOTB_SCHEDULER_STATS    File name for a JSON report of scheduler statistics
         COCOTB_LOG_LEVEL          Default logging level (default INFO)
+        COCOTB_LOG_FAST           Query the simulator time less often and write logs in batches
         COCOTB_RESOLVE_X          How to resolve X, Z, U, W, - on integer conversion
         LIBPYTHON_LOC             Absolute path to libpython
 
@@ -96,7 +98,13 @@ def _help_vars_text() -> str:
         COCOTB_PDB_ON_EXCEPTION   Drop into the Python debugger (pdb) on exception
         COCOTB_TEST_MODULES       Module(s) to search for test functions (comma-separated)
         COCOTB_TESTCASE           Test function(s) to run (comma-separated list)
+        COCOTB_TEST_SHARD         Only run shard <index> of <count> shards of the tests
+        COCOTB_TEST_DURATIONS     File name for the durations of the tests kept between runs
+        COCOTB_HIERARCHY_CACHE    File name for an index of the design hierarchy kept between runs
+        COCOTB_HIERARCHY_CACHE_KEY Identifier of the design build the hierarchy index is for
         COCOTB_RESULTS_FILE       File name for xUnit XML tests results
+        COCOTB_RESULTS_JSONL_FILE File name for JSON-lines tests results
+        COCOTB_RESULTS_FSYNC      Force tests results files to disk after each update
         COCOTB_USER_COVERAGE      Collect Python user coverage (HDL for some simulators)
         COCOTB_COVERAGE_RCFILE    Configuration for user code coverage
 
@@ -9,6 +9,9 @@
 # TODO: support timescale on all simulators
 # TODO: support custom dependencies
 
+import hashlib
+import itertools
+import json
 import logging
 import multiprocessing
 import os
@@ -18,8 +21,10 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from pathlib import Path
 from typing import (
@@ -29,16 +34,19 @@ from typing import (
     Mapping,
     Optional,
     Sequence,
+    Set,
     TextIO,
     Tuple,
     Type,
     Union,
 )
+from xml.etree import ElementTree as ET
 
 import find_libpython
 
 import cocotb_tools.config
 from cocotb_tools.check_results import get_results
+from cocotb_tools.combine_results import _combine_testsuites
 
 PathLike = Union["os.PathLike[str]", str]  # TODO use TypeAlias in Python 3.10
 "A path that can be passed to :class:`pathlib.Path` or :func:`open`"
@@ -227,6 +235,10 @@ class Runner(ABC):
         Tagged *build_args* only supply that option to the compiler when building the source file for the tagged language.
         Non-tagged *build_args* are supplied when compiling any language.
 
+        Builds are incremental: the build commands are keyed on a hash of the contents of the source and include files and of the build settings,
+        and the commands up to the first changed one are skipped when building into the same *build_dir* again.
+        Set *always* to run all build commands.
+
         Args:
             hdl_library: The library name to compile into.
             verilog_sources: Verilog source files to build.
@@ -237,7 +249,7 @@ class Runner(ABC):
             parameters: Verilog parameters or VHDL generics.
             build_args: Extra build arguments for the simulator.
             hdl_toplevel: The name of the HDL toplevel module.
-            always: Always run the build step.
+            always: Always run the build step, ignoring the build cache.
             build_dir: Directory to run the build step in.
             clean: Delete *build_dir* before building.
             verbose: Enable verbose messages.
@@ -291,7 +303,217 @@ class Runner(ABC):
         self.env.update(os.environ)
 
         cmds: Sequence[_Command] = self._build_command()
-        self._execute(cmds, cwd=self.build_dir)
+        self._execute_build(cmds)
+
+    def _execute_build(self, cmds: Sequence[_Command]) -> None:
+        """Run the build *cmds*, skipping those that are unchanged since the last build.
+
+        Each command is keyed on a hash of its arguments, the contents of its input files (see :meth:`_command_files`),
+        and the settings shared by all commands, including the contents of the include directories,
+        the version of the simulator and the keys of the libraries built before this one.
+        Commands are assumed to depend on the ones before them,
+        so only the commands up to the first changed one are skipped,
+        and none are if any of the outputs of the build (see :meth:`_build_outputs`) are missing.
+        The keys of the successful commands are stored per library in :file:`cocotb_build_cache.json` in the build directory.
+
+        The commands run one after another:
+        those of a library mostly depend on the ones before them,
+        and the simulators don't support concurrent writers to their library directories.
+        """
+        __tracebackhide__ = True  # Hide the traceback when using PyTest.
+
+        cache_file = self.build_dir / "cocotb_build_cache.json"
+        cache: Dict[str, List[str]] = {}
+        with suppress(OSError, ValueError):
+            cache = json.loads(cache_file.read_text())
+
+        # later libraries may use earlier ones, so they are rebuilt when those change
+        earlier_libraries = list(
+            itertools.takewhile(lambda item: item[0] != self.hdl_library, cache.items())
+        )
+        keys = self._build_keys(cmds, earlier_libraries)
+        old_keys = [] if self.always else cache.get(self.hdl_library, [])
+        num_unchanged = 0
+        for old_key, key in zip(old_keys, keys):
+            if old_key != key:
+                break
+            num_unchanged += 1
+
+        if num_unchanged:
+            missing_outputs = [
+                pattern
+                for pattern in self._build_outputs()
+                if not any(self.build_dir.glob(pattern))
+            ]
+            if missing_outputs:
+                self.log.info(
+                    "Rebuilding library %s, as %s are missing from the build directory",
+                    self.hdl_library,
+                    ", ".join(missing_outputs),
+                )
+                num_unchanged = 0
+
+        if num_unchanged == len(cmds):
+            self.log.info("Build of library %s is up to date", self.hdl_library)
+            return
+        if num_unchanged:
+            self.log.info(
+                "Skipping %d unchanged build command(s) of library %s",
+                num_unchanged,
+                self.hdl_library,
+            )
+
+        # forget the commands about to run until they succeed
+        cache[self.hdl_library] = keys[:num_unchanged]
+        cache_file.write_text(json.dumps(cache, indent=2))
+
+        self._execute(cmds[num_unchanged:], cwd=self.build_dir)
+
+        cache[self.hdl_library] = keys
+        cache_file.write_text(json.dumps(cache, indent=2))
+
+    def _build_outputs(self) -> List[str]:
+        """Return glob patterns, relative to the build directory, of the outputs of the build commands.
+
+        The build is only skipped if each of them matches an existing file.
+        """
+        return []
+
+    def _simulator_version_command(self) -> _Command:
+        """Return the command printing the version of the simulator, whose output is part of the build cache keys."""
+        return []
+
+    def _simulator_version(self) -> str:
+        """Return the output of :meth:`_simulator_version_command`, or an empty string if it cannot be run."""
+        cmd = self._simulator_version_command()
+        if not cmd:
+            return ""
+        try:
+            result = subprocess.run(
+                cmd,
+                check=False,
+                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=self.env,
+            )
+        except OSError:
+            return ""
+        return result.stdout
+
+    def _set_hierarchy_cache_env(self) -> None:
+        """Enable the hierarchy cache (see :envvar:`COCOTB_HIERARCHY_CACHE`) if the design was built by :meth:`build`.
+
+        The cache key is derived from the build cache, so the hierarchy cache is discarded whenever the design is rebuilt.
+        """
+        build_cache_file = self.build_dir / "cocotb_build_cache.json"
+        if "COCOTB_HIERARCHY_CACHE" in self.env or not build_cache_file.is_file():
+            return
+        hasher = hashlib.sha256(build_cache_file.read_bytes())
+        hasher.update(repr((sorted(self.parameters.items()), self.elab_args)).encode())
+        self.env["COCOTB_HIERARCHY_CACHE"] = str(
+            self.build_dir / "cocotb_hierarchy.json"
+        )
+        self.env["COCOTB_HIERARCHY_CACHE_KEY"] = hasher.hexdigest()
+
+    def _build_keys(
+        self,
+        cmds: Sequence[_Command],
+        earlier_libraries: Sequence[Tuple[str, List[str]]] = (),
+    ) -> List[str]:
+        """Return the build cache key of each of *cmds*.
+
+        *earlier_libraries* are the names and keys of the libraries built before this one.
+        """
+        include_files = sorted(
+            os.path.join(root, filename)
+            for include in self.includes
+            for root, _, filenames in os.walk(include)
+            for filename in filenames
+        )
+        cmd_files = [self._command_files(cmd) for cmd in cmds]
+        files = set(include_files)
+        for cmd_file_list in cmd_files:
+            files.update(cmd_file_list)
+
+        # hashing is mostly I/O and releases the GIL, so threads speed it up
+        with ThreadPoolExecutor(max_workers=_get_max_parallel_build_jobs()) as executor:
+            digests = dict(zip(files, executor.map(_file_digest, files)))
+
+        common = hashlib.sha256()
+        for item in (
+            type(self).__qualname__,
+            self._simulator_version(),
+            list(earlier_libraries),
+            self.hdl_library,
+            self.hdl_toplevel,
+            sorted(self.defines.items()),
+            sorted(self.parameters.items()),
+            [(type(arg).__qualname__, arg) for arg in self.build_args],
+            self.timescale,
+            self.waves,
+            [(f, digests[f]) for f in include_files],
+        ):
+            common.update(repr(item).encode())
+
+        keys = []
+        for cmd, cmd_file_list in zip(cmds, cmd_files):
+            hasher = common.copy()
+            hasher.update(repr(list(cmd)).encode())
+            for f in cmd_file_list:
+                hasher.update(repr((f, digests[f])).encode())
+            keys.append(hasher.hexdigest())
+        return keys
+
+    def _command_files(self, cmd: _Command) -> List[str]:
+        """Return the input files of the build command *cmd*.
+
+        These are the files named by its arguments,
+        the files named in the command files it reads with options like ``-f``,
+        and the files included by the Verilog sources among them.
+        Files in the build directory are left out, as they are outputs, or generated from the settings.
+        """
+        build_dir = str(self.build_dir) + os.sep
+        include_dirs = [str(include) for include in self.includes]
+        files: List[str] = []
+        seen: Set[str] = set()
+
+        def add_file(path: str) -> bool:
+            path = os.path.abspath(path)
+            if path in seen or path.startswith(build_dir) or not os.path.isfile(path):
+                return False
+            seen.add(path)
+            files.append(path)
+            if is_verilog_source(path):
+                for included in _verilog_includes(path):
+                    for directory in [os.path.dirname(path), *include_dirs]:
+                        if add_file(os.path.join(directory, included)):
+                            break
+            return True
+
+        # lists of arguments, with the directory their relative paths are relative to
+        pending: List[Tuple[Sequence[str], str]] = [(cmd, str(self.build_dir))]
+        while pending:
+            args, base_dir = pending.pop()
+            prev_arg = None
+            for arg in args:
+                path = os.path.join(base_dir, arg)
+                if arg.startswith("+incdir+"):
+                    include_dirs.extend(
+                        os.path.join(base_dir, include)
+                        for include in arg[len("+incdir+") :].split("+")
+                        if include
+                    )
+                elif add_file(path) and prev_arg in _command_file_options:
+                    # paths in files given with -F are relative to the file
+                    pending.append(
+                        (
+                            _command_file_args(path),
+                            os.path.dirname(path) if prev_arg == "-F" else base_dir,
+                        )
+                    )
+                prev_arg = arg
+        return files
 
     def test(
         self,
@@ -317,6 +539,8 @@ class Runner(ABC):
         timescale: Optional[Tuple[str, str]] = None,
         log_file: Optional[PathLike] = None,
         test_filter: Optional[str] = None,
+        parallel: int = 1,
+        test_durations: Optional[PathLike] = None,
     ) -> Path:
         """Run the tests.
 
@@ -351,6 +575,24 @@ class Runner(ABC):
             log_file: File to write the test log to.
             test_filter: Regular expression which matches test names.
                 Only matched tests are run if this argument if given.
+            parallel: Number of simulator processes to split the tests between.
+                The processes run concurrently, each running every *parallel*-th test
+                (see :envvar:`COCOTB_TEST_SHARD`),
+                and their results are merged into a single results XML file.
+                Process *N* runs in the ``shardN`` subdirectory of *test_dir*,
+                so files the simulator writes to its working directory are kept apart.
+                If *log_file* is given, the logs of the processes are written to it one after another.
+                All processes use the same random seed, which is chosen here if not given.
+                Cannot be used together with *gui* or *waves*.
+
+                .. versionadded:: 2.0
+
+            test_durations: File to keep the durations of the tests in between runs,
+                which are used to run the tests longest first and to split them evenly between the *parallel* processes
+                (see :envvar:`COCOTB_TEST_DURATIONS`).
+                A relative path is relative to *test_dir*.
+
+                .. versionadded:: 2.0
 
         Returns:
             The absolute location of the results XML file which can be
@@ -359,6 +601,11 @@ class Runner(ABC):
 
         __tracebackhide__ = True  # Hide the traceback when using pytest
 
+        if parallel < 1:
+            raise ValueError(f"parallel must be at least 1, got {parallel}")
+        if parallel > 1 and (gui or waves):
+            raise ValueError("parallel cannot be used together with gui or waves")
+
         if build_dir is not None:
             self.build_dir = get_abs_path(build_dir)
 
@@ -409,6 +656,11 @@ class Runner(ABC):
         if seed is not None:
             self.env["COCOTB_RANDOM_SEED"] = str(seed)
 
+        if test_durations is not None:
+            self.env["COCOTB_TEST_DURATIONS"] = str(
+                Path(self.test_dir) / test_durations
+            )
+
         self.log_file = log_file
         self.waves = waves
         self.gui = gui
@@ -441,15 +693,19 @@ class Runner(ABC):
         # transport the settings to cocotb via environment variables
         self._set_env()
         self.env["COCOTB_RESULTS_FILE"] = str(results_xml_file)
+        self._set_hierarchy_cache_env()
 
         cmds: Sequence[_Command] = self._test_command()
         simulator_exit_code: int = 0
-        try:
-            self._execute(cmds, cwd=self.test_dir)
-        except subprocess.CalledProcessError as e:
-            # It is possible for the simulator to fail but still leave results.
-            self.log.error("Simulation failed: %d", e.returncode)
-            simulator_exit_code = e.returncode
+        if parallel > 1:
+            simulator_exit_code = self._execute_shards(cmds, parallel, results_xml_file)
+        else:
+            try:
+                self._execute(cmds, cwd=self.test_dir)
+            except subprocess.CalledProcessError as e:
+                # It is possible for the simulator to fail but still leave results.
+                self.log.error("Simulation failed: %d", e.returncode)
+                simulator_exit_code = e.returncode
 
         # Only when running under pytest, check the results file here,
         # potentially raising an exception with failing testcases,
@@ -495,10 +751,17 @@ class Runner(ABC):
                 self._execute_cmds(cmds, cwd, f)
 
     def _execute_cmds(
-        self, cmds: Sequence[_Command], cwd: PathLike, stdout: Optional[TextIO] = None
+        self,
+        cmds: Sequence[_Command],
+        cwd: PathLike,
+        stdout: Optional[TextIO] = None,
+        env: Optional[Mapping[str, str]] = None,
     ) -> None:
         __tracebackhide__ = True  # Hide the traceback when using PyTest.
 
+        if env is None:
+            env = self.env
+
         for cmd in cmds:
             self.log.info("Running command %s in directory %s", _shlex_join(cmd), cwd)
 
@@ -507,8 +770,147 @@ class Runner(ABC):
 
             stderr = None if stdout is None else subprocess.STDOUT
             subprocess.run(
-                cmd, cwd=cwd, env=self.env, check=True, stdout=stdout, stderr=stderr
+                cmd, cwd=cwd, env=env, check=True, stdout=stdout, stderr=stderr
+            )
+
+    def _execute_shards(
+        self, cmds: Sequence[_Command], num_shards: int, results_xml_file: Path
+    ) -> int:
+        """Run *cmds* in *num_shards* concurrent simulator processes and merge their results.
+
+        Returns:
+            The first non-zero exit code of the simulator processes, or ``0``.
+        """
+        __tracebackhide__ = True  # Hide the traceback when using PyTest.
+
+        # all shards must use the same seed so the tests are reproducible
+        if "COCOTB_RANDOM_SEED" not in self.env and not any(
+            plusarg.startswith(("+seed=", "+ntb_random_seed="))
+            for plusarg in self.plusargs
+        ):
+            self.env["COCOTB_RANDOM_SEED"] = str(int(time.time()))
+
+        # each shard runs in its own directory, so files the simulators write
+        # to their working directory don't collide
+        shard_dirs = [
+            Path(self.test_dir) / f"shard{shard}" for shard in range(num_shards)
+        ]
+        for shard_dir in shard_dirs:
+            self._prepare_shard_dir(shard_dir)
+        shard_results_files = [
+            shard_dir / results_xml_file.name for shard_dir in shard_dirs
+        ]
+        shard_log_files: List[Optional[Path]] = [
+            None
+            if self.log_file is None
+            else get_abs_path(f"{self.log_file}.shard{shard}")
+            for shard in range(num_shards)
+        ]
+
+        def run_shard(shard: int) -> int:
+            env = dict(self.env)
+            env["COCOTB_TEST_SHARD"] = f"{shard}/{num_shards}"
+            env["COCOTB_RESULTS_FILE"] = str(shard_results_files[shard])
+            log_file = shard_log_files[shard]
+            try:
+                if log_file is None:
+                    self._execute_cmds(cmds, shard_dirs[shard], env=env)
+                else:
+                    with open(log_file, "w") as f:
+                        self._execute_cmds(cmds, shard_dirs[shard], f, env=env)
+            except subprocess.CalledProcessError as e:
+                self.log.error("Simulation of shard %d failed: %d", shard, e.returncode)
+                return e.returncode
+            return 0
+
+        for shard_results_file in shard_results_files:
+            with suppress(OSError):
+                os.remove(shard_results_file)
+
+        # the simulators run in their own processes, so threads are enough to wait on them
+        with ThreadPoolExecutor(max_workers=num_shards) as executor:
+            exit_codes = list(executor.map(run_shard, range(num_shards)))
+
+        if self.log_file is not None:
+            with open(self.log_file, "w") as f:
+                for shard_log_file in shard_log_files:
+                    assert shard_log_file is not None
+                    f.write(shard_log_file.read_text())
+                    os.remove(shard_log_file)
+
+        # merge the results, leaving out results files of crashed simulators
+        results = ET.Element("testsuites", name="results")
+        _combine_testsuites(
+            results, (str(f) for f in shard_results_files if f.is_file())
+        )
+        for testsuite in results:
+            properties = set()
+            for prop in testsuite.findall("property"):
+                key = (prop.get("name"), prop.get("value"))
+                if key in properties:
+                    testsuite.remove(prop)
+                properties.add(key)
+        if len(results):
+            ET.ElementTree(results).write(results_xml_file, encoding="UTF-8")
+        if "COCOTB_TEST_DURATIONS" in self.env:
+            self._save_test_durations(self.env["COCOTB_TEST_DURATIONS"], results)
+        for shard_results_file in shard_results_files:
+            with suppress(OSError):
+                os.remove(shard_results_file)
+
+        return next((code for code in exit_codes if code != 0), 0)
+
+    def _shard_links(self) -> List[str]:
+        """Return glob patterns of the files in *test_dir* the test commands look up relative to their working directory.
+
+        The top-level entries of *test_dir* which match are linked into the working directory of each shard.
+        """
+        return []
+
+    def _prepare_shard_dir(self, shard_dir: Path) -> None:
+        """Create the working directory *shard_dir* of a shard, linking in the entries of *test_dir* given by :meth:`_shard_links`."""
+        test_dir = Path(self.test_dir)
+        os.makedirs(shard_dir, exist_ok=True)
+        names = {
+            path.relative_to(test_dir).parts[0]
+            for pattern in self._shard_links()
+            for path in test_dir.glob(pattern)
+        }
+        for name in sorted(names):
+            target = test_dir / name
+            link = shard_dir / name
+            if link.is_symlink() or link.is_file():
+                link.unlink()
+            elif link.is_dir():
+                shutil.rmtree(link)
+            try:
+                link.symlink_to(target, target_is_directory=target.is_dir())
+            except OSError:
+                # creating symbolic links may not be permitted on Windows
+                if target.is_dir():
+                    shutil.copytree(target, link)
+                else:
+                    shutil.copy2(target, link)
+
+    def _save_test_durations(self, filename: str, results: ET.Element) -> None:
+        """Add the durations of the tests run by the shards in *results* to the :envvar:`COCOTB_TEST_DURATIONS` file.
+
+        The shards leave this to the runner, as they must all schedule the tests based on the same durations.
+        """
+        from cocotb._test_durations import _TestDurations
+
+        durations = _TestDurations(filename)
+        for testcase in results.iter("testcase"):
+            wall_time_s = float(testcase.get("time", 0))
+            # skipped tests and tests of crashed simulators have no duration
+            if testcase.find("skipped") is not None or wall_time_s == 0:
+                continue
+            durations.add(
+                f"{testcase.get('classname')}.{testcase.get('name')}",
+                wall_time_s,
+                float(testcase.get("sim_time_ns", 0)),
             )
+        durations.save()
 
     def rm_build_folder(self, build_dir: Path) -> None:
         if os.path.isdir(build_dir):
@@ -536,6 +938,39 @@ def outdated(output: Path, dependencies: Sequence[Path]) -> bool:
     return dep_mtime > output_mtime
 
 
+# options of the simulators which read further arguments from a file
+_command_file_options = ("-f", "-F", "-file", "-c")
+
+_verilog_include_re = re.compile(rb'`include\s+"([^"]+)"')
+
+
+def _command_file_args(path: str) -> List[str]:
+    """Return the arguments in the command file *path*, without comments."""
+    args = []
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            with suppress(ValueError):
+                args += shlex.split(line.split("//", 1)[0].split("#", 1)[0])
+    return args
+
+
+def _verilog_includes(path: str) -> List[str]:
+    """Return the names of the files included by the Verilog source *path*."""
+    with open(path, "rb") as f:
+        return [
+            name.decode(errors="replace")
+            for name in _verilog_include_re.findall(f.read())
+        ]
+
+
+def _file_digest(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 def get_abs_path(path: PathLike) -> Path:
     """Return *path* in absolute form."""
 
@@ -670,6 +1105,12 @@ class Icarus(Runner):
             + plusargs
         ]
 
+    def _build_outputs(self) -> List[str]:
+        return [self.sim_file.name]
+
+    def _simulator_version_command(self) -> _Command:
+        return ["iverilog", "-V"]
+
     def _build_command(self) -> List[_Command]:
         assert self.hdl_toplevel is not None
 
@@ -749,6 +1190,16 @@ class Questa(Runner):
     def _get_parameter_options(self, parameters: Mapping[str, object]) -> _Command:
         return [f"-g{name}={value}" for name, value in parameters.items()]
 
+    def _shard_links(self) -> List[str]:
+        # the library mapping and the libraries created by vlib
+        return ["modelsim.ini", "*/_info"]
+
+    def _build_outputs(self) -> List[str]:
+        return [f"{self.hdl_library}/_info"]
+
+    def _simulator_version_command(self) -> _Command:
+        return ["vsim", "-version"]
+
     def _build_command(self) -> List[_Command]:
         cmds = []
 
@@ -894,6 +1345,16 @@ class Ghdl(Runner):
     def _get_parameter_options(self, parameters: Mapping[str, object]) -> _Command:
         return [f"-g{name}={value}" for name, value in parameters.items()]
 
+    def _shard_links(self) -> List[str]:
+        # the library files, and the executable and objects elaborated by the non-mcode backends
+        return ["*.cf", "*.o", self.sim_hdl_toplevel, self.sim_hdl_toplevel.lower()]
+
+    def _build_outputs(self) -> List[str]:
+        return [f"{self.hdl_library}-obj*.cf"]
+
+    def _simulator_version_command(self) -> _Command:
+        return ["ghdl", "--version"]
+
     def _build_command(self) -> List[_Command]:
         for source in self.sources:
             if not is_vhdl_source(source):
@@ -999,6 +1460,12 @@ class Nvc(Runner):
     def _get_parameter_options(self, parameters: Mapping[str, object]) -> _Command:
         return [f"-g{name}={value}" for name, value in parameters.items()]
 
+    def _build_outputs(self) -> List[str]:
+        return [self.hdl_library.lower()]
+
+    def _simulator_version_command(self) -> _Command:
+        return ["nvc", "--version"]
+
     def _build_command(self) -> List[_Command]:
         for source in self.sources:
             if not is_vhdl_source(source):
@@ -1063,6 +1530,16 @@ class Riviera(Runner):
     def _get_parameter_options(self, parameters: Mapping[str, object]) -> _Command:
         return [f"-g{name}={value}" for name, value in parameters.items()]
 
+    def _shard_links(self) -> List[str]:
+        # the library mapping and the libraries created by alib
+        return ["library.cfg", "*/*.lib"]
+
+    def _build_outputs(self) -> List[str]:
+        return [f"{self.hdl_library}/{self.hdl_library}.lib"]
+
+    def _simulator_version_command(self) -> _Command:
+        return ["vsimsa", "-version"]
+
     def _build_command(self) -> List[_Command]:
         do_script: List[str] = ["onerror {\n quit -code 1 \n}"]
 
@@ -1213,6 +1690,13 @@ class Verilator(Runner):
     def _get_parameter_options(self, parameters: Mapping[str, object]) -> _Command:
         return [f"-G{name}={value}" for name, value in parameters.items()]
 
+    def _build_outputs(self) -> List[str]:
+        assert self.hdl_toplevel is not None
+        return [self.hdl_toplevel]
+
+    def _simulator_version_command(self) -> _Command:
+        return ["perl", self.executable, "--version"]
+
     def _build_command(self) -> List[_Command]:
         self._simulator_in_path_build_only()
 
@@ -1319,6 +1803,12 @@ class Xcelium(Runner):
     def _get_parameter_options(self, parameters: Mapping[str, object]) -> _Command:
         return [f'-gpg "{name} => {value}"' for name, value in parameters.items()]
 
+    def _build_outputs(self) -> List[str]:
+        return ["xrun_snapshot"]
+
+    def _simulator_version_command(self) -> _Command:
+        return ["xrun", "-version"]
+
     def _build_command(self) -> List[_Command]:
         self.env["CDS_AUTO_64BIT"] = "all"
 
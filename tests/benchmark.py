@@ -2,9 +2,19 @@
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import random
 import sys
 from pathlib import Path
 
+import pytest
+
+import cocotb
+from cocotb._scheduler import Scheduler
+from cocotb.queue import Queue
+from cocotb.task import Task
+from cocotb.triggers import Event, Lock
+from cocotb.types import LogicArray, Range
+from cocotb_tools.check_results import get_results
 from cocotb_tools.runner import get_runner
 
 
@@ -56,3 +66,192 @@ def test_matrix_multiplier_icarus(benchmark):
 
 def test_matrix_multiplier_nvc(benchmark):
     build_and_run_matrix_multiplier(benchmark, "nvc")
+
+
+def setup_waiting_tasks(num_tasks):
+    """Start *num_tasks* tasks all waiting on the same trigger of a new Event."""
+    cocotb._scheduler_inst = Scheduler(test_complete_cb=lambda: None)
+    event = Event()
+    trigger = event.wait()
+
+    async def waiter():
+        await trigger
+
+    tasks = [Task(waiter()) for _ in range(num_tasks)]
+    for task in tasks:
+        cocotb._scheduler_inst._schedule_task(task)
+    cocotb._scheduler_inst._event_loop()
+    return (event, tasks), {}
+
+
+@pytest.mark.parametrize("num_tasks", [10, 100, 1000, 10000, 100000])
+def test_scheduler_wake_waiting_tasks(benchmark, num_tasks):
+    def wake(event, tasks):
+        event.set()
+        cocotb._scheduler_inst._event_loop()
+        assert all(task.done() for task in tasks)
+
+    benchmark.pedantic(wake, setup=lambda: setup_waiting_tasks(num_tasks), rounds=5)
+
+
+@pytest.mark.parametrize("num_tasks", [10, 100, 1000, 10000, 100000])
+def test_scheduler_kill_waiting_tasks(benchmark, num_tasks):
+    def kill(event, tasks):
+        for task in tasks:
+            task.kill()
+        assert not cocotb._scheduler_inst._trigger2tasks
+
+    benchmark.pedantic(kill, setup=lambda: setup_waiting_tasks(num_tasks), rounds=5)
+
+
+def run_tasks(*coros):
+    """Run *coros* as tasks on a new scheduler until they are all done."""
+    cocotb._scheduler_inst = Scheduler(test_complete_cb=lambda: None)
+    tasks = [Task(coro) for coro in coros]
+    for task in tasks:
+        cocotb._scheduler_inst._schedule_task(task)
+    cocotb._scheduler_inst._event_loop()
+    assert all(task.done() for task in tasks)
+
+
+@pytest.mark.parametrize("maxsize", [0, 1, 100])
+def test_queue_throughput(benchmark, maxsize):
+    num_items = 10000
+
+    async def producer(queue):
+        for i in range(num_items):
+            await queue.put(i)
+
+    async def consumer(queue):
+        for _ in range(num_items):
+            await queue.get()
+
+    @benchmark
+    def run():
+        queue = Queue(maxsize=maxsize)
+        run_tasks(producer(queue), consumer(queue))
+
+
+def test_event_ping_pong(benchmark):
+    num_rounds = 10000
+
+    async def player(wait_on, set_next):
+        for _ in range(num_rounds):
+            await wait_on.wait()
+            wait_on.clear()
+            set_next.set()
+
+    @benchmark
+    def run():
+        ping = Event()
+        pong = Event()
+        ping.set()
+        run_tasks(player(ping, pong), player(pong, ping))
+
+
+@pytest.mark.parametrize("num_tasks", [1, 10, 100])
+def test_lock_churn(benchmark, num_tasks):
+    num_acquires = 10000 // num_tasks
+
+    async def worker(lock, release):
+        for _ in range(num_acquires):
+            async with lock:
+                await release.wait()
+
+    @benchmark
+    def run():
+        lock = Lock()
+        # an already set Event, so holding the lock still yields to the scheduler
+        release = Event()
+        release.set()
+        run_tasks(*(worker(lock, release) for _ in range(num_tasks)))
+
+
+@pytest.mark.parametrize("kind", ["int", "str", "list"])
+def test_logic_array_construction(benchmark, kind):
+    rng = random.Random(0)
+    values = [rng.getrandbits(64) for _ in range(1000)]
+    if kind == "int":
+        benchmark(lambda: [LogicArray.from_unsigned(v, 64) for v in values])
+    elif kind == "str":
+        strs = [format(v, "064b") for v in values]
+        benchmark(lambda: [LogicArray(v) for v in strs])
+    else:
+        lists = [list(format(v, "064b")) for v in values]
+        benchmark(lambda: [LogicArray(v) for v in lists])
+
+
+@pytest.mark.parametrize("op", ["and", "or", "xor", "invert"])
+def test_logic_array_bitwise(benchmark, op):
+    rng = random.Random(0)
+
+    # new operands each round, so the values cached by the previous round aren't reused
+    def setup():
+        pairs = [
+            (
+                LogicArray.from_unsigned(rng.getrandbits(64), 64),
+                LogicArray.from_unsigned(rng.getrandbits(64), 64),
+            )
+            for _ in range(1000)
+        ]
+        return (pairs,), {}
+
+    if op == "and":
+        benchmark.pedantic(
+            lambda pairs: [a & b for a, b in pairs], setup=setup, rounds=20
+        )
+    elif op == "or":
+        benchmark.pedantic(
+            lambda pairs: [a | b for a, b in pairs], setup=setup, rounds=20
+        )
+    elif op == "xor":
+        benchmark.pedantic(
+            lambda pairs: [a ^ b for a, b in pairs], setup=setup, rounds=20
+        )
+    else:
+        benchmark.pedantic(lambda pairs: [~a for a, _ in pairs], setup=setup, rounds=20)
+
+
+def test_range_indexing(benchmark):
+    r = Range(1023, "downto", 0)
+
+    @benchmark
+    def run():
+        for i in range(len(r)):
+            r.index(r[i])
+
+
+def run_sample_module(benchmark, testcase):
+    """Benchmark running the *testcase* of ``benchmark_sim`` on the sample module in Icarus."""
+    tests_path = Path(__file__).resolve().parent
+    sys.path.append(str(tests_path))
+
+    runner = get_runner("icarus")
+    runner.build(
+        hdl_toplevel="sample_module",
+        sources=[tests_path / "designs" / "sample_module" / "sample_module.sv"],
+        build_dir="sim_build_benchmark",
+    )
+
+    @benchmark
+    def run_test():
+        results = runner.test(
+            hdl_toplevel="sample_module",
+            test_module="benchmark_sim",
+            testcase=testcase,
+            seed=123456789,
+        )
+        _, num_failed = get_results(results)
+        assert num_failed == 0
+
+
+def test_sim_startup_icarus(benchmark):
+    run_sample_module(benchmark, "empty")
+
+
+def test_sim_signal_read_write_icarus(benchmark):
+    run_sample_module(benchmark, "signal_read_write")
+
+
+def test_sim_edge_wakeups_icarus(benchmark):
+    run_sample_module(benchmark, "edge_wakeups")
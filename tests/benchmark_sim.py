@@ -0,0 +1,40 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests run on the sample module by the simulator benchmarks in ``benchmark.py``."""
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer
+
+
+@cocotb.test
+async def empty(dut) -> None:
+    """Measures the startup and shutdown time of a regression."""
+
+
+@cocotb.test
+async def signal_read_write(dut) -> None:
+    """Measures the throughput of scheduled signal writes and reads."""
+    signals = [
+        dut.stream_in_data,
+        dut.stream_in_data_dword,
+        dut.stream_in_data_39bit,
+        dut.stream_in_data_wide,
+        dut.stream_in_data_dqword,
+    ]
+    for i in range(10000):
+        for signal in signals:
+            signal.value = i & 0xFF
+        await Timer(1, "ns")
+        for signal in signals:
+            signal.value  # noqa: B018
+
+
+@cocotb.test
+async def edge_wakeups(dut) -> None:
+    """Measures the number of edge-triggered wakeups per second."""
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+    rising_edge = RisingEdge(dut.clk)
+    for _ in range(10000):
+        await rising_edge
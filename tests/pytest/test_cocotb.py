@@ -31,6 +31,7 @@ module_name = [
     "test_tests",
     "test_timing_triggers",
     "test_sim_time_utils",
+    "test_trace",
 ]
 
 hdl_toplevel_lang = os.getenv("HDL_TOPLEVEL_LANG", "verilog")
@@ -0,0 +1,91 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+import sys
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from cocotb._xunit_reporter import XUnitReporter
+from cocotb_tools import combine_results
+
+
+def _write_results(filename, package, tests, jsonl_filename=None):
+    xunit = XUnitReporter(filename=str(filename), jsonl_filename=jsonl_filename)
+    xunit.add_testsuite(name="all", package=package)
+    xunit.add_property(name="random_seed", value="1")
+    for name, time, failed in tests:
+        xunit.add_testcase(
+            name=name,
+            classname="mod",
+            file="test_mod.py",
+            lineno="1",
+            time=repr(time),
+            sim_time_ns=repr(time * 1000),
+            ratio_time=repr(1000.0),
+        )
+        if failed:
+            xunit.add_failure(message="failed <badly> & é")
+    xunit.write()
+
+
+def _combine_in_memory(fnames, name):
+    # what the combined results are expected to be, merged as a single tree
+    result = ET.Element("testsuites", name=name)
+    combine_results._combine_testsuites(result, fnames)
+    return result
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_combine_results(tmp_path, monkeypatch, capsys, jobs):
+    _write_results(tmp_path / "results_a.xml", "pkg", [("test_a", 2.0, False)])
+    _write_results(
+        tmp_path / "results_b.xml",
+        "pkg",
+        [("test_b", 5.0, True), ("test_c", 1.0, False)],
+        jsonl_filename=str(tmp_path / "results_b.jsonl"),
+    )
+    _write_results(tmp_path / "results_c.xml", "other", [("test_d", 3.0, False)])
+    (tmp_path / "results_empty.xml").write_text(
+        "<testsuites name='results'><testsuite name='none' /></testsuites>"
+    )
+
+    output = tmp_path / "combined.xml"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "combine_results",
+            str(tmp_path),
+            "-i",
+            r"results_.*\.(xml|jsonl)",
+            "-o",
+            str(output),
+            "--jobs",
+            str(jobs),
+            "--statistics",
+            "2",
+        ],
+    )
+    monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+
+    # the failing test is read from both the XML and the JSON Lines file
+    assert combine_results.main() == 1
+
+    # the same as combining the parsed files in memory
+    expected = tmp_path / "expected.xml"
+    fnames = combine_results._find_all(r"results_.*\.(xml|jsonl)", str(tmp_path))
+    ET.ElementTree(_combine_in_memory(fnames, "results")).write(
+        expected, encoding="UTF-8"
+    )
+    assert output.read_bytes() == expected.read_bytes()
+
+    out = capsys.readouterr().out
+    assert (
+        out.count("Failure in testsuite: 'all' classname: 'mod' testcase: 'test_b'")
+        == 2
+    )
+    assert "Ran a total of 3 TestSuites and 6 TestCases" in out
+    assert "Total time: 17.00 s, total simulation time: 17000.00 ns" in out
+    slowest = out.split("Slowest 2 TestCases:\n")[1].splitlines()
+    assert [line.split()[-1] for line in slowest] == ["mod.test_b", "mod.test_b"]
@@ -0,0 +1,48 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+from cocotb._hierarchy_cache import _HierarchyCache
+
+
+def test_hierarchy_cache_roundtrip(tmp_path):
+    filename = str(tmp_path / "hierarchy.json")
+    key = {"build": "1"}
+
+    cache = _HierarchyCache(filename, key)
+    assert cache.children("top") is None
+    cache.set_children("top", ["clk", "data"])
+    cache.set_children("top.gen", [0, 1])
+    cache.add_missing("top", "nope")
+    cache.save()
+
+    cache = _HierarchyCache(filename, key)
+    assert cache.children("top") == ["clk", "data"]
+    assert cache.children("top.gen") == [0, 1]
+    assert cache.is_missing("top", "nope")
+    assert not cache.is_missing("top", "clk")
+
+    # a different key discards the saved index
+    cache = _HierarchyCache(filename, {"build": "2"})
+    assert cache.children("top") is None
+    assert not cache.is_missing("top", "nope")
+
+
+def test_hierarchy_cache_merge(tmp_path):
+    filename = str(tmp_path / "hierarchy.json")
+    key = {"build": "1"}
+
+    # two runs discovering different parts of the hierarchy at the same time
+    cache1 = _HierarchyCache(filename, key)
+    cache2 = _HierarchyCache(filename, key)
+    cache1.set_children("top", ["a"])
+    cache1.add_missing("top", "x")
+    cache2.set_children("top.a", ["b"])
+    cache2.add_missing("top", "y")
+    cache1.save()
+    cache2.save()
+
+    cache = _HierarchyCache(filename, key)
+    assert cache.children("top") == ["a"]
+    assert cache.children("top.a") == ["b"]
+    assert cache.is_missing("top", "x")
+    assert cache.is_missing("top", "y")
@@ -214,6 +214,41 @@ def test_logic_array_invert():
     assert ~LogicArray("01XZ") == LogicArray("10XX")
 
 
+def test_logic_array_bitwise_4state():
+    # packed implementation must agree with the element-wise Logic operators
+    values = "01XZ"
+    l = LogicArray(values * 4)
+    p = LogicArray("".join(v * 4 for v in values))
+    for op in ("&", "|", "^"):
+        result = eval(f"l {op} p")
+        expected = LogicArray(eval(f"a {op} b") for a, b in zip(list(l), list(p)))
+        assert str(result) == str(expected)
+    assert str(~l) == str(LogicArray(~a for a in list(l)))
+
+
+def test_logic_array_bitwise_9state():
+    l = LogicArray("UX01ZWLH-")
+    p = LogicArray("01HL-UXZW")
+    assert (l & p) == LogicArray("0X00XU0XX")
+    assert (l | p) == LogicArray("U111XUX1X")
+    assert (l ^ p) == LogicArray("UX11XUXXX")
+    assert ~l == LogicArray("UX10XX10X")
+    # mixing 4-state and 9-state values
+    assert (LogicArray("01XZ") & LogicArray("LHLH")) == LogicArray("010X")
+
+
+def test_logic_array_bitwise_wide():
+    a = LogicArray.from_unsigned(2**512 - 1, 512)
+    b = LogicArray.from_unsigned(0xDEADBEEF << 480, 512)
+    assert (a & b).to_unsigned() == 0xDEADBEEF << 480
+    assert (a ^ b).to_unsigned() == (2**512 - 1) ^ (0xDEADBEEF << 480)
+    assert (~a).to_unsigned() == 0
+    c = b & LogicArray("X" + "1" * 511)
+    assert str(c) == "X" + str(b)[1:]
+    assert c[510:0] == b[510:0]
+    assert c[511:480] == LogicArray("X" + bin(0xDEADBEEF)[3:])
+
+
 def test_logic_array_literal_casts():
     assert str(LogicArray("UX01ZWLH-")) == "UX01ZWLH-"
     assert int(LogicArray("0101010")) == 0b0101010
@@ -438,6 +473,22 @@ def test_resolve_x():
     assert (rand_val >> 6) & 1 == 0
 
 
+def test_resolve_lh_keeps_value():
+    a = LogicArray("LHLH")
+    assert not a.is_resolvable
+    assert a.to_unsigned() == 0b0101
+    # resolving L and H to an int doesn't turn them into 0 and 1
+    assert not a.is_resolvable
+    assert str(a) == "LHLH"
+    assert a != LogicArray("0101")
+    assert a != LogicArray._from_planes(0b0101, 0, Range(3, "downto", 0))
+    assert a == LogicArray("LHLH")
+
+    b = LogicArray("LHLH")
+    b.to_unsigned()
+    assert (a & LogicArray("1111")) == (b & LogicArray("1111")) == LogicArray("0101")
+
+
 def test_resolve_default_behavior():
     import cocotb.types.logic_array
 
@@ -4,6 +4,7 @@
 
 import os
 import sys
+from xml.etree import ElementTree as ET
 
 import pytest
 from test_cocotb import (
@@ -19,6 +20,7 @@ from test_cocotb import (
     tests_dir,
 )
 
+from cocotb_tools.check_results import get_results
 from cocotb_tools.runner import get_runner
 
 pytestmark = pytest.mark.simulator_required
@@ -61,3 +63,72 @@ def test_cocotb_parallel(seed):
         build_dir=sim_build,
         timescale=timescale,
     )
+
+
+def _testcases(results_xml_file):
+    """Return the (classname, name) of every testcase in *results_xml_file*, in order."""
+    tree = ET.parse(results_xml_file)
+    return [(tc.get("classname"), tc.get("name")) for tc in tree.iter("testcase")]
+
+
+def test_cocotb_parallel_shards():
+    runner = get_runner(sim)
+
+    runner.build_args = compile_args
+    runner.sources = sources
+    runner.verilog_sources = []
+    runner.vhdl_sources = []
+
+    testcases = {}
+    for parallel in (1, 4):
+        results_xml_file = runner.test(
+            seed=1234,
+            hdl_toplevel_lang=hdl_toplevel_lang,
+            hdl_toplevel=hdl_toplevel,
+            gpi_interfaces=gpi_interfaces,
+            test_module=module_name,
+            test_args=sim_args,
+            build_dir=sim_build,
+            timescale=timescale,
+            test_filter=r"^test_(clock|edge_triggers|queues)\.",
+            parallel=parallel,
+        )
+        testcases[parallel] = _testcases(results_xml_file)
+
+    # the results of all shards are merged into one file
+    assert not list(results_xml_file.parent.glob(f"{results_xml_file.stem}.shard*"))
+
+    # every test, run or excluded by the filter, is reported by exactly one shard
+    assert len(testcases[1]) > 0
+    assert len(testcases[4]) == len(set(testcases[4]))
+    assert set(testcases[4]) == set(testcases[1])
+
+
+def test_cocotb_parallel_durations(tmp_path):
+    runner = get_runner(sim)
+
+    runner.build_args = compile_args
+    runner.sources = sources
+    runner.verilog_sources = []
+    runner.vhdl_sources = []
+
+    durations_file = tmp_path / "durations.json"
+    num_tests = []
+    for _ in range(2):
+        results_xml_file = runner.test(
+            seed=1234,
+            hdl_toplevel_lang=hdl_toplevel_lang,
+            hdl_toplevel=hdl_toplevel,
+            gpi_interfaces=gpi_interfaces,
+            test_module=module_name,
+            test_args=sim_args,
+            build_dir=sim_build,
+            timescale=timescale,
+            parallel=4,
+            test_durations=durations_file,
+        )
+        num_tests.append(get_results(results_xml_file)[0])
+
+    # the shards of the second run are balanced by the durations of the first
+    assert durations_file.is_file()
+    assert num_tests[0] == num_tests[1] > 0
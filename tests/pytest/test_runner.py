@@ -2,7 +2,9 @@
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
 
+import logging
 import os
+import shutil
 import sys
 
 import find_libpython
@@ -155,3 +157,61 @@ def test_missing_libpython(monkeypatch):
             gpi_interfaces=gpi_interfaces,
             extra_env=sim_params,
         )
+
+
+def test_build_cache(caplog, tmp_path):
+    hdl_toplevel_lang = os.getenv("HDL_TOPLEVEL_LANG", "verilog")
+    if hdl_toplevel_lang == "verilog":
+        source = os.path.join(tests_dir, "designs", "runner", "runner.v")
+    else:
+        source = os.path.join(tests_dir, "designs", "runner", "runner.vhdl")
+    # copy the source so it can be changed
+    source_copy = tmp_path / os.path.basename(source)
+    shutil.copy(source, source_copy)
+
+    runner = get_runner(sim)
+    build_args = ["-v93"] if sim == "xcelium" else []
+    build_dir = tmp_path / "sim_build"
+
+    def build():
+        runner.build(
+            sources=[source_copy],
+            hdl_toplevel="runner",
+            defines={"DEFINE": 4},
+            includes=[os.path.join(tests_dir, "designs", "basic_hierarchy_module")],
+            build_args=build_args,
+            build_dir=build_dir,
+        )
+
+    build()
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        build()
+    assert "is up to date" in caplog.text
+
+    with open(source_copy, "a") as f:
+        f.write("\n")
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        build()
+    assert "is up to date" not in caplog.text
+
+    # the build is redone when its outputs are gone, even if the cache is kept
+    for pattern in runner._build_outputs():
+        for output in build_dir.glob(pattern):
+            if output.is_dir():
+                shutil.rmtree(output)
+            else:
+                output.unlink()
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        build()
+    assert "is up to date" not in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        build()
+    assert "is up to date" in caplog.text
@@ -0,0 +1,48 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+from cocotb._test_durations import _balance, _TestDurations
+
+
+def test_test_durations_roundtrip(tmp_path):
+    filename = str(tmp_path / "durations.json")
+
+    durations = _TestDurations(filename, history=2)
+    assert durations.wall_time("mod.test_a") is None
+    durations.add("mod.test_a", 1.0, 100.0)
+    durations.add("mod.test_a", 3.0, 100.0)
+    durations.add("mod.test_b", 5.0, 200.0)
+    assert durations.wall_time("mod.test_a") == 2.0
+    durations.save()
+
+    # only the last runs are kept
+    durations = _TestDurations(filename, history=2)
+    durations.add("mod.test_a", 5.0, 100.0)
+    assert durations.wall_time("mod.test_a") == 4.0
+    durations.save()
+
+    durations = _TestDurations(filename, history=2)
+    assert durations.wall_time("mod.test_a") == 4.0
+    assert durations.wall_time("mod.test_b") == 5.0
+
+
+def test_test_durations_merge(tmp_path):
+    filename = str(tmp_path / "durations.json")
+
+    # two runs of different tests at the same time
+    durations1 = _TestDurations(filename)
+    durations2 = _TestDurations(filename)
+    durations1.add("mod.test_a", 1.0, 100.0)
+    durations2.add("mod.test_b", 2.0, 200.0)
+    durations1.save()
+    durations2.save()
+
+    durations = _TestDurations(filename)
+    assert durations.wall_time("mod.test_a") == 1.0
+    assert durations.wall_time("mod.test_b") == 2.0
+
+
+def test_balance():
+    assert _balance([8.0, 7.0, 6.0, 5.0, 4.0], 2) == [0, 1, 1, 0, 0]
+    assert _balance([1.0, 1.0, 1.0, 1.0], 3) == [0, 1, 2, 0]
+    assert _balance([], 2) == []
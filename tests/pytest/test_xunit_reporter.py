@@ -0,0 +1,69 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+from xml.etree import ElementTree as ET
+
+from cocotb._xunit_reporter import XUnitReporter
+from cocotb_tools.check_results import _read_results, get_results
+
+
+def _summary(root):
+    return [
+        (
+            ts.get("name"),
+            [(e.tag, e.get("name"), [c.tag for c in e]) for e in ts],
+        )
+        for ts in root.iter("testsuite")
+    ]
+
+
+def test_xunit_reporter_streaming(tmp_path):
+    xml_file = tmp_path / "results.xml"
+    jsonl_file = tmp_path / "results.jsonl"
+    xunit = XUnitReporter(filename=str(xml_file), jsonl_filename=str(jsonl_file))
+    xunit.add_testsuite(name="all", package="all")
+    xunit.add_property(name="random_seed", value="1")
+    xunit.add_testcase(name="test_a", classname="mod")
+    xunit.add_testcase(name="test_b", classname="mod")
+    xunit.add_failure(message="failed <badly>")
+    xunit.flush()
+
+    # the file is complete after each flush
+    assert get_results(xml_file) == (2, 1)
+
+    xunit.add_testcase(name="test_c", classname="mod")
+    xunit.add_skipped()
+    xunit.write()
+
+    assert get_results(xml_file) == (3, 1)
+    assert get_results(jsonl_file) == (3, 1)
+
+    root = ET.parse(xml_file).getroot()
+    assert _summary(root) == [
+        (
+            "all",
+            [
+                ("property", "random_seed", []),
+                ("testcase", "test_a", []),
+                ("testcase", "test_b", ["failure"]),
+                ("testcase", "test_c", ["skipped"]),
+            ],
+        )
+    ]
+    assert root.find("testsuite/testcase/failure").get("message") == "failed <badly>"
+    assert _summary(_read_results(jsonl_file)) == _summary(root)
+
+
+def test_read_results_truncated_jsonl(tmp_path):
+    jsonl_file = tmp_path / "results.jsonl"
+    xunit = XUnitReporter(
+        filename=str(tmp_path / "results.xml"), jsonl_filename=str(jsonl_file)
+    )
+    xunit.add_testsuite(name="all", package="all")
+    xunit.add_testcase(name="test_a", classname="mod")
+    xunit.write()
+
+    with open(jsonl_file, "a") as f:
+        f.write('{"testcase": {"name": "test_')
+
+    assert get_results(jsonl_file) == (1, 0)
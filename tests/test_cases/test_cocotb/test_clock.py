@@ -15,7 +15,7 @@ import pytest
 import cocotb
 from cocotb.clock import Clock
 from cocotb.simulator import clock_create, get_precision
-from cocotb.triggers import RisingEdge, Timer
+from cocotb.triggers import Edge, RisingEdge, Timer
 from cocotb.utils import get_sim_time
 
 LANGUAGE = os.environ["TOPLEVEL_LANG"].lower().strip()
@@ -132,3 +132,75 @@ async def test_clocks_with_other_number_types(dut):
     await Timer(10, "ns")
     with pytest.warns(FutureWarning, match="cause a CancelledError to be thrown"):
         clk2.cancel()
+
+
+async def edge_times(dut, n: int) -> list:
+    times = []
+    for _ in range(n):
+        await Edge(dut.clk)
+        times.append(get_sim_time(units="step"))
+    return times
+
+
+@cocotb.test
+@cocotb.parametrize(impl=["py", "gpi"])
+async def test_clock_duty_cycle_and_phase(dut, impl: str) -> None:
+    dut.clk.value = 0
+    await Timer(10, units="step")
+    clk = Clock(dut.clk, 100, units="step", impl=impl, duty_cycle=0.25, phase=30)
+    start_time = get_sim_time(units="step")
+    clk_gen = cocotb.start_soon(clk.start())
+    times = await edge_times(dut, 5)
+    clk_gen.kill()
+
+    # first edge after the phase offset, then 25 steps high and 75 steps low
+    assert times[0] == start_time + 30
+    assert [b - a for a, b in zip(times, times[1:])] == [25, 75, 25, 75]
+
+
+@cocotb.test
+@cocotb.parametrize(impl=["py", "gpi"])
+async def test_clock_set_period(dut, impl: str) -> None:
+    clk = Clock(dut.clk, 100, units="step", impl=impl)
+    clk_gen = cocotb.start_soon(clk.start())
+    await RisingEdge(dut.clk)
+    clk.set_period(20, units="step", duty_cycle=0.5)
+    assert clk.period == 20
+    times = await edge_times(dut, 4)
+    clk_gen.kill()
+
+    # the edge already scheduled keeps the old timing
+    assert [b - a for a, b in zip(times, times[1:])] == [10, 10, 10]
+
+    with pytest.raises(ValueError):
+        clk.set_period(1, units="step")
+
+
+@cocotb.test
+async def test_clock_jitter(dut) -> None:
+    results = []
+    for impl in ("py", "gpi"):
+        dut.clk.value = 0
+        await Timer(10, units="step")
+        clk = Clock(dut.clk, 100, units="step", impl=impl, jitter=10, seed=1234)
+        start_time = get_sim_time(units="step")
+        clk_gen = cocotb.start_soon(clk.start())
+        times = await edge_times(dut, 20)
+        clk_gen.kill()
+
+        # no accumulation: each edge stays within the jitter of its ideal time
+        offsets = [t - start_time - 50 * i for i, t in enumerate(times)]
+        assert all(-10 <= o <= 10 for o in offsets)
+        assert len(set(offsets)) > 1
+        results.append(offsets)
+
+    # both implementations generate the same edges for the same seed
+    assert results[0] == results[1]
+
+
+@cocotb.test
+async def test_clock_error_jitter(dut) -> None:
+    with pytest.raises(ValueError):
+        Clock(dut.clk, 10, units="step", jitter=3)
+    with pytest.raises(ValueError):
+        Clock(dut.clk, 10, units="step", duty_cycle=1.5)
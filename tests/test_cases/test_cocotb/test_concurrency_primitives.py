@@ -239,3 +239,30 @@ async def test_invalid_trigger_types(dut):
 
     with pytest.raises(TypeError):
         await Combine(Timer(1), o)
+
+
+@cocotb.test
+async def test_first_unprimes_losers(_):
+    """Test that First stops waiting on the triggers which did not fire"""
+    e = Event()
+    slow = Timer(100, "ns")
+    fast = Timer(1, "ns")
+    assert await First(slow, fast, e.wait()) is fast
+    assert not slow._primed
+
+    async def coro():
+        await Timer(1, "ns")
+        return 5
+
+    task = cocotb.start_soon(coro())
+    assert await First(task, slow) == 5
+    assert not slow._primed
+
+
+@cocotb.test
+async def test_combine_same_trigger(_):
+    """Test that Combine only waits once on a repeated trigger"""
+    t = Timer(10, "ns")
+    start_time = get_sim_time("ns")
+    await Combine(t, t, Timer(5, "ns"))
+    assert get_sim_time("ns") - start_time == 10
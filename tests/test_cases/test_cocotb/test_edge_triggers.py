@@ -7,6 +7,7 @@ Tests for edge triggers
 * Edge
 * RisingEdge
 * FallingEdge
+* ValueChange
 * ClockCycles
 """
 
@@ -16,6 +17,7 @@ import re
 import pytest
 
 import cocotb
+from cocotb import simulator
 from cocotb._sim_versions import RivieraVersion
 from cocotb.clock import Clock
 from cocotb.triggers import (
@@ -28,8 +30,10 @@ from cocotb.triggers import (
     RisingEdge,
     SimTimeoutError,
     Timer,
+    ValueChange,
     with_timeout,
 )
+from cocotb.utils import get_sim_time
 
 LANGUAGE = os.environ["TOPLEVEL_LANG"].lower().strip()
 
@@ -243,6 +247,29 @@ async def test_clock_cycles_forked(dut):
     await b
 
 
+@cocotb.test()
+async def test_clock_cycles_count(dut):
+    """Test that ClockCycles fires after exactly the requested number of edges"""
+    clk = dut.clk
+    cocotb.start_soon(Clock(clk, 10, "ns").start())
+    await RisingEdge(clk)
+
+    start = get_sim_time("ns")
+    await ClockCycles(clk, 7)
+    assert get_sim_time("ns") - start == 70
+    assert clk.value == 1
+
+    start = get_sim_time("ns")
+    await ClockCycles(clk, 3, rising=False)
+    assert get_sim_time("ns") - start == 25
+    assert clk.value == 0
+
+    # zero cycles returns immediately
+    start = get_sim_time("ns")
+    await ClockCycles(clk, 0)
+    assert get_sim_time("ns") == start
+
+
 @cocotb.test(
     timeout_time=100,
     timeout_unit="ns",
@@ -341,6 +368,37 @@ async def test_edge_logic_vector(dut):
     await with_timeout(Edge(dut.stream_in_data), 20, "ns")
 
 
+@cocotb.test()
+async def test_value_change(dut):
+    """Test that ValueChange() passes up the new value of the signal"""
+    dut.stream_in_data.value = 0
+    dut.stream_in_valid.value = 0
+    await Timer(1, "ns")
+
+    # the value is known before the trigger first fires
+    assert ValueChange(dut.stream_in_valid).value == 0
+
+    async def change_values():
+        for val in (10, 3, 0):
+            await Timer(10, "ns")
+            dut.stream_in_data.value = val
+        await Timer(10, "ns")
+        dut.stream_in_valid.value = 1
+
+    cocotb.start_soon(change_values())
+
+    for val in (10, 3, 0):
+        trigger = await ValueChange(dut.stream_in_data)
+        assert trigger.value == val
+        assert trigger.value == dut.stream_in_data.value
+
+    trigger = await with_timeout(ValueChange(dut.stream_in_valid), 20, "ns")
+    assert trigger.value == 1
+
+    with pytest.raises(TypeError):
+        ValueChange(dut)
+
+
 # icarus doesn't support integer inputs/outputs
 @cocotb.test(skip=cocotb.SIM_NAME.lower().startswith("icarus"))
 async def test_edge_non_logic_handles(dut):
@@ -374,3 +432,27 @@ async def test_edge_trigger_repr(dut):
         repr(e),
         flags=re.IGNORECASE,
     )
+
+
+@cocotb.test
+async def test_stale_callback_deregister(dut):
+    """A fired callback's handle can't deregister the callback its object is re-armed for."""
+    fired = []
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+
+    first = simulator.register_value_change_callback(
+        dut.clk._handle, fired.append, simulator.VALUE_CHANGE, 0
+    )
+    await Timer(10, "ns")
+    assert fired == [0]
+
+    second = simulator.register_value_change_callback(
+        dut.clk._handle, fired.append, simulator.VALUE_CHANGE, 1
+    )
+    first.deregister()
+    await Timer(10, "ns")
+    assert fired == [0, 1]
+
+    # deregistering twice, or after firing, does nothing
+    second.deregister()
+    first.deregister()
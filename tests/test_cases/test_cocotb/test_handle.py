@@ -12,7 +12,15 @@ import random
 import pytest
 
 import cocotb
-from cocotb.handle import LogicArrayObject, StringObject, _Limits
+from cocotb.handle import (
+    LogicArrayObject,
+    SignalGroup,
+    StringObject,
+    _Limits,
+    dump_memory,
+    load_memory,
+    load_memory_file,
+)
 from cocotb.triggers import Edge, FallingEdge, Timer
 from cocotb.types import Logic, LogicArray
 
@@ -495,6 +503,68 @@ async def test_null_range_width(dut):
         assert len(dut.array_4_downto_7) == 4
 
 
+# GHDL unable to put values on nested array types (gh-2588)
+@cocotb.test(expect_error=Exception if SIM_NAME.startswith("ghdl") else ())
+async def test_array_value_bulk(dut) -> None:
+    """Test getting and setting the value of a logic array object in one go."""
+    dut.array_7_downto_4.value = [1, "00000010", LogicArray(3, 8), -1]
+    await Timer(1, "ns")
+    value = dut.array_7_downto_4.value
+    assert value.range == dut.array_7_downto_4.range
+    assert value == [1, 2, 3, 0xFF]
+    assert all(isinstance(v, LogicArray) for v in value)
+    assert [dut.array_7_downto_4[i].value for i in (7, 6, 5, 4)] == list(value)
+
+    # element values are converted as if assigned to each element
+    with pytest.raises(OverflowError):
+        dut.array_7_downto_4.value = [0, 0, 0, 256]
+    with pytest.raises(ValueError):
+        dut.array_7_downto_4.value = [0, 0, 0, LogicArray(0, 4)]
+    with pytest.raises(ValueError):
+        dut.array_7_downto_4.value = [0, 0, 0]
+
+    dut.array_4_to_7.value = [4, 5, 6, 7]
+    await Timer(1, "ns")
+    assert dut.array_4_to_7.value == [4, 5, 6, 7]
+    assert dut.array_4_to_7[4].value == 4
+
+
+# GHDL unable to put values on nested array types (gh-2588)
+@cocotb.test(expect_error=Exception if SIM_NAME.startswith("ghdl") else ())
+async def test_memory_load_dump(dut) -> None:
+    """Test loading and dumping the contents of a memory."""
+    mem = dut.array_7_downto_4
+    load_memory(mem, b"\x01\x02\x03\x04")
+    assert [mem[i].value for i in (4, 5, 6, 7)] == [1, 2, 3, 4]
+    assert dump_memory(mem) == b"\x01\x02\x03\x04"
+    assert dump_memory(mem, start=6) == b"\x03\x04"
+    assert dump_memory(mem, start=5, count=1) == b"\x02"
+
+    load_memory(mem, bytearray(b"\xaa\xbb"), start=6)
+    assert dump_memory(mem) == b"\x01\x02\xaa\xbb"
+
+    with pytest.raises(IndexError):
+        load_memory(mem, b"\x00\x00\x00", start=6)
+    with pytest.raises(IndexError):
+        dump_memory(mem, start=3)
+    with pytest.raises(TypeError):
+        load_memory(dut.stream_in_data, b"\x00")
+
+    with open("memory_image.bin", "wb") as f:
+        f.write(b"\x10\x20\x30\x40")
+    load_memory_file(mem, "memory_image.bin")
+    assert dump_memory(mem) == b"\x10\x20\x30\x40"
+
+    with open("memory_image.hex", "w") as f:
+        f.write("// comment\n0a 0b\n@7 0c /* comment */\n")
+    load_memory_file(mem, "memory_image.hex")
+    assert dump_memory(mem) == b"\x0a\x0b\x30\x0c"
+
+    # the design sees the loaded values
+    await Timer(1, "ns")
+    assert mem.value == [0x0C, 0x30, 0x0B, 0x0A]
+
+
 @cocotb.test
 async def test_assign_str_logic_scalar(dut) -> None:
     dut.stream_in_valid.value = 1
@@ -532,3 +602,112 @@ async def test_assign_str_logic_scalar(dut) -> None:
         dut.stream_in_valid.value = "H"
         await Timer(1, "ns")
         assert dut.stream_in_valid.value == "H"
+
+        # reading the value as an int doesn't lose the weak drive strength
+        value = LogicArray("LHLHLHLH")
+        assert value.to_unsigned() == 0x55
+        dut.stream_in_data.value = value
+        await Timer(1, "ns")
+        assert dut.stream_in_data.value == LogicArray("LHLHLHLH")
+
+
+@cocotb.test
+async def test_signal_group(dut) -> None:
+    group = SignalGroup(
+        dut.stream_in_valid, dut.stream_in_data, dut.stream_in_data_wide
+    )
+    assert len(group) == 1 + 8 + 64
+
+    group.set_values(1, 0xA5, 0x0123456789ABCDEF)
+    await Timer(1, "ns")
+    assert dut.stream_in_valid.value == 1
+    assert dut.stream_in_data.value == 0xA5
+    assert dut.stream_in_data_wide.value == 0x0123456789ABCDEF
+    assert group.values() == (Logic(1), 0xA5, 0x0123456789ABCDEF)
+    assert group.value == LogicArray(
+        "1" + "10100101" + format(0x0123456789ABCDEF, "064b")
+    )
+
+    group.value = 0
+    await Timer(1, "ns")
+    assert group.value == 0
+    assert dut.stream_in_data.value == 0
+
+    group.setimmediatevalue(LogicArray("0" + "11110000" + "1" * 64))
+    assert dut.stream_in_data.value == 0xF0
+    assert dut.stream_in_data_wide.value == 2**64 - 1
+
+    with pytest.raises(ValueError):
+        group.value = LogicArray("0101")  # not the correct size
+    with pytest.raises(ValueError):
+        group.set_values(1, 2)  # not enough values
+    with pytest.raises(TypeError):
+        SignalGroup(dut.stream_in_real)
+    with pytest.raises(ValueError):
+        SignalGroup()
+
+
+# Verilator does not support 4-state signals
+@cocotb.test(skip=SIM_NAME.startswith("verilator"))
+async def test_signal_group_4state(dut) -> None:
+    group = SignalGroup(
+        dut.stream_in_valid, dut.stream_in_data, dut.stream_in_data_wide
+    )
+    wide = LogicArray("XZ" + "01" * 31)
+    group.set_values("Z", "1X0Z1X0Z", wide)
+    await Timer(1, "ns")
+    assert group.values() == (Logic("Z"), LogicArray("1X0Z1X0Z"), wide)
+    assert group.value == LogicArray("Z" + "1X0Z1X0Z" + str(wide))
+
+    if LANGUAGE in ["vhdl"]:
+        # values which can't be represented in 4 states
+        group.set_values("H", "UWLH-01X", wide)
+        await Timer(1, "ns")
+        assert group.values() == (Logic("H"), LogicArray("UWLH-01X"), wide)
+        assert group.value == LogicArray("H" + "UWLH-01X" + str(wide))
+
+
+# Verilator does not support 4-state signals
+@cocotb.test(skip=SIM_NAME.startswith("verilator"))
+async def test_logic_array_read_4state(dut) -> None:
+    for handle in (
+        dut.stream_in_data,
+        dut.stream_in_data_39bit,
+        dut.stream_in_data_dqword,
+    ):
+        n = len(handle)
+        values = [
+            LogicArray(0, n),
+            LogicArray(2**n - 1, n),
+            LogicArray(("01XZ" * n)[:n]),
+            LogicArray(("Z1X0" * n)[:n]),
+        ]
+        for value in values:
+            handle.value = value
+            await Timer(1, "ns")
+            assert handle.value == value
+            assert str(handle.value) == str(value)
+            assert handle.value.is_resolvable == value.is_resolvable
+        handle.value = 0x5A
+        await Timer(1, "ns")
+        assert handle.value.to_unsigned() == 0x5A
+
+
+# Verilator does not support 4-state signals
+@cocotb.test(skip=SIM_NAME.startswith("verilator"))
+async def test_logic_array_write_packed(dut) -> None:
+    handle = dut.stream_in_data_dqword
+
+    # result of bitwise operations is kept packed and written without a string
+    value = LogicArray(2**128 - 1, 128) & LogicArray("X" * 64 + "Z1" * 32)
+    handle.value = value
+    await Timer(1, "ns")
+    assert handle.value == "X" * 64 + "X1" * 32
+
+    handle.value = -1
+    await Timer(1, "ns")
+    assert handle.value == LogicArray("1" * 128)
+
+    handle.value = 2**127 + 5
+    await Timer(1, "ns")
+    assert handle.value.to_unsigned() == 2**127 + 5
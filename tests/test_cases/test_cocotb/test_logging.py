@@ -5,6 +5,7 @@
 Tests for the cocotb logger
 """
 
+import io
 import logging
 import os
 
@@ -12,6 +13,8 @@ import pytest
 
 import cocotb
 import cocotb.logging
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
 
 
 class StrCallCounter:
@@ -81,6 +84,57 @@ async def test_logging_default_config(dut):
         logging.getLogger("gpi").setLevel(logging.INFO)
 
 
+@cocotb.test()
+async def test_gpi_log_ancestor_level(dut):
+    """GPI messages follow the level of the loggers and logging.disable()."""
+    records = []
+
+    class RecordHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    def gpi_debug_logged():
+        # the GPI logs a debug message for every lookup
+        records.clear()
+        dut._handle.get_handle_by_name("stream_in_data")
+        return any("stream_in_data" in r.getMessage() for r in records)
+
+    root_log = logging.getLogger()
+    gpi_log = logging.getLogger("gpi")
+    root_level_prev = root_log.level
+    gpi_level_prev = gpi_log.level
+    hdlr = RecordHandler()
+    gpi_log.addHandler(hdlr)
+    try:
+        gpi_log.setLevel(logging.NOTSET)
+        root_log.setLevel(logging.INFO)
+        assert not gpi_debug_logged()
+
+        root_log.setLevel(logging.DEBUG)
+        assert gpi_debug_logged()
+
+        logging.disable(logging.DEBUG)
+        assert not gpi_debug_logged()
+
+        logging.disable(logging.NOTSET)
+        assert gpi_debug_logged()
+
+        gpi_log.level = logging.INFO
+        assert not gpi_debug_logged()
+
+        root_log.level = logging.INFO
+        gpi_log.level = logging.NOTSET
+        assert not gpi_debug_logged()
+
+        root_log.level = logging.DEBUG
+        assert gpi_debug_logged()
+    finally:
+        logging.disable(logging.NOTSET)
+        gpi_log.removeHandler(hdlr)
+        root_log.setLevel(root_level_prev)
+        gpi_log.setLevel(gpi_level_prev)
+
+
 @cocotb.test()
 async def test_custom_logging_levels(dut):
     logging.basicConfig(level=logging.NOTSET)
@@ -88,3 +142,55 @@ async def test_custom_logging_levels(dut):
     logger = logging.getLogger("name")
     logger.setLevel(5)
     logger.log(5, "SUPER DEBUG MESSAGE!")
+
+
+@cocotb.test()
+async def test_fast_logging_handler(dut):
+    stream = io.StringIO()
+    hdlr = cocotb.logging._BufferedStreamHandler(stream)
+    hdlr.addFilter(cocotb.logging._CachedSimTimeContextFilter())
+    hdlr.setFormatter(cocotb.logging.SimLogFormatter())
+    logger = logging.getLogger("cocotb.test_fast_logging_handler")
+    logger.addHandler(hdlr)
+    logger.propagate = False
+    try:
+        logger.info("first")
+        await Timer(10, "ns")
+        logger.info("second")
+        # held back until flushed
+        assert stream.getvalue() == ""
+        logger.error("third")
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 3
+        # the simulator time is queried again after each wakeup
+        assert lines[0].split()[0] != lines[1].split()[0]
+        assert lines[1].split()[0] == lines[2].split()[0]
+    finally:
+        logger.removeHandler(hdlr)
+        logger.propagate = True
+
+
+@cocotb.test
+async def test_log_from_c_sim_time(dut):
+    records = []
+
+    class RecordHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    hdlr = RecordHandler()
+    hdlr.addFilter(cocotb.logging._CachedSimTimeContextFilter())
+    logger = logging.getLogger("cocotb.test_log_from_c_sim_time")
+    logger.addHandler(hdlr)
+    logger.propagate = False
+    try:
+        # a time cached before the simulator time moved on
+        cocotb.logging._sim_time_cache = -1
+        cocotb.logging._log_from_c(
+            logger.name, logging.INFO, __file__, 1, "from C", "test"
+        )
+        assert len(records) == 1
+        assert records[0].created_sim_time == get_sim_time()
+    finally:
+        logger.removeHandler(hdlr)
+        logger.propagate = True
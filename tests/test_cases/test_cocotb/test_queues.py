@@ -262,3 +262,47 @@ async def test_str_and_repr(_):
     s = repr(q)
     assert "_getters" not in s
     assert str(q)[:-1] in s
+
+
+@cocotb.test
+@cocotb.parametrize(queue_type=[Queue, PriorityQueue, LifoQueue])
+async def test_queue_batch(_, queue_type):
+    q = queue_type(maxsize=4)
+
+    # more items than fit in the queue
+    putter = cocotb.start_soon(q.put_many(range(10)))
+    items = await q.get_many(6)
+    assert len(items) == 6
+    await putter
+    items += q.drain()
+
+    assert sorted(items) == list(range(10))
+    if queue_type is Queue:
+        assert items == list(range(10))
+    assert q.empty()
+    assert q.drain() == []
+
+
+@cocotb.test
+async def test_queue_drain_wakes_putters(_):
+    q = Queue[int](maxsize=2)
+    q.put_nowait(0)
+    q.put_nowait(1)
+    putters = [cocotb.start_soon(q.put(k)) for k in range(2, 4)]
+    await NullTrigger()
+
+    assert q.drain() == [0, 1]
+    await Combine(*putters)
+    assert q.drain() == [2, 3]
+
+
+@cocotb.test
+async def test_queue_killed_waiter(_):
+    q = Queue[int]()
+
+    # blocked getter is killed, the item goes to the next getter
+    getter = await cocotb.start(q.get())
+    getter.kill()
+    getter2 = await cocotb.start(q.get())
+    q.put_nowait(5)
+    assert await getter2 == 5
@@ -21,6 +21,7 @@ from common import MyException
 import cocotb
 import cocotb.utils
 from cocotb.clock import Clock
+from cocotb.handle import SignalGroup
 from cocotb.task import Task
 from cocotb.triggers import (
     Combine,
@@ -329,6 +330,24 @@ async def test_last_scheduled_write_wins_array(dut):
     assert dut.array_7_downto_4.value == [10, 2, 3, 4]
 
 
+@cocotb.test
+async def test_scheduled_writes_applied_in_order(dut) -> None:
+    """Test that writes of each kind are applied in the order they were last scheduled."""
+    group = SignalGroup(dut.stream_in_valid, dut.stream_in_data)
+    dut.stream_in_data.value = 1
+    dut.stream_in_data_wide.value = 0x1234_5678_9ABC_DEF0
+    dut.stream_in_valid.value = 0
+    group.value = 0x1FF
+    dut.stream_in_data.value = 5
+
+    # nothing awaits ReadWrite, the writes are applied regardless
+    await Timer(1, "ns")
+
+    assert dut.stream_in_valid.value == 1
+    assert dut.stream_in_data.value == 5
+    assert dut.stream_in_data_wide.value == 0x1234_5678_9ABC_DEF0
+
+
 @cocotb.test
 async def test_task_repr(_) -> None:
     """Test Task.__repr__."""
@@ -0,0 +1,47 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Tests for cocotb.trace
+"""
+
+import pytest
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.trace import TraceRecorder, read_trace
+from cocotb.triggers import ClockCycles, Timer
+from cocotb.utils import get_sim_time
+
+
+@cocotb.test
+async def test_trace_recorder(dut):
+    dut.stream_in_data.value = 0
+    await Timer(1, "ns")
+
+    start_time = get_sim_time("ns")
+    # small chunks so the writer thread gets several of them
+    with TraceRecorder("test_trace.trace", [dut.clk, dut.stream_in_data], chunk_size=4):
+        cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+        for i in range(1, 6):
+            await Timer(10, "ns")
+            dut.stream_in_data.value = i
+        await Timer(1, "ns")
+    await ClockCycles(dut.clk, 4)
+
+    records = list(read_trace("test_trace.trace", units="ns"))
+    data = [(t, v) for t, name, v in records if name.endswith("stream_in_data")]
+    assert [int(v, 2) for _, v in data] == [0, 1, 2, 3, 4, 5]
+    assert data[0][0] == start_time
+    assert [t - start_time for t, _ in data[1:]] == [10, 20, 30, 40, 50]
+
+    clk = [(t, v) for t, name, v in records if name.endswith("clk")]
+    # no value changes are recorded after the recorder is stopped
+    assert all(t <= start_time + 51 for t, _ in clk)
+    assert len(clk) > 5
+
+
+@cocotb.test
+async def test_trace_recorder_unsupported(dut):
+    with pytest.raises(TypeError):
+        TraceRecorder("test_trace.trace", [dut])
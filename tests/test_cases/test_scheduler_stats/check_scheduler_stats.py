@@ -0,0 +1,27 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import json
+import sys
+
+with open(sys.argv[1]) as f:
+    stats = json.load(f)
+
+assert stats["trigger_fires"]["RisingEdge"] >= 5
+assert stats["trigger_fires"]["_Event"] >= 1
+assert stats["trigger_fires"]["_EdgeCount"] == 1
+assert stats["trigger_fires"]["Timer"] >= 1
+
+(test_stats,) = (v for k, v in stats["tasks"].items() if k.startswith("Test;"))
+assert test_stats["resumes"] >= 5
+assert test_stats["time_ns"] > 0
+assert stats["tasks"]["Task;wait_edges"]["resumes"] == 6
+
+gpi_callbacks = stats["gpi_callbacks"]
+assert gpi_callbacks["unprimed"]["RisingEdge"] >= 1
+assert gpi_callbacks["primed"]["_EdgeCount"] == 1
+assert gpi_callbacks["total_primed"] > gpi_callbacks["total_unprimed"]
+
+with open(sys.argv[1] + ".folded") as f:
+    assert "cocotb;Task;wait_edges " in f.read()
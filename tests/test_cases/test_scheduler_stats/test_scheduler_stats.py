@@ -0,0 +1,32 @@
+# Copyright cocotb contributors
+# Licensed under the Revised BSD License, see LICENSE for details.
+# SPDX-License-Identifier: BSD-3-Clause
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import ClockCycles, Event, FallingEdge, RisingEdge, Timer
+
+
+async def wait_valid(dut):
+    await RisingEdge(dut.stream_in_valid)
+
+
+async def wait_edges(dut, event):
+    for _ in range(5):
+        await RisingEdge(dut.clk)
+    event.set()
+
+
+@cocotb.test()
+async def test_scheduler_stats(dut):
+    """Exercise a few triggers for check_scheduler_stats.py to find in the report"""
+    cocotb.start_soon(Clock(dut.clk, 10, "ns").start())
+    event = Event()
+    cocotb.start_soon(wait_edges(dut, event))
+    await event.wait()
+    await ClockCycles(dut.clk, 10)
+    await FallingEdge(dut.clk)
+    # primed and unprimed before firing
+    task = cocotb.start_soon(wait_valid(dut))
+    await Timer(1, "ns")
+    task.kill()